@@ -1,9 +1,12 @@
 # 외부 모듈 import
-from services.hashing_service import verify_password
+from services.hashing_service import verify_password_async
 from models.users_model import get_user_by_email
+from services.log_service import get_logger
+
+logger = get_logger("auth.login")
 
 # 로그인 처리 함수
-def login_user(data: dict, db):
+async def login_user(data: dict, db):
     """
     로그인 로직:
     1. 이메일로 사용자 조회
@@ -12,19 +15,16 @@ def login_user(data: dict, db):
     4. DB role 컬럼 기반 관리자 판별
     """
 
-    print("\n🟦 [LOGIN_USER] 로그인 시도:", data)   # 디버깅 로그
-
     # 1. 이메일 기준 유저 조회
-    user = get_user_by_email(db, data["email"])
-    print("🟩 [LOGIN_USER] 조회된 유저:", user)  # 디버깅
+    user = await get_user_by_email(db, data["email"])
 
     if not user:
-        print("❌ [LOGIN_USER] 존재하지 않는 이메일")
+        logger.info("login_failed", extra={"fields": {"email": data["email"], "reason": "unknown_email"}})
         return {"error": "등록되지 않은 이메일입니다."}
 
     # 2. 비밀번호 검증
-    if not verify_password(data["password"], user["password_hash"]):
-        print("❌ [LOGIN_USER] 비밀번호 불일치")
+    if not await verify_password_async(data["password"], user["password_hash"]):
+        logger.info("login_failed", extra={"fields": {"user_id": user["id"], "reason": "bad_password"}})
         return {"error": "비밀번호가 올바르지 않습니다."}
 
     # ---------------------------------------------
@@ -32,15 +32,13 @@ def login_user(data: dict, db):
     # ---------------------------------------------
     if user["email"] == "admin@test.com":
         role_value = True
-        print("🟨 [LOGIN_USER] SUPER ADMIN 로그인 (admin@test.com이므로 role=True)")  
     else:
         # DB role 값(True/False)을 그대로 사용
         role_value = bool(user["role"])
-        print("🟦 [LOGIN_USER] 일반 사용자 role 값:", role_value)
     # ---------------------------------------------
 
     # 4. 로그인 성공
-    print("🟩 [LOGIN_USER] 로그인 성공, 최종 role:", role_value)
+    logger.info("login_success", extra={"fields": {"user_id": user["id"], "role": role_value}})
 
     return {
         "id": user["id"],
@@ -1,30 +1,159 @@
 # db/database.py
 
+from contextlib import asynccontextmanager
+
 from config.settings import settings
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, text
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from services.log_service import get_logger
+from db.instrumentation import instrument_engine
+
+logger = get_logger("db")
 
 # ---------------------------------
-# PostgreSQL DB URL 확인용 (선택)
+# PostgreSQL DB URL 확인용 (비밀번호 제외)
 # ---------------------------------
-print("🚀 DATABASE_URL =", settings.DATABASE_URL)
+logger.info("database_configured", extra={"fields": {
+    "url": make_url(settings.DATABASE_URL).render_as_string(hide_password=True)
+}})
 
 # ---------------------------------
-# SQLAlchemy Engine 생성
+# SQLAlchemy Engine 생성 (동기)
 # ---------------------------------
 # future=True → SQLAlchemy 2.x 스타일
+# 라우터에서는 사용하지 않고, 스크립트/관리 작업용으로만 남겨둔다.
 engine = create_engine(
     settings.DATABASE_URL,
-    echo=True,        # SQL 출력 (디버깅 쉽게)
+    echo=settings.SQL_ECHO,   # SQL 출력은 로컬 디버깅 시에만 (.env 에서 SQL_ECHO=true)
     future=True
 )
 
+# ---------------------------------
+# SQLAlchemy AsyncEngine 생성 (asyncpg)
+# ---------------------------------
+# postgresql:// → postgresql+asyncpg:// 로 드라이버만 교체
+# async 라우터에서 쿼리가 이벤트 루프를 막지 않도록 한다.
+ASYNC_DATABASE_URL = make_url(settings.DATABASE_URL).set(drivername="postgresql+asyncpg")
+
+async_engine = create_async_engine(
+    ASYNC_DATABASE_URL,
+    echo=settings.SQL_ECHO,
+    pool_size=settings.DB_POOL_SIZE,
+    max_overflow=settings.DB_MAX_OVERFLOW,
+    pool_pre_ping=True,
+)
+
+# ---------------------------------
+# SQL 계측 (요청별 횟수/시간, slow query, N+1)
+# ---------------------------------
+instrument_engine(engine)
+instrument_engine(async_engine.sync_engine)
+
 # ---------------------------------
 # FastAPI 의존성 주입(DB 연결 제공)
 # ---------------------------------
-def get_db():
+async def get_db():
     """
     FastAPI 라우터에서 DB 연결을 주입할 때 사용.
-    RAW SQL 방식이므로 Connection 객체를 반환한다.
+    RAW SQL 방식이므로 AsyncConnection 객체를 반환한다.
+    (모든 쿼리는 await db.execute(...) 로 실행)
     """
-    with engine.connect() as conn:
+    async with async_engine.connect() as conn:
         yield conn
+
+
+# ---------------------------------
+# Unit of Work (요청 단위 트랜잭션)
+# ---------------------------------
+# 모델 함수는 더 이상 직접 commit 하지 않는다.
+# 라우터/컨트롤러가 unit_of_work 로 감싸면 그 안의 모든 쓰기가
+# 하나의 트랜잭션 → commit 1회 (fsync 1회) 로 반영된다.
+_AFTER_COMMIT = "after_commit_callbacks"
+
+
+@asynccontextmanager
+async def unit_of_work(db):
+    """
+    사용 예:
+        async with unit_of_work(db):
+            await update_basic_user(db, uid, fields)
+            await upsert_profile(db, uid, info, body)
+    - 정상 종료 시 commit 1회 후 after_commit 콜백 실행 (캐시 무효화 등)
+    - 예외 발생 시 rollback
+    - 중첩 호출 시 가장 바깥 unit_of_work 만 commit 한다
+      (컨트롤러가 자체적으로 감싸도 라우터 트랜잭션에 합류)
+    """
+    if _AFTER_COMMIT in db.info:
+        yield db
+        return
+
+    db.info[_AFTER_COMMIT] = []
+    try:
+        yield db
+        await db.commit()
+    except BaseException:
+        db.info.pop(_AFTER_COMMIT, None)
+        await db.rollback()
+        raise
+
+    for func, args in db.info.pop(_AFTER_COMMIT):
+        func(*args)
+
+
+def after_commit(db, func, *args):
+    """
+    현재 unit_of_work 가 commit 된 뒤 실행할 콜백 등록
+    - commit 전에 캐시를 지우면 다른 요청이 옛 값을 다시 채울 수 있으므로
+      캐시 무효화는 반드시 이 함수로 등록한다.
+    - unit_of_work 밖에서 호출되면 즉시 실행
+    """
+    callbacks = db.info.get(_AFTER_COMMIT)
+    if callbacks is None:
+        func(*args)
+    else:
+        callbacks.append((func, args))
+
+
+# ---------------------------------
+# 프로세스 간 단일 실행 (PostgreSQL advisory lock)
+# ---------------------------------
+# uvicorn / gunicorn 워커가 여러 개일 때 배치 작업을 한 프로세스만 실행하도록
+# 세션 수준 advisory lock 을 잡은 연결을 들고 있는다 (연결이 끊기면 락도 자동 해제).
+async def try_advisory_lock(key: int):
+    """
+    락을 잡으면 그 연결을 반환 (release_advisory_lock 으로 해제), 다른 프로세스가 잡고 있으면 None
+    """
+    conn = await async_engine.connect()
+    try:
+        locked = (await conn.execute(
+            text("SELECT pg_try_advisory_lock(:key)"), {"key": key}
+        )).scalar_one()
+        await conn.commit()   # 세션 락은 commit 후에도 유지 (idle in transaction 방지)
+    except BaseException:
+        await conn.close()
+        raise
+
+    if not locked:
+        await conn.close()
+        return None
+    return conn
+
+
+async def advisory_lock_alive(conn):
+    """락을 잡은 연결이 아직 살아 있는지 (끊겼으면 락도 풀린 상태)"""
+    try:
+        await conn.execute(text("SELECT 1"))
+        await conn.commit()
+        return True
+    except Exception:
+        return False
+
+
+async def release_advisory_lock(conn, key: int):
+    try:
+        await conn.execute(text("SELECT pg_advisory_unlock(:key)"), {"key": key})
+        await conn.commit()
+    finally:
+        await conn.close()
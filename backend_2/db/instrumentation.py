@@ -0,0 +1,128 @@
+# db/instrumentation.py
+# ============================================
+# ⏱ 요청 단위 SQL 계측
+# ============================================
+# echo=True 대신 SQLAlchemy before/after_cursor_execute 이벤트로
+# - 요청별 SQL 실행 횟수 / 누적 DB 시간 → Server-Timing 응답 헤더
+# - 임계값(SLOW_QUERY_MS) 초과 쿼리 → slow query 로그
+# - 한 요청 안에서 같은 SQL 이 반복 실행 → N+1 경고 로그
+
+import time
+from collections import Counter
+from contextvars import ContextVar
+
+from sqlalchemy import event
+
+from config.settings import settings
+from services.log_service import get_logger
+
+logger = get_logger("db.sql")
+
+# 현재 요청의 SQL 통계 (요청 밖이면 None)
+_request_stats = ContextVar("request_sql_stats", default=None)
+
+
+# -----------------------------
+# 요청별 SQL 통계
+# -----------------------------
+class RequestSQLStats:
+    """한 요청 동안 실행된 SQL 횟수 / 누적 시간 / 문장별 실행 횟수"""
+
+    def __init__(self):
+        self.count = 0
+        self.total_ms = 0.0
+        self.statements = Counter()
+
+    def repeated(self):
+        """N+1 의심 문장 목록 [(문장, 횟수)]"""
+        return [
+            (stmt, n) for stmt, n in self.statements.items()
+            if n >= settings.N_PLUS_ONE_THRESHOLD
+        ]
+
+
+def current_stats():
+    """현재 요청의 RequestSQLStats (요청 밖이면 None)"""
+    return _request_stats.get()
+
+
+# -----------------------------
+# SQLAlchemy 이벤트 핸들러
+# -----------------------------
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    conn.info.setdefault("query_start", []).append(time.perf_counter())
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    elapsed_ms = (time.perf_counter() - conn.info["query_start"].pop()) * 1000
+
+    stats = _request_stats.get()
+    if stats is not None:
+        stats.count += 1
+        stats.total_ms += elapsed_ms
+        stats.statements[statement] += 1
+
+    if elapsed_ms >= settings.SLOW_QUERY_MS:
+        logger.warning("slow_query", extra={"fields": {
+            "duration_ms": round(elapsed_ms, 2),
+            "statement": " ".join(statement.split()),
+        }})
+
+
+def _handle_error(exception_context):
+    # 실패한 쿼리는 after_cursor_execute 가 호출되지 않으므로 시작 시각만 정리
+    conn = exception_context.connection
+    if conn is not None and conn.info.get("query_start"):
+        conn.info["query_start"].pop()
+
+
+def instrument_engine(sync_engine):
+    """
+    엔진에 계측 이벤트 등록
+    - AsyncEngine 은 async_engine.sync_engine 을 넘긴다
+    """
+    event.listen(sync_engine, "before_cursor_execute", _before_cursor_execute)
+    event.listen(sync_engine, "after_cursor_execute", _after_cursor_execute)
+    event.listen(sync_engine, "handle_error", _handle_error)
+
+
+# -----------------------------
+# ASGI 미들웨어
+# -----------------------------
+class SQLTimingMiddleware:
+    """
+    HTTP 요청마다 RequestSQLStats 를 만들고,
+    응답 시작 시 Server-Timing 헤더로 SQL 횟수 / 누적 시간을 붙인다.
+    예: Server-Timing: db;dur=12.41;desc="4 queries"
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        stats = RequestSQLStats()
+        token = _request_stats.set(stats)
+
+        async def send_with_timing(message):
+            if message["type"] == "http.response.start":
+                timing = f'db;dur={stats.total_ms:.2f};desc="{stats.count} queries"'
+                headers = list(message.get("headers", []))
+                headers.append((b"server-timing", timing.encode("latin-1")))
+                message = {**message, "headers": headers}
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_timing)
+        finally:
+            _request_stats.reset(token)
+
+            for statement, n in stats.repeated():
+                logger.warning("n_plus_one", extra={"fields": {
+                    "path": scope.get("path"),
+                    "repeat": n,
+                    "statement": " ".join(statement.split()),
+                }})
@@ -0,0 +1,10 @@
+-- ============================================================
+-- 관리자 사용자 목록 키셋 페이지네이션용 인덱스
+-- GET /admin/users : ORDER BY created_at DESC, id DESC
+--                    WHERE (created_at, id) < (:cursor_created_at, :cursor_id)
+-- ============================================================
+CREATE INDEX CONCURRENTLY IF NOT EXISTS users_created_at_id_idx
+    ON public.users (created_at DESC, id DESC);
+
+-- total_estimate 는 플래너 통계(EXPLAIN) 를 사용하므로 통계를 최신으로 유지
+ANALYZE public.users;
@@ -0,0 +1,23 @@
+-- ============================================================
+-- 관리자 로그 키셋 페이지네이션 / 필터용 인덱스
+-- GET /admin/logs : ORDER BY timestamp DESC, id DESC
+--                   WHERE (timestamp, id) < (:cursor_ts, :cursor_id)
+-- 목록 컬럼을 INCLUDE 해서 첫 페이지가 index-only scan 이 되도록 한다.
+-- (INCLUDE 는 PostgreSQL 11+)
+-- ============================================================
+CREATE INDEX CONCURRENTLY IF NOT EXISTS admin_logs_timestamp_id_idx
+    ON public.admin_logs (timestamp DESC, id DESC)
+    INCLUDE (admin_email, action, target_user_id, target_user_email);
+
+-- 필터별 인덱스 (필터 = 선두 컬럼, 이후 정렬 키)
+CREATE INDEX CONCURRENTLY IF NOT EXISTS admin_logs_admin_email_timestamp_idx
+    ON public.admin_logs (admin_email, timestamp DESC, id DESC);
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS admin_logs_action_timestamp_idx
+    ON public.admin_logs (action, timestamp DESC, id DESC);
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS admin_logs_target_user_timestamp_idx
+    ON public.admin_logs (target_user_id, timestamp DESC, id DESC);
+
+-- index-only scan 은 visibility map 이 최신이어야 하므로 적용 직후 VACUUM
+VACUUM (ANALYZE) public.admin_logs;
@@ -0,0 +1,23 @@
+-- ============================================================
+-- HealthKit 증분 동기화 (중복 제거 + 동기화 앵커)
+-- POST /ios/upload/batch : INSERT ... ON CONFLICT (user_id, source, sample_hash) DO NOTHING
+-- GET  /ios/sync/anchor  : 사용자 / source 별 마지막 수신 시각
+-- ============================================================
+
+-- 샘플 자연 키: 측정 시각 + 값 전체의 SHA-256
+-- (기존 행은 NULL → UNIQUE 인덱스에서 서로 충돌하지 않음)
+ALTER TABLE public.wearable_data
+    ADD COLUMN IF NOT EXISTS sample_hash TEXT;
+
+CREATE UNIQUE INDEX CONCURRENTLY IF NOT EXISTS wearable_data_natural_key_idx
+    ON public.wearable_data (user_id, source, sample_hash);
+
+-- 사용자 / source 별 동기화 앵커
+CREATE TABLE IF NOT EXISTS public.wearable_sync_anchors (
+    user_id UUID NOT NULL REFERENCES public.users(id) ON DELETE CASCADE,
+    source VARCHAR(50) NOT NULL,
+    last_recorded_at TIMESTAMP NOT NULL,
+    last_sample_hash TEXT,
+    updated_at TIMESTAMP DEFAULT NOW(),
+    PRIMARY KEY (user_id, source)
+);
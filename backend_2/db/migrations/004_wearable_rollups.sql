@@ -0,0 +1,46 @@
+-- ============================================================
+-- 웨어러블 지표 일별 / 주별 집계 (rollup)
+-- 배치 저장 시 새로 들어온 샘플이 속한 버킷만 누적 갱신한다
+-- (models/wearable_model.insert_wearable_rows).
+-- GET /ios/trends 는 원본 wearable_data 대신 이 테이블만 읽는다.
+-- ============================================================
+CREATE TABLE IF NOT EXISTS public.wearable_rollups (
+    user_id UUID NOT NULL REFERENCES public.users(id) ON DELETE CASCADE,
+    metric VARCHAR(50) NOT NULL,          -- HealthData 필드 이름 (steps, heartRate, ...)
+    granularity VARCHAR(10) NOT NULL,     -- 'day' / 'week' (주는 월요일 시작, WEARABLE_TIMEZONE 기준)
+    bucket_start DATE NOT NULL,
+    sum_value DOUBLE PRECISION NOT NULL,
+    min_value DOUBLE PRECISION NOT NULL,
+    max_value DOUBLE PRECISION NOT NULL,
+    sample_count BIGINT NOT NULL,
+    updated_at TIMESTAMP DEFAULT NOW(),
+    PRIMARY KEY (user_id, metric, granularity, bucket_start)
+);
+
+-- 기존 wearable_data 로 한 번 채우기
+-- 버킷 날짜 / 0 처리 규칙은 models/wearable_model.INSERT_WITH_ROLLUP_SQL 과 같게 유지:
+-- - 날짜는 Asia/Seoul (settings.WEARABLE_TIMEZONE) 기준
+-- - 값이 없는 지표는 제외, 0 은 NONZERO_METRICS (활력 징후 / 신체 계측) 만 미측정으로 보고 제외
+INSERT INTO public.wearable_rollups
+    (user_id, metric, granularity, bucket_start, sum_value, min_value, max_value, sample_count)
+SELECT user_id, metric, granularity, bucket_start, SUM(value), MIN(value), MAX(value), COUNT(*)
+FROM (
+    SELECT w.user_id, m.key AS metric, g.granularity,
+           CASE g.granularity
+               WHEN 'day' THEN (w.recorded_at AT TIME ZONE 'UTC' AT TIME ZONE 'Asia/Seoul')::date
+               ELSE date_trunc('week', w.recorded_at AT TIME ZONE 'UTC' AT TIME ZONE 'Asia/Seoul')::date
+           END AS bucket_start,
+           CASE WHEN jsonb_typeof(m.value) = 'number' THEN (m.value #>> '{}')::float8 END AS value
+    FROM public.wearable_data w
+    CROSS JOIN LATERAL jsonb_each(w.raw_json) AS m (key, value)
+    CROSS JOIN (VALUES ('day'), ('week')) AS g (granularity)
+    WHERE w.recorded_at IS NOT NULL
+) samples
+WHERE value IS NOT NULL
+  AND NOT (value = 0 AND metric IN (
+      'heartRate', 'restingHeartRate', 'walkingHeartRate', 'hrv',
+      'weight', 'height', 'bmi', 'leanBody',
+      'systolic', 'diastolic', 'glucose', 'oxygen'
+  ))
+GROUP BY user_id, metric, granularity, bucket_start
+ON CONFLICT DO NOTHING;
@@ -0,0 +1,22 @@
+-- ============================================================
+-- HealthKit 활력 징후 이상치 플래그 (야간 배치)
+-- services/anomaly_service.run_anomaly_detection 이 기록한다.
+-- (user_id, metric, recorded_at) UNIQUE → 같은 구간을 다시 돌려도 중복 없음
+-- ============================================================
+CREATE TABLE IF NOT EXISTS public.wearable_anomalies (
+    id UUID PRIMARY KEY DEFAULT gen_random_uuid(),
+    user_id UUID NOT NULL REFERENCES public.users(id) ON DELETE CASCADE,
+    metric VARCHAR(50) NOT NULL,
+    recorded_at TIMESTAMP NOT NULL,
+    value DOUBLE PRECISION NOT NULL,
+    baseline_median DOUBLE PRECISION,
+    baseline_mad DOUBLE PRECISION,
+    z_score DOUBLE PRECISION,
+    reason VARCHAR(20) NOT NULL,          -- 'robust_z' / 'out_of_range'
+    detected_at TIMESTAMP DEFAULT NOW(),
+    UNIQUE (user_id, metric, recorded_at)
+);
+
+-- 배치가 최근 구간(lookback)만 읽도록
+CREATE INDEX CONCURRENTLY IF NOT EXISTS wearable_data_recorded_at_idx
+    ON public.wearable_data (recorded_at);
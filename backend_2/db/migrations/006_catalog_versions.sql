@@ -0,0 +1,29 @@
+-- ============================================================
+-- 카탈로그 버전 (운동 목록 메모리 스냅샷 갱신용)
+-- exercise 테이블이 바뀌면 트리거가 catalog_versions.version 을 올리고,
+-- 각 서버 프로세스는 CATALOG_REFRESH_SECONDS 마다 버전만 확인해서 바뀌었을 때만 다시 읽는다.
+-- ============================================================
+
+CREATE TABLE IF NOT EXISTS public.catalog_versions (
+    name VARCHAR(50) PRIMARY KEY,
+    version BIGINT NOT NULL DEFAULT 1,
+    updated_at TIMESTAMP DEFAULT NOW()
+);
+
+INSERT INTO public.catalog_versions (name) VALUES ('exercise')
+ON CONFLICT (name) DO NOTHING;
+
+CREATE OR REPLACE FUNCTION public.bump_exercise_catalog_version() RETURNS trigger AS $$
+BEGIN
+    UPDATE public.catalog_versions
+    SET version = version + 1, updated_at = NOW()
+    WHERE name = 'exercise';
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+-- 문장 단위 트리거 (여러 행을 한 번에 바꿔도 버전은 1 증가)
+DROP TRIGGER IF EXISTS exercise_catalog_version ON public.exercise;
+CREATE TRIGGER exercise_catalog_version
+    AFTER INSERT OR UPDATE OR DELETE OR TRUNCATE ON public.exercise
+    FOR EACH STATEMENT EXECUTE PROCEDURE public.bump_exercise_catalog_version();
@@ -0,0 +1,14 @@
+-- ============================================================
+-- user_info.user_id UNIQUE (upsert_profile / upsert_record 의 전제 조건)
+-- INSERT ... ON CONFLICT (user_id) 는 user_id 에 UNIQUE 인덱스(또는 제약)가 있어야 동작한다.
+-- user_body_info 는 user_id 가 PRIMARY KEY 라서 추가 작업 없음.
+-- ============================================================
+
+-- 예전 SELECT → INSERT 경쟁으로 생긴 중복 행 정리 (사용자별로 마지막에 기록된 행만 남김)
+DELETE FROM public.user_info a
+USING public.user_info b
+WHERE a.user_id = b.user_id
+  AND a.ctid < b.ctid;
+
+CREATE UNIQUE INDEX CONCURRENTLY IF NOT EXISTS user_info_user_id_key
+    ON public.user_info (user_id);
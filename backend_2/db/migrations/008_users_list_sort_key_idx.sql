@@ -0,0 +1,9 @@
+-- ============================================================
+-- 관리자 사용자 목록 정렬 키 변경 (created_at NULL 행 처리)
+-- GET /admin/users : ORDER BY COALESCE(created_at, '-infinity') DESC, id DESC
+-- 001 의 (created_at DESC, id DESC) 인덱스는 이 식과 일치하지 않으므로 식 인덱스로 교체
+-- ============================================================
+CREATE INDEX CONCURRENTLY IF NOT EXISTS users_list_sort_key_idx
+    ON public.users ((COALESCE(created_at, '-infinity'::timestamp)) DESC, id DESC);
+
+DROP INDEX CONCURRENTLY IF EXISTS public.users_created_at_id_idx;
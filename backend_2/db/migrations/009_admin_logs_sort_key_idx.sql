@@ -0,0 +1,25 @@
+-- ============================================================
+-- 관리자 로그 정렬 키 변경 (timestamp NULL 행 처리)
+-- GET /admin/logs : ORDER BY COALESCE(timestamp, '-infinity') DESC, id DESC
+-- 002 의 (timestamp DESC, id DESC) 인덱스들은 이 식과 일치하지 않으므로 식 인덱스로 교체
+-- ============================================================
+CREATE INDEX CONCURRENTLY IF NOT EXISTS admin_logs_sort_key_idx
+    ON public.admin_logs ((COALESCE(timestamp, '-infinity'::timestamp)) DESC, id DESC)
+    INCLUDE (admin_email, action, target_user_id, target_user_email, timestamp);
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS admin_logs_admin_email_sort_key_idx
+    ON public.admin_logs (admin_email, (COALESCE(timestamp, '-infinity'::timestamp)) DESC, id DESC);
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS admin_logs_action_sort_key_idx
+    ON public.admin_logs (action, (COALESCE(timestamp, '-infinity'::timestamp)) DESC, id DESC);
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS admin_logs_target_user_sort_key_idx
+    ON public.admin_logs (target_user_id, (COALESCE(timestamp, '-infinity'::timestamp)) DESC, id DESC);
+
+DROP INDEX CONCURRENTLY IF EXISTS public.admin_logs_timestamp_id_idx;
+DROP INDEX CONCURRENTLY IF EXISTS public.admin_logs_admin_email_timestamp_idx;
+DROP INDEX CONCURRENTLY IF EXISTS public.admin_logs_action_timestamp_idx;
+DROP INDEX CONCURRENTLY IF EXISTS public.admin_logs_target_user_timestamp_idx;
+
+-- index-only scan 은 visibility map 이 최신이어야 하므로 적용 직후 VACUUM
+VACUUM (ANALYZE) public.admin_logs;
@@ -0,0 +1,31 @@
+-- ============================================================
+-- 영상 분석 작업 큐 (services/analysis_service)
+-- 작업 상태를 DB 에 두어 어느 워커 프로세스에서든 조회 / 처리할 수 있고
+-- 서버가 재시작되어도 대기 중 작업이 사라지지 않는다.
+-- 워커는 FOR UPDATE SKIP LOCKED 로 queued 작업을 하나씩 가져간다.
+-- running 인데 updated_at 이 오래된 작업(워커 종료 등)은 다시 가져갈 수 있다.
+-- ============================================================
+CREATE TABLE IF NOT EXISTS public.analysis_jobs (
+    id UUID PRIMARY KEY DEFAULT gen_random_uuid(),
+    user_id UUID NOT NULL REFERENCES public.users(id) ON DELETE CASCADE,
+    video_id VARCHAR(32) NOT NULL,
+    exercise_id UUID NOT NULL,
+    activity_id UUID,
+    status VARCHAR(10) NOT NULL DEFAULT 'queued',   -- queued / running / done / failed
+    progress DOUBLE PRECISION NOT NULL DEFAULT 0,
+    attempts INT NOT NULL DEFAULT 0,
+    score DOUBLE PRECISION,
+    feedback TEXT,
+    frames INT NOT NULL DEFAULT 0,
+    sets INT NOT NULL DEFAULT 0,
+    error TEXT,
+    created_at TIMESTAMP NOT NULL DEFAULT NOW(),
+    started_at TIMESTAMP,
+    finished_at TIMESTAMP,
+    updated_at TIMESTAMP NOT NULL DEFAULT NOW()
+);
+
+-- 워커가 가져갈 작업 찾기 (queued / running 만 → 완료 작업이 쌓여도 인덱스는 작게 유지)
+CREATE INDEX CONCURRENTLY IF NOT EXISTS analysis_jobs_pending_idx
+    ON public.analysis_jobs (created_at)
+    WHERE status IN ('queued', 'running');
@@ -0,0 +1,39 @@
+-- ============================================================
+-- 웨어러블 집계 다시 만들기 (004 를 이미 적용한 DB 용)
+-- 004 의 예전 backfill 은 UTC 날짜로 버킷을 나누고 0 을 모두 제외했다.
+-- 실시간 저장 경로(models/wearable_model.INSERT_WITH_ROLLUP_SQL)와 같은 규칙으로 전체를 다시 계산:
+-- - 날짜는 Asia/Seoul (settings.WEARABLE_TIMEZONE) 기준
+-- - 값이 없는 지표는 제외, 0 은 NONZERO_METRICS (활력 징후 / 신체 계측) 만 미측정으로 보고 제외
+-- 배치 업로드와 동시에 돌지 않도록 한 트랜잭션 + 테이블 잠금으로 실행한다.
+-- ============================================================
+BEGIN;
+
+LOCK TABLE public.wearable_rollups IN EXCLUSIVE MODE;
+LOCK TABLE public.wearable_data IN SHARE MODE;
+
+DELETE FROM public.wearable_rollups;
+
+INSERT INTO public.wearable_rollups
+    (user_id, metric, granularity, bucket_start, sum_value, min_value, max_value, sample_count)
+SELECT user_id, metric, granularity, bucket_start, SUM(value), MIN(value), MAX(value), COUNT(*)
+FROM (
+    SELECT w.user_id, m.key AS metric, g.granularity,
+           CASE g.granularity
+               WHEN 'day' THEN (w.recorded_at AT TIME ZONE 'UTC' AT TIME ZONE 'Asia/Seoul')::date
+               ELSE date_trunc('week', w.recorded_at AT TIME ZONE 'UTC' AT TIME ZONE 'Asia/Seoul')::date
+           END AS bucket_start,
+           CASE WHEN jsonb_typeof(m.value) = 'number' THEN (m.value #>> '{}')::float8 END AS value
+    FROM public.wearable_data w
+    CROSS JOIN LATERAL jsonb_each(w.raw_json) AS m (key, value)
+    CROSS JOIN (VALUES ('day'), ('week')) AS g (granularity)
+    WHERE w.recorded_at IS NOT NULL
+) samples
+WHERE value IS NOT NULL
+  AND NOT (value = 0 AND metric IN (
+      'heartRate', 'restingHeartRate', 'walkingHeartRate', 'hrv',
+      'weight', 'height', 'bmi', 'leanBody',
+      'systolic', 'diastolic', 'glucose', 'oxygen'
+  ))
+GROUP BY user_id, metric, granularity, bucket_start;
+
+COMMIT;
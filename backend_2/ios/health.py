@@ -1,8 +1,28 @@
-from fastapi import APIRouter, Depends
-from sqlalchemy.orm import Session
+from datetime import date, datetime, timedelta
+from zoneinfo import ZoneInfo
+from typing import Optional
 
-from db.database import get_db
-from ios.schemas import HealthData
+from fastapi import APIRouter, Depends, HTTPException, Query
+from sqlalchemy.ext.asyncio import AsyncConnection
+
+from config.settings import settings
+from db.database import get_db, unit_of_work
+from ios.schemas import HealthData, HealthBatch
+from models.wearable_model import (
+    map_health_sample,
+    insert_wearable_rows,
+    get_sync_anchor,
+    advance_sync_anchor,
+    get_rollups,
+    get_anomalies,
+    ROLLUP_METRICS,
+    ROLLUP_GRANULARITIES,
+)
+from services.oauth2_service import get_current_user
+from services.log_service import get_logger
+from services.json_service import ORJSONResponse
+
+logger = get_logger("ios")
 
 router = APIRouter(
     prefix="/ios",
@@ -12,11 +32,129 @@ router = APIRouter(
 @router.post("/upload")
 def upload_health_data(
     data: HealthData,
-    db: Session = Depends(get_db)
+    db: AsyncConnection = Depends(get_db)
 ):
-    print("📥 받은 iOS 건강 데이터:", data.dict())
+    logger.debug("health_upload", extra={"fields": {"steps": data.steps, "heartRate": data.heartRate}})
 
     return {
         "message": "건강 데이터 수신 완료",
         "data": data.dict()
     }
+
+
+# ============================================
+# 📌 HealthKit 배치 업로드 (중복 제거 + 증분 동기화)
+#    POST /ios/upload/batch
+#    {"source": "apple_health", "samples": [{"recordedAt": "...", "steps": 120, ...}, ...]}
+#    - 이미 받은 샘플은 서버에서 버림 (겹치는 구간을 다시 보내도 안전)
+#    - 응답의 anchor.last_recorded_at 이후 샘플만 다음에 보내면 됨
+# ============================================
+@router.post("/upload/batch")
+async def upload_health_batch(
+    batch: HealthBatch,
+    db: AsyncConnection = Depends(get_db),
+    current_user=Depends(get_current_user)
+):
+    if len(batch.samples) > settings.HEALTH_BATCH_MAX:
+        raise HTTPException(
+            status_code=413,
+            detail=f"한 번에 최대 {settings.HEALTH_BATCH_MAX}개 샘플까지 업로드할 수 있습니다."
+        )
+
+    # 같은 배치 안의 중복은 미리 제거
+    rows = list({
+        row["sample_hash"]: row
+        for row in (map_health_sample(sample.dict()) for sample in batch.samples)
+    }.values())
+
+    # multi-row INSERT (ON CONFLICT DO NOTHING) + 앵커 갱신 → commit 1회
+    async with unit_of_work(db):
+        inserted = await insert_wearable_rows(
+            db, current_user["id"], batch.source, rows, settings.WEARABLE_TIMEZONE
+        )
+        anchor = await advance_sync_anchor(db, current_user["id"], batch.source, rows)
+
+    logger.info("health_batch", extra={"fields": {
+        "user_id": current_user["id"], "source": batch.source,
+        "received": len(batch.samples), "inserted": inserted
+    }})
+
+    # 받은 데이터를 그대로 돌려주지 않고 저장 건수 / 앵커만 응답
+    return {
+        "message": "건강 데이터 저장 완료",
+        "inserted": inserted,
+        "duplicates": len(batch.samples) - inserted,
+        "anchor": anchor,
+    }
+
+
+# ============================================
+# 📌 동기화 앵커 조회
+#    GET /ios/sync/anchor?source=apple_health
+#    앱 시작 / 재설치 후 어디서부터 보낼지 확인
+# ============================================
+@router.get("/sync/anchor")
+async def get_health_anchor(
+    source: str = Query("apple_health"),
+    db: AsyncConnection = Depends(get_db),
+    current_user=Depends(get_current_user)
+):
+    anchor = await get_sync_anchor(db, current_user["id"], source)
+    return {"anchor": anchor}
+
+
+
+# ============================================
+# 📌 일별 / 주별 추이
+#    GET /ios/trends?metric=steps&granularity=day&since=2025-01-01&until=2025-01-31
+#    원본 샘플을 스캔하지 않고 wearable_rollups 만 읽는다
+# ============================================
+# 기간을 지정하지 않았을 때 기본 조회 범위
+DEFAULT_TREND_DAYS = {"day": 30, "week": 7 * 12}
+
+
+@router.get("/trends")
+async def get_health_trends(
+    metric: str,
+    granularity: str = Query("day"),
+    since: Optional[date] = None,
+    until: Optional[date] = None,
+    db: AsyncConnection = Depends(get_db),
+    current_user=Depends(get_current_user)
+):
+    if metric not in ROLLUP_METRICS:
+        raise HTTPException(status_code=400, detail="지원하지 않는 metric 입니다.")
+    if granularity not in ROLLUP_GRANULARITIES:
+        raise HTTPException(status_code=400, detail="granularity 는 day 또는 week 만 가능합니다.")
+
+    until = until or datetime.now(ZoneInfo(settings.WEARABLE_TIMEZONE)).date()   # 버킷과 같은 시간대의 오늘
+    since = since or until - timedelta(days=DEFAULT_TREND_DAYS[granularity])
+
+    buckets = await get_rollups(db, current_user["id"], metric, granularity, since, until)
+    return ORJSONResponse({
+        "metric": metric,
+        "granularity": granularity,
+        "since": since,
+        "until": until,
+        "buckets": buckets,
+    })
+
+
+# ============================================
+# 📌 활력 징후 이상치 조회
+#    GET /ios/anomalies?since=2025-01-01
+#    야간 배치(anomaly_service)가 wearable_anomalies 에 저장한 결과
+# ============================================
+# 기간을 지정하지 않았을 때 기본 조회 범위 (일)
+DEFAULT_ANOMALY_DAYS = 7
+
+
+@router.get("/anomalies")
+async def get_health_anomalies(
+    since: Optional[date] = None,
+    db: AsyncConnection = Depends(get_db),
+    current_user=Depends(get_current_user)
+):
+    since = since or date.today() - timedelta(days=DEFAULT_ANOMALY_DAYS)
+    anomalies = await get_anomalies(db, current_user["id"], since)
+    return ORJSONResponse({"since": since, "anomalies": anomalies})
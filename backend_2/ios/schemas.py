@@ -1,5 +1,6 @@
+from datetime import datetime
 from pydantic import BaseModel
-from typing import Optional
+from typing import List, Optional
 
 class HealthData(BaseModel):
     steps: Optional[float] = 0
@@ -29,3 +30,46 @@ class HealthData(BaseModel):
 
     calories: Optional[float] = 0
     water: Optional[float] = 0
+
+
+# -----------------------------
+# 배치 업로드 (HealthKit 여러 시점 샘플)
+# -----------------------------
+# HealthData 는 빠진 지표를 0 으로 채우지만 (기존 /ios/upload 호환)
+# 배치 샘플은 보내지 않은 지표를 None 으로 둬서 wearable_data 에 NULL 로 저장한다.
+# (0 을 넣으면 심박만 보낸 샘플이 걸음 수 0 / 수면 0 으로 기록됨)
+class HealthSample(HealthData):
+    recordedAt: datetime     # 측정 시각 (ISO 8601)
+
+    steps: Optional[float] = None
+    distance: Optional[float] = None
+    flights: Optional[float] = None
+
+    activeEnergy: Optional[float] = None
+    exerciseTime: Optional[float] = None
+
+    heartRate: Optional[float] = None
+    restingHeartRate: Optional[float] = None
+    walkingHeartRate: Optional[float] = None
+    hrv: Optional[float] = None
+
+    sleepHours: Optional[float] = None
+
+    weight: Optional[float] = None
+    height: Optional[float] = None
+    bmi: Optional[float] = None
+    bodyFat: Optional[float] = None
+    leanBody: Optional[float] = None
+
+    systolic: Optional[float] = None
+    diastolic: Optional[float] = None
+    glucose: Optional[float] = None
+    oxygen: Optional[float] = None
+
+    calories: Optional[float] = None
+    water: Optional[float] = None
+
+
+class HealthBatch(BaseModel):
+    source: str = "apple_health"
+    samples: List[HealthSample]
@@ -9,8 +9,22 @@ from routes.users.auth_route import router as auth_router
 from routes.users.admin_route import router as admin_router
 from routes.users.profile_route import router as profile_router
 from routes.admin_log_route import router as admin_log_router
+from routes.metrics_route import router as metrics_router
+from routes.live_route import router as live_router
+from routes.exercise_route import router as exercise_router
 from routes import subscription_route, video_route
 
+from services.hashing_service import shutdown_hash_pool
+from services.log_service import shutdown_logging
+from services.audit_service import audit_buffer
+from services.analysis_service import start_analysis_workers, stop_analysis_workers
+from services.anomaly_service import start_anomaly_scheduler, stop_anomaly_scheduler
+from services.catalog_service import start_catalog, stop_catalog
+from db.instrumentation import SQLTimingMiddleware
+from services.json_service import ORJSONResponse
+from services.compression_service import CompressionMiddleware, RequestDecompressionMiddleware
+from services.storage_service import UploadSizeLimitMiddleware, start_upload_sweeper, stop_upload_sweeper
+
 # ⭐ iOS Health API 추가
 from ios.health import router as ios_router
 
@@ -20,7 +34,8 @@ from ios.health import router as ios_router
 app = FastAPI(
     title="AI Trainer Backend",
     description="FastAPI backend for AI 홈트레이닝 서비스",
-    version="1.0.0"
+    version="1.0.0",
+    default_response_class=ORJSONResponse,   # orjson 직렬화 (datetime / UUID / Decimal / RowMapping)
 )
 
 # ===============================
@@ -42,6 +57,24 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# ===============================
+# 🔥 SQL 계측 (Server-Timing 헤더, slow query / N+1 로그)
+# ===============================
+app.add_middleware(SQLTimingMiddleware)
+
+# ===============================
+# 🔥 업로드 본문 크기 제한 (multipart 를 끝까지 받기 전에 413)
+# ===============================
+app.add_middleware(UploadSizeLimitMiddleware, path_prefixes=("/web/video/upload",))
+
+# ===============================
+# 🔥 HTTP 압축
+# ===============================
+# /ios 업로드의 Content-Encoding: gzip 요청 본문 해제 (크기 / 압축률 상한)
+app.add_middleware(RequestDecompressionMiddleware)
+# 응답 br / gzip 압축 (작은 응답, JSON/text 외 타입은 그대로)
+app.add_middleware(CompressionMiddleware)
+
 # ===============================
 # 🔥 라우터 등록
 # ===============================
@@ -59,6 +92,12 @@ app.include_router(subscription_route.router, prefix="/web/subscription")
 # ✔ 비디오 기능
 app.include_router(video_route.router, prefix="/web/video")
 
+# ✔ 운동 카탈로그 (메모리 스냅샷 + ETag)
+app.include_router(exercise_router, prefix="/web/exercises")
+
+# ✔ 실시간 운동 세션 (WebSocket)
+app.include_router(live_router)
+
 # ✔ 프로필 조회/수정
 app.include_router(profile_router)
 
@@ -68,6 +107,33 @@ app.include_router(admin_router, prefix="/admin")
 # ✔ 관리자 로그 API
 app.include_router(admin_log_router, prefix="/admin")
 
+# ✔ 운영 지표 API (해싱 풀 등)
+app.include_router(metrics_router, prefix="/admin")
+
+# ===============================
+# 🔥 서버 시작 시 초기화
+# ===============================
+@app.on_event("startup")
+async def startup():
+    await audit_buffer.start()   # 감사 로그 주기적 flush 시작
+    await start_analysis_workers()   # 영상 분석 워커 시작
+    await start_anomaly_scheduler()  # 활력 징후 이상치 야간 배치
+    await start_catalog()            # 운동 카탈로그 적재 + 버전 확인
+    await start_upload_sweeper()     # 오래된 이어 올리기 세션 정리
+
+# ===============================
+# 🔥 서버 종료 시 정리
+# ===============================
+@app.on_event("shutdown")
+async def shutdown():
+    await audit_buffer.stop()    # 버퍼에 남은 감사 로그 저장
+    await stop_analysis_workers()
+    await stop_anomaly_scheduler()
+    await stop_catalog()
+    await stop_upload_sweeper()
+    shutdown_hash_pool()
+    shutdown_logging()   # 남은 로그 flush 후 writer 스레드 종료
+
 # ===============================
 # 🔥 테스트용 루트 엔드포인트
 # ===============================
@@ -92,9 +158,3 @@ if __name__ == "__main__":
         port=8000,
         reload=True
     )
-
-# ===============================
-# 🔥 시크릿 키 출력
-# ===============================
-from config.settings import settings
-print("🔥 SERVER SECRET_KEY =", settings.SECRET_KEY)
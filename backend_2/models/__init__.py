@@ -10,6 +10,7 @@ from .users_model import (
     insert_user,        # 사용자 삽입
     update_user,        # 사용자 정보 업데이트
     delete_user,        # 사용자 삭제
+    list_users_page,    # 관리자용 사용자 목록 (키셋 페이지네이션)
 )
 
 # user_info_model.py에서 필요한 함수 import
@@ -31,3 +32,51 @@ from .user_body_model import (
 # subscription_model.py에서 필요한 함수 import
 # users 테이블 is_subscribed 컬럼 관리
 from .subscription_model import set_subscription
+
+# admin_log_model.py에서 필요한 함수 import
+# admin_logs 테이블 저장 / 키셋 페이지네이션 조회
+from .admin_log_model import insert_log, insert_logs_bulk, list_logs_page
+
+# profile_model.py에서 필요한 함수 import
+# users + user_body_info + user_info JOIN 조회 (/web/users/me)
+from .profile_model import get_profile, upsert_profile
+
+# exercise_model.py에서 필요한 함수 import
+# exercise 테이블 조회
+from .exercise_model import get_exercise_by_id, list_exercises, get_catalog_version
+
+# pose_analysis_model.py에서 필요한 함수 import
+# 영상 분석 결과(프레임별) 저장
+from .pose_analysis_model import insert_pose_analyses
+
+# analysis_job_model.py에서 필요한 함수 import
+# 영상 분석 작업 큐 (analysis_jobs, FOR UPDATE SKIP LOCKED)
+from .analysis_job_model import (
+    insert_job,
+    get_job_by_id,
+    claim_job,
+    update_job_progress,
+    finish_job,
+    count_jobs_by_status,
+)
+
+# activity_model.py에서 필요한 함수 import
+# 세트별 rep 수 / 점수 저장 (activity_detail_logs)
+from .activity_model import insert_activity_details
+
+# routine_progress_model.py에서 필요한 함수 import
+# user_routine_progress 저장 (실시간 세션 세트 종료 시)
+from .routine_progress_model import save_routine_progress
+
+# wearable_model.py에서 필요한 함수 import
+# HealthKit 샘플 배치 저장 (wearable_data)
+from .wearable_model import (
+    map_health_sample,
+    insert_wearable_rows,
+    get_sync_anchor,
+    advance_sync_anchor,
+    get_rollups,         # 일별 / 주별 집계 조회
+    fetch_vitals,        # 이상치 배치용 전체 사용자 시계열
+    insert_anomalies,
+    get_anomalies,
+)
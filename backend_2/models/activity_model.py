@@ -0,0 +1,44 @@
+# ============================================
+# 🚀 activity_model.py — 운동 기록 (세트별 상세)
+# ============================================
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncConnection
+
+# 테이블 이름 불러오기
+from .tables import ACTIVITY_LOGS_TABLE, ACTIVITY_DETAIL_LOGS_TABLE
+
+
+# --------------------------------------------
+# 🟩 세트별 기록 여러 건 저장 (multi-row INSERT 1문장)
+# --------------------------------------------
+async def insert_activity_details(db: AsyncConnection, user_id, activity_id, exercise_id, sets: list):
+    """
+    activity_detail_logs 에 세트별 rep 수 / 점수 삽입 (commit 은 호출한 쪽에서)
+    - sets: [{"set_number", "reps_done", "score"}, ...]
+    - activity_id 가 user_id 의 운동 기록일 때만 삽입 (소유자 확인을 같은 문장에서 처리)
+    반환: 삽입된 행 수
+    """
+    if not sets:
+        return 0
+
+    values = []
+    params = {"user_id": user_id, "activity_id": activity_id, "exercise_id": exercise_id}
+    for i, s in enumerate(sets):
+        values.append(f"(CAST(:set_{i} AS INT), CAST(:reps_{i} AS INT), CAST(:score_{i} AS NUMERIC))")
+        params[f"set_{i}"] = s["set_number"]
+        params[f"reps_{i}"] = s.get("reps_done")
+        params[f"score_{i}"] = s.get("score")
+
+    result = await db.execute(
+        text(f"""
+            INSERT INTO {ACTIVITY_DETAIL_LOGS_TABLE}
+            (activity_id, exercise_id, set_number, reps_done, score)
+            SELECT a.id, CAST(:exercise_id AS UUID), v.set_number, v.reps_done, v.score
+            FROM {ACTIVITY_LOGS_TABLE} a
+            CROSS JOIN (VALUES {", ".join(values)}) AS v (set_number, reps_done, score)
+            WHERE a.id = :activity_id AND a.user_id = :user_id
+        """),
+        params
+    )
+    return result.rowcount
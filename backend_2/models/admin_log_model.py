@@ -0,0 +1,131 @@
+# ============================================
+# 🚀 admin_log_model.py — 관리자 감사 로그
+# ============================================
+
+from datetime import datetime
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncConnection
+
+# 키셋 페이지네이션 헬퍼
+from .helpers import encode_cursor, decode_cursor, to_naive_utc
+
+# 테이블 이름 불러오기
+from .tables import ADMIN_LOGS_TABLE
+
+# 정렬 키: timestamp 가 NULL 인 로그는 맨 뒤
+# (행 비교 (a, b) < (c, d) 에서도 NULL 행이 빠지지 않도록 키와 커서 모두 COALESCE)
+LOG_SORT_KEY = "COALESCE(timestamp, '-infinity'::timestamp)"
+
+# 커서 값 타입
+LOG_CURSOR_TYPES = {"timestamp": (str, type(None)), "id": (int, str)}
+
+# 목록에서 반환하는 컬럼 (인덱스 INCLUDE 컬럼과 동일하게 유지 → index-only scan)
+LOG_COLUMNS = "id, admin_email, action, target_user_id, target_user_email, timestamp"
+
+
+# --------------------------------------------
+# 🟩 로그 1건 저장
+# --------------------------------------------
+async def insert_log(db: AsyncConnection, data: dict):
+    """
+    admin_logs 에 로그 1건 삽입 (commit 은 호출한 쪽 unit_of_work 에서)
+    - data: admin_email, action, target_user_id, target_user_email
+    """
+    await db.execute(
+        text(f"""
+            INSERT INTO {ADMIN_LOGS_TABLE}
+            (admin_email, action, target_user_id, target_user_email, timestamp)
+            VALUES (:admin_email, :action, :target_user_id, :target_user_email, NOW())
+        """),
+        data
+    )
+
+
+# --------------------------------------------
+# 🟩 로그 여러 건 저장 (multi-row INSERT 1문장)
+# --------------------------------------------
+LOG_INSERT_COLUMNS = ("admin_email", "action", "target_user_id", "target_user_email", "timestamp")
+
+
+async def insert_logs_bulk(db: AsyncConnection, entries: list):
+    """
+    여러 로그를 INSERT ... VALUES (...), (...), ... 한 문장으로 삽입
+    - entries: LOG_INSERT_COLUMNS 키를 가진 dict 리스트 (timestamp 는 발생 시각)
+    - commit 은 호출한 쪽에서
+    """
+    if not entries:
+        return
+
+    values = []
+    params = {}
+    for i, entry in enumerate(entries):
+        values.append("(" + ", ".join(f":{col}_{i}" for col in LOG_INSERT_COLUMNS) + ")")
+        for col in LOG_INSERT_COLUMNS:
+            params[f"{col}_{i}"] = entry.get(col)
+
+    await db.execute(
+        text(f"""
+            INSERT INTO {ADMIN_LOGS_TABLE}
+            ({", ".join(LOG_INSERT_COLUMNS)})
+            VALUES {", ".join(values)}
+        """),
+        params
+    )
+
+
+# --------------------------------------------
+# 🟦 로그 목록 (키셋 페이지네이션)
+# --------------------------------------------
+async def list_logs_page(db: AsyncConnection, limit: int, cursor=None, filters=None):
+    """
+    (COALESCE(timestamp, '-infinity'), id) 내림차순 키셋 페이지네이션
+    - cursor: 이전 페이지의 next_cursor (없으면 첫 페이지)
+    - filters: admin_email, action, target_user_id, since, until 중 일부
+    반환: {"items": [...], "next_cursor": str | None}
+    - 잘못된 cursor 면 ValueError
+    """
+    filters = filters or {}
+    conditions = []
+    params = {"limit": limit + 1}   # 다음 페이지 존재 여부 확인용 1개 더
+
+    for key in ("admin_email", "action", "target_user_id"):
+        if filters.get(key) is not None:
+            conditions.append(f"{key} = :{key}")
+            params[key] = filters[key]
+
+    if filters.get("since") is not None:
+        conditions.append("timestamp >= :since")
+        params["since"] = to_naive_utc(filters["since"])   # timestamp 컬럼 → naive UTC
+    if filters.get("until") is not None:
+        conditions.append("timestamp < :until")
+        params["until"] = to_naive_utc(filters["until"])
+
+    if cursor:
+        values = decode_cursor(cursor, LOG_CURSOR_TYPES)
+        conditions.append(
+            f"({LOG_SORT_KEY}, id) < "
+            f"(COALESCE(CAST(:cursor_ts AS timestamp), '-infinity'::timestamp), :cursor_id)"
+        )
+        ts = values["timestamp"]
+        params["cursor_ts"] = to_naive_utc(datetime.fromisoformat(ts)) if ts else None
+        params["cursor_id"] = int(values["id"])   # 숫자가 아니면 ValueError
+
+    sql = f"SELECT {LOG_COLUMNS} FROM {ADMIN_LOGS_TABLE}"
+    if conditions:
+        sql += " WHERE " + " AND ".join(conditions)
+    sql += f" ORDER BY {LOG_SORT_KEY} DESC, id DESC LIMIT :limit"
+
+    # 응답에서 바로 orjson 직렬화되도록 dict 로 한 번만 변환
+    rows = [dict(row) for row in (await db.execute(text(sql), params)).mappings()]
+
+    has_more = len(rows) > limit
+    rows = rows[:limit]
+
+    next_cursor = None
+    if has_more:
+        last = rows[-1]
+        ts = last["timestamp"]
+        next_cursor = encode_cursor({"timestamp": ts.isoformat() if ts else None, "id": last["id"]})
+
+    return {"items": rows, "next_cursor": next_cursor}
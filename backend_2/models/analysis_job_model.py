@@ -0,0 +1,136 @@
+# ============================================
+# 🚀 analysis_job_model.py — 영상 분석 작업 큐
+# ============================================
+# 작업 상태: queued → running → done / failed (db/migrations/010_analysis_jobs.sql)
+# running 작업의 updated_at 은 워커가 주기적으로 갱신한다 (heartbeat).
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncConnection
+
+# 테이블 이름 불러오기
+from .tables import ANALYSIS_JOBS_TABLE
+
+# 응답 / 워커에서 쓰는 컬럼
+JOB_COLUMNS = (
+    "id, user_id, video_id, exercise_id, activity_id, status, progress, attempts, "
+    "score, feedback, frames, sets, error, created_at, started_at, finished_at"
+)
+
+
+# --------------------------------------------
+# 🟩 작업 등록 (대기 작업이 queue_max 이상이면 등록하지 않음)
+# --------------------------------------------
+async def insert_job(db: AsyncConnection, data: dict, queue_max: int):
+    """
+    analysis_jobs 에 queued 작업 1건 삽입 (commit 은 호출한 쪽에서)
+    - data: user_id, video_id, exercise_id, activity_id
+    반환: 삽입된 작업 행 또는 None (대기열이 가득 참)
+    """
+    return (await db.execute(
+        text(f"""
+            INSERT INTO {ANALYSIS_JOBS_TABLE} (user_id, video_id, exercise_id, activity_id)
+            SELECT :user_id, :video_id, :exercise_id, :activity_id
+            WHERE (SELECT COUNT(*) FROM {ANALYSIS_JOBS_TABLE} WHERE status = 'queued') < :queue_max
+            RETURNING {JOB_COLUMNS}
+        """),
+        {**data, "queue_max": queue_max}
+    )).mappings().first()
+
+
+# --------------------------------------------
+# 🟦 작업 1건 조회
+# --------------------------------------------
+async def get_job_by_id(db: AsyncConnection, job_id: str):
+    return (await db.execute(
+        text(f"SELECT {JOB_COLUMNS} FROM {ANALYSIS_JOBS_TABLE} WHERE id = :id"),
+        {"id": job_id}
+    )).mappings().first()
+
+
+# --------------------------------------------
+# 🟨 다음 작업 가져가기 (여러 워커 프로세스가 동시에 호출해도 1건씩만)
+# --------------------------------------------
+async def claim_job(db: AsyncConnection, stale_seconds: float):
+    """
+    가장 오래된 queued 작업 (또는 heartbeat 가 stale_seconds 이상 끊긴 running 작업)을
+    running 으로 바꾸고 반환 (없으면 None)
+    - FOR UPDATE SKIP LOCKED → 다른 워커가 잡고 있는 행은 건너뜀
+    - attempts 를 1 늘림 (같은 작업을 몇 번째 실행하는지)
+    """
+    return (await db.execute(
+        text(f"""
+            UPDATE {ANALYSIS_JOBS_TABLE}
+            SET status = 'running', attempts = attempts + 1, progress = 0,
+                started_at = NOW(), updated_at = NOW()
+            WHERE id = (
+                SELECT id FROM {ANALYSIS_JOBS_TABLE}
+                WHERE status = 'queued'
+                   OR (status = 'running' AND updated_at < NOW() - make_interval(secs => :stale_seconds))
+                ORDER BY created_at
+                LIMIT 1
+                FOR UPDATE SKIP LOCKED
+            )
+            RETURNING {JOB_COLUMNS}
+        """),
+        {"stale_seconds": stale_seconds}
+    )).mappings().first()
+
+
+# --------------------------------------------
+# 🟨 진행률 / heartbeat 갱신
+# --------------------------------------------
+async def update_job_progress(db: AsyncConnection, job_id, attempts: int, progress: float):
+    """
+    running 작업의 progress, updated_at 갱신
+    - attempts 가 다르면 (다른 워커가 다시 가져간 작업) 갱신하지 않음
+    반환: 갱신했으면 True
+    """
+    result = await db.execute(
+        text(f"""
+            UPDATE {ANALYSIS_JOBS_TABLE}
+            SET progress = :progress, updated_at = NOW()
+            WHERE id = :id AND attempts = :attempts AND status = 'running'
+        """),
+        {"id": job_id, "attempts": attempts, "progress": progress}
+    )
+    return result.rowcount > 0
+
+
+# --------------------------------------------
+# 🟨 작업 종료 (done / failed / 다시 queued)
+# --------------------------------------------
+async def finish_job(db: AsyncConnection, job_id, attempts: int, status: str, fields=None):
+    """
+    running 작업을 status 로 변경 (commit 은 호출한 쪽에서)
+    - fields: score, feedback, frames, sets, error, progress 중 일부
+    - status 가 queued 면 재시도 대기 (attempts 는 되돌림, finished_at 없음)
+    - attempts 가 다르면 (다른 워커가 다시 가져간 작업) 변경하지 않음
+    반환: 변경했으면 True
+    """
+    fields = dict(fields or {})
+    assignments = [f"{k} = :{k}" for k in fields]
+    assignments += ["status = :status", "updated_at = NOW()"]
+    if status == "queued":
+        assignments += ["attempts = attempts - 1", "started_at = NULL"]
+    else:
+        assignments.append("finished_at = NOW()")
+
+    result = await db.execute(
+        text(f"""
+            UPDATE {ANALYSIS_JOBS_TABLE}
+            SET {", ".join(assignments)}
+            WHERE id = :id AND attempts = :attempts AND status = 'running'
+        """),
+        {**fields, "id": job_id, "attempts": attempts, "status": status}
+    )
+    return result.rowcount > 0
+
+
+# --------------------------------------------
+# 🟦 상태별 작업 수 (운영 지표)
+# --------------------------------------------
+async def count_jobs_by_status(db: AsyncConnection):
+    rows = (await db.execute(
+        text(f"SELECT status, COUNT(*) AS count FROM {ANALYSIS_JOBS_TABLE} GROUP BY status")
+    )).mappings().all()
+    return {row["status"]: row["count"] for row in rows}
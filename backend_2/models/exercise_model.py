@@ -0,0 +1,45 @@
+# ============================================
+# 🚀 exercise_model.py — 운동 목록
+# ============================================
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncConnection
+
+# 테이블 이름 불러오기
+from .tables import EXERCISE_TABLE, CATALOG_VERSIONS_TABLE
+
+# 분석 / 목록에서 쓰는 컬럼
+EXERCISE_COLUMNS = "id, name, type, posture, category_1, category_2, difficulty, met"
+
+# 카탈로그 API 응답 컬럼
+CATALOG_COLUMNS = EXERCISE_COLUMNS + ", description, thumbnail_url, video_url"
+
+
+# --------------------------------------------
+# 🟦 운동 1건 조회
+# --------------------------------------------
+async def get_exercise_by_id(db: AsyncConnection, exercise_id: str):
+    return (await db.execute(
+        text(f"SELECT {EXERCISE_COLUMNS} FROM {EXERCISE_TABLE} WHERE id = :id"),
+        {"id": exercise_id}
+    )).mappings().first()
+
+
+# --------------------------------------------
+# 🟦 전체 운동 목록 (카탈로그 스냅샷 적재용)
+# --------------------------------------------
+async def list_exercises(db: AsyncConnection):
+    return (await db.execute(
+        text(f"SELECT {CATALOG_COLUMNS} FROM {EXERCISE_TABLE} ORDER BY name, id")
+    )).mappings().all()
+
+
+# --------------------------------------------
+# 🟦 카탈로그 버전 조회 (db/migrations/006_catalog_versions.sql)
+# --------------------------------------------
+async def get_catalog_version(db: AsyncConnection, name: str = "exercise"):
+    """없으면 None"""
+    return (await db.execute(
+        text(f"SELECT version FROM {CATALOG_VERSIONS_TABLE} WHERE name = :name"),
+        {"name": name}
+    )).scalar_one_or_none()
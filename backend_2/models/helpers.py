@@ -1,7 +1,13 @@
 # JSON 처리 및 SQL 실행에 필요한 모듈 import
+import base64
 import json
+from datetime import timezone
 from sqlalchemy import text
-from sqlalchemy.engine import Connection
+from sqlalchemy.ext.asyncio import AsyncConnection
+
+# 프로필 변경 시 /me 캐시 무효화
+from services.cache_service import invalidate_profile
+from db.database import after_commit
 
 # -----------------------------
 # SQL UPDATE 문에서 SET 절 생성 함수
@@ -27,35 +33,190 @@ def handle_json_fields(fields: dict, json_keys: list):
         if key in fields:
             fields[key] = json.dumps(fields[key] or [])
 
+# -----------------------------
+# INSERT ... ON CONFLICT 문 생성 함수
+# -----------------------------
+def build_upsert(table: str, user_id, fields: dict, insert_defaults=None, prefix=""):
+    """
+    user_id 기준 upsert SQL 과 바인딩 파라미터 생성
+    - fields: INSERT / UPDATE 모두에 쓰이는 필드
+    - insert_defaults: 신규 INSERT 시에만 채울 기본값 (NOT NULL 컬럼 등)
+    - prefix: 여러 테이블을 한 문장으로 묶을 때 파라미터 이름 충돌 방지용
+    반환: (sql 문자열, params dict)
+    예: INSERT INTO t (user_id, a) VALUES (:user_id, :a)
+        ON CONFLICT (user_id) DO UPDATE SET a = EXCLUDED.a RETURNING *
+    """
+    insert_fields = {**(insert_defaults or {}), **fields}
+    columns = ["user_id"] + list(insert_fields.keys())
+
+    params = {f"{prefix}{k}": v for k, v in insert_fields.items()}
+    params[f"{prefix}user_id"] = user_id
+
+    values = ", ".join(f":{prefix}{c}" for c in columns)
+    update_clause = ", ".join(f"{k} = EXCLUDED.{k}" for k in fields.keys())
+
+    sql = (
+        f"INSERT INTO {table} ({', '.join(columns)}) VALUES ({values}) "
+        f"ON CONFLICT (user_id) DO UPDATE SET {update_clause} "
+        f"RETURNING *"
+    )
+    return sql, params
+
+# -----------------------------
+# 공통 UPSERT 처리 함수 (단일 테이블)
+# -----------------------------
+async def upsert_record(db: AsyncConnection, table: str, user_id, fields: dict, json_keys=None, insert_defaults=None):
+    """
+    SELECT 후 UPDATE/INSERT 대신 INSERT ... ON CONFLICT (user_id) DO UPDATE 한 번으로 처리
+    - 동시에 저장해도 경쟁 상태 없이 원자적으로 반영
+    반환: 저장된 최신 행 (dict) 또는 None (필드 없음)
+    """
+    if not fields:
+        return None
+
+    handle_json_fields(fields, json_keys or [])
+
+    sql, params = build_upsert(table, user_id, fields, insert_defaults)
+    row = (await db.execute(text(sql), params)).mappings().first()
+    after_commit(db, invalidate_profile, user_id)  # 커밋 후 /me 캐시 무효화
+    return dict(row) if row else None
+
+# -----------------------------
+# 공통 UPSERT 처리 함수 (여러 테이블 1회 왕복)
+# -----------------------------
+async def upsert_records(db: AsyncConnection, user_id, tables: dict):
+    """
+    여러 테이블의 upsert 를 data-modifying CTE 로 묶어 SQL 1문장으로 실행
+    - tables: {테이블 이름: {"fields": dict, "json_keys": list, "insert_defaults": dict}}
+    반환: {테이블 이름: 저장된 최신 행 (dict)}
+      (row_to_json 결과라 timestamp / uuid 값은 문자열)
+    """
+    ctes = []
+    selects = []
+    params = {}
+    names = []
+
+    for i, (table, spec) in enumerate(tables.items()):
+        fields = spec.get("fields") or {}
+        if not fields:
+            continue
+
+        handle_json_fields(fields, spec.get("json_keys") or [])
+        sql, table_params = build_upsert(
+            table, user_id, fields, spec.get("insert_defaults"), prefix=f"t{i}_"
+        )
+        ctes.append(f"t{i} AS ({sql})")
+        selects.append(f"(SELECT row_to_json(t{i}) FROM t{i}) AS t{i}")
+        params.update(table_params)
+        names.append((table, f"t{i}"))
+
+    if not ctes:
+        return {}
+
+    stmt = text(f"WITH {', '.join(ctes)} SELECT {', '.join(selects)}")
+    row = (await db.execute(stmt, params)).mappings().first()
+    after_commit(db, invalidate_profile, user_id)  # 커밋 후 /me 캐시 무효화
+
+    # asyncpg 는 json 타입을 파싱하지 않고 문자열로 돌려주므로 여기서 dict 로 변환
+    return {table: _json_value(row[alias]) for table, alias in names}
+
+
+def _json_value(value):
+    """row_to_json 결과 (JSON 문자열, 또는 json 코덱이 등록된 경우 dict) → dict"""
+    return json.loads(value) if isinstance(value, (str, bytes)) else value
+
 # -----------------------------
 # 공통 UPDATE 처리 함수
 # -----------------------------
-def update_record(db: Connection, table: str, user_id: int, fields: dict, json_keys=None, insert_func=None):
+async def update_record(db: AsyncConnection, table: str, user_id, fields: dict, json_keys=None, insert_if_missing=False, insert_defaults=None):
     """
-    DB 테이블에 공통으로 UPDATE 수행
-    - db: DB 연결 객체 (Connection)
+    DB 테이블에 공통으로 UPDATE 수행 (SELECT 없이 1문장)
+    - db: DB 연결 객체 (AsyncConnection)
     - table: 업데이트할 테이블 이름
     - user_id: 대상 사용자 ID
     - fields: 업데이트할 필드 dict
     - json_keys: JSON으로 변환할 필드 리스트
-    - insert_func: 레코드가 없을 경우 INSERT 처리 함수
+    - insert_if_missing: True면 레코드가 없을 경우 INSERT (upsert)
+    - insert_defaults: upsert 로 INSERT 될 때만 채울 기본값
+    반환: 저장된 최신 행 (dict) 또는 None
     """
-    json_keys = json_keys or []  # None일 경우 빈 리스트로 초기화
-    handle_json_fields(fields, json_keys)  # JSON 필드 처리
+    # 1. 레코드가 없을 때 INSERT 해야 하면 upsert 로 처리
+    if insert_if_missing:
+        return await upsert_record(db, table, user_id, fields, json_keys, insert_defaults)
 
-    # 1. 기존 레코드 존재 여부 확인
-    stmt = text(f"SELECT * FROM {table} WHERE user_id = :uid")  # text()로 감싸야 SQLAlchemy 2.x 호환
-    existing = db.execute(stmt, {"uid": user_id}).mappings().first()
+    if not fields:
+        return None
 
-    # 2. 레코드가 없으면 insert_func 호출
-    if not existing:
-        if insert_func:
-            insert_func(db, user_id, **fields)
-        return
+    handle_json_fields(fields, json_keys or [])  # JSON 필드 처리
 
-    # 3. 기존 레코드가 있으면 UPDATE 수행
+    # 2. UPDATE ... RETURNING (레코드가 없으면 아무 것도 하지 않음)
     set_clause = build_set_clause(fields)  # "field1 = :field1, field2 = :field2" 형태 생성
-    fields["user_id"] = user_id
-    update_stmt = text(f"UPDATE {table} SET {set_clause} WHERE user_id = :user_id")  # text() 사용
-    db.execute(update_stmt, fields)  # DB에 업데이트 실행
-    db.commit()  # 커밋
+    params = {**fields, "user_id": user_id}
+    update_stmt = text(f"UPDATE {table} SET {set_clause} WHERE user_id = :user_id RETURNING *")  # text() 사용
+    row = (await db.execute(update_stmt, params)).mappings().first()  # DB에 업데이트 실행
+    after_commit(db, invalidate_profile, user_id)  # 커밋 후 /me 캐시 무효화
+    return dict(row) if row else None
+
+
+# -----------------------------
+# timestamp(without time zone) 바인딩용 시각 변환
+# -----------------------------
+def to_naive_utc(value):
+    """
+    tz 정보가 있는 datetime → UTC 기준 naive datetime (없으면 그대로)
+    asyncpg 는 timestamp without time zone 컬럼에 aware datetime 을 바인딩하면 오류를 낸다.
+    """
+    if value is not None and value.tzinfo is not None:
+        return value.astimezone(timezone.utc).replace(tzinfo=None)
+    return value
+
+
+# -----------------------------
+# 키셋 페이지네이션 커서 인코딩 / 디코딩
+# -----------------------------
+def encode_cursor(values: dict):
+    """
+    마지막 행의 정렬 키 값을 URL-safe 문자열 커서로 변환
+    예: {"created_at": datetime, "id": UUID} -> "eyJjcmVhdGVkX2F0Ijo..."
+    """
+    raw = json.dumps(values, default=str).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: str, types=None):
+    """
+    encode_cursor 로 만든 커서를 dict 로 복원
+    - types: {키: 허용 타입 (또는 타입 튜플)} → 키가 없거나 타입이 다르면 ValueError
+      예: {"created_at": (str, type(None)), "id": str}
+    - 잘못된 커서면 ValueError
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        values = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+    except Exception as e:
+        raise ValueError("invalid cursor") from e
+
+    if not isinstance(values, dict):
+        raise ValueError("invalid cursor")
+    for key, allowed in (types or {}).items():
+        if key not in values or not isinstance(values[key], allowed):
+            raise ValueError("invalid cursor")
+    return values
+
+# -----------------------------
+# 플래너 통계 기반 행 수 추정
+# -----------------------------
+async def estimate_count(db: AsyncConnection, from_where_sql: str, params: dict):
+    """
+    COUNT(*) 대신 EXPLAIN 의 예상 행 수(Plan Rows)로 총 개수 추정
+    - from_where_sql: "FROM ... WHERE ..." 부분
+    - 테이블 전체를 세지 않으므로 큰 테이블에서도 즉시 반환 (정확한 값은 아님)
+    """
+    plan = (await db.execute(
+        text(f"EXPLAIN (FORMAT JSON) SELECT 1 {from_where_sql}"),
+        params
+    )).scalar()
+
+    if isinstance(plan, str):
+        plan = json.loads(plan)
+    return int(plan[0]["Plan"]["Plan Rows"])
@@ -0,0 +1,47 @@
+# ============================================
+# 🚀 pose_analysis_model.py — 자세 분석 결과
+# ============================================
+
+import json
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncConnection
+
+# 테이블 이름 불러오기
+from .tables import POSE_ANALYSIS_TABLE
+
+
+# --------------------------------------------
+# 🟩 프레임별 분석 결과 여러 건 저장 (multi-row INSERT 1문장)
+# --------------------------------------------
+async def insert_pose_analyses(db: AsyncConnection, user_id, exercise_id, frames: list):
+    """
+    pose_analysis 에 프레임별 결과 삽입 (commit 은 호출한 쪽에서)
+    - frames: [{"frame_file_name", "angles", "issues", "score", "feedback"}, ...]
+    반환: 삽입된 행 수
+    """
+    if not frames:
+        return 0
+
+    values = []
+    params = {"user_id": user_id, "exercise_id": exercise_id}
+    for i, frame in enumerate(frames):
+        values.append(
+            f"(:user_id, :exercise_id, :frame_{i}, CAST(:angles_{i} AS JSONB), "
+            f"CAST(:issues_{i} AS JSONB), :score_{i}, :feedback_{i})"
+        )
+        params[f"frame_{i}"] = frame.get("frame_file_name")
+        params[f"angles_{i}"] = json.dumps(frame.get("angles") or {})
+        params[f"issues_{i}"] = json.dumps(frame.get("issues") or [], ensure_ascii=False)
+        params[f"score_{i}"] = frame.get("score")
+        params[f"feedback_{i}"] = frame.get("feedback")
+
+    await db.execute(
+        text(f"""
+            INSERT INTO {POSE_ANALYSIS_TABLE}
+            (user_id, exercise_id, frame_file_name, angles_json, issues_json, score, feedback_text)
+            VALUES {", ".join(values)}
+        """),
+        params
+    )
+    return len(frames)
@@ -0,0 +1,66 @@
+# ============================================
+# 🚀 profile_model.py — /web/users/me 전용 조회
+# ============================================
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncConnection
+
+# 공통 upsert 함수
+from .helpers import upsert_records
+
+# user_info 키 매핑 / JSON 컬럼
+from .user_info_model import map_user_info_fields, USER_INFO_JSON_KEYS
+
+# user_body_info NOT NULL 컬럼 기본값
+from .user_body_model import BODY_INSERT_DEFAULTS
+
+# 테이블 이름 불러오기
+from .tables import USERS_TABLE, USER_BODY_TABLE, USER_INFO_TABLE
+
+
+# --------------------------------------------
+# 🟦 프로필 조회 (users + user_body_info + user_info 1회 JOIN)
+# --------------------------------------------
+# SELECT * 3번 대신 응답에 쓰는 컬럼만 한 번에 가져온다.
+# (age / avatar 는 users 테이블 컬럼이 아니므로 조회하지 않음)
+PROFILE_QUERY = text(f"""
+    SELECT
+        u.id, u.name, u.email, u.phone, u.gender, u.goal, u.created_at,
+        b.height_cm, b.weight_kg, b.bmi,
+        i.dailytime, i.weekly, i.activity, i.targetperiod, i.intro, i.prefer
+    FROM {USERS_TABLE} u
+    LEFT JOIN {USER_BODY_TABLE} b ON b.user_id = u.id
+    LEFT JOIN {USER_INFO_TABLE} i ON i.user_id = u.id
+    WHERE u.id = :uid
+""")
+
+
+async def get_profile(db: AsyncConnection, user_id: str):
+    """
+    /me 응답에 필요한 프로필 컬럼만 JOIN 1회로 조회
+    반환: dict 형태의 프로필 또는 None
+    """
+    return (await db.execute(PROFILE_QUERY, {"uid": user_id})).mappings().first()
+
+
+# --------------------------------------------
+# 🟩 user_info + user_body_info 동시 upsert (SQL 1문장)
+# --------------------------------------------
+async def upsert_profile(db: AsyncConnection, user_id: str, info_fields=None, body_fields=None):
+    """
+    프로필 저장 시 user_info / user_body_info upsert 를 한 번의 왕복으로 처리
+    - info_fields: user_info 필드 (camelCase 허용)
+    - body_fields: user_body_info 필드 (height_cm, weight_kg, bmi)
+    반환: {"info": 최신 user_info 행, "body": 최신 user_body_info 행}
+    """
+    rows = await upsert_records(db, user_id, {
+        USER_INFO_TABLE: {
+            "fields": map_user_info_fields(dict(info_fields or {})),
+            "json_keys": USER_INFO_JSON_KEYS,
+        },
+        USER_BODY_TABLE: {
+            "fields": dict(body_fields or {}),
+            "insert_defaults": BODY_INSERT_DEFAULTS,
+        },
+    })
+    return {"info": rows.get(USER_INFO_TABLE), "body": rows.get(USER_BODY_TABLE)}
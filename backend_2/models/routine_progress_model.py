@@ -0,0 +1,54 @@
+# ============================================
+# 🚀 routine_progress_model.py — 루틴 진행 상황
+# ============================================
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncConnection
+
+# 테이블 이름 불러오기
+from .tables import USER_ROUTINE_PROGRESS_TABLE
+
+# status 값
+PROGRESS_IN_PROGRESS = "IN_PROGRESS"
+PROGRESS_CANCELED = "CANCELED"
+PROGRESS_FINISHED = "FINISHED"
+
+
+# --------------------------------------------
+# 🟩 진행 상황 저장 (있으면 UPDATE, 없으면 INSERT — 1문장)
+# --------------------------------------------
+# user_routine_progress 에는 (user_id, routine_id) UNIQUE 제약이 없으므로
+# ON CONFLICT 대신 UPDATE ... RETURNING 결과가 없을 때만 INSERT 한다.
+async def save_routine_progress(
+    db: AsyncConnection,
+    user_id,
+    routine_id,
+    current_step: int,
+    current_set: int,
+    status: str = PROGRESS_IN_PROGRESS
+):
+    """commit 은 호출한 쪽에서"""
+    await db.execute(
+        text(f"""
+            WITH updated AS (
+                UPDATE {USER_ROUTINE_PROGRESS_TABLE}
+                SET current_step = :current_step,
+                    current_set = :current_set,
+                    status = :status,
+                    updated_at = NOW()
+                WHERE user_id = :user_id AND routine_id = :routine_id
+                RETURNING id
+            )
+            INSERT INTO {USER_ROUTINE_PROGRESS_TABLE}
+            (user_id, routine_id, current_step, current_set, status, updated_at)
+            SELECT :user_id, :routine_id, :current_step, :current_set, :status, NOW()
+            WHERE NOT EXISTS (SELECT 1 FROM updated)
+        """),
+        {
+            "user_id": user_id,
+            "routine_id": routine_id,
+            "current_step": current_step,
+            "current_set": current_set,
+            "status": status,
+        }
+    )
@@ -5,10 +5,14 @@ from sqlalchemy import text
 # tables에 정의된 db의 테이블 불러오기
 from .tables import USERS_TABLE
 
+# users 행 변경 시 인증 사용자 캐시 무효화
+from services.cache_service import invalidate_principal_by_email
+from db.database import after_commit
+
 # -----------------------------
 # 구독 상태 업데이트 함수
 # -----------------------------
-def set_subscription(db, email: str, subscribed: bool):
+async def set_subscription(db, email: str, subscribed: bool):
     """
     users 테이블에서 특정 사용자의 구독 상태(is_subscribed)를 업데이트
     - db: SQLAlchemy DB 연결 객체
@@ -17,10 +21,11 @@ def set_subscription(db, email: str, subscribed: bool):
     """
     # 1. UPDATE SQL 실행
     # email을 기준으로 해당 사용자의 is_subscribed 컬럼 값을 변경
-    db.execute(
+    await db.execute(
         text(f"UPDATE {USERS_TABLE} SET is_subscribed = :s WHERE email = :email"),
         {"email": email, "s": subscribed}  # 바인딩 파라미터
     )
 
-    # 2. 변경사항 DB 커밋
-    db.commit()
+    # 2. 커밋은 호출한 쪽의 unit_of_work 에서 처리
+    #    커밋 후 인증 사용자 캐시 무효화
+    after_commit(db, invalidate_principal_by_email, email)
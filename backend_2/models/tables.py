@@ -6,3 +6,15 @@
 USERS_TABLE = "public.users"
 USER_INFO_TABLE = "public.user_info"
 USER_BODY_TABLE = "public.user_body_info"
+ADMIN_LOGS_TABLE = "public.admin_logs"
+EXERCISE_TABLE = "public.exercise"
+CATALOG_VERSIONS_TABLE = "public.catalog_versions"
+POSE_ANALYSIS_TABLE = "public.pose_analysis"
+ANALYSIS_JOBS_TABLE = "public.analysis_jobs"
+ACTIVITY_LOGS_TABLE = "public.activity_logs"
+ACTIVITY_DETAIL_LOGS_TABLE = "public.activity_detail_logs"
+USER_ROUTINE_PROGRESS_TABLE = "public.user_routine_progress"
+WEARABLE_DATA_TABLE = "public.wearable_data"
+WEARABLE_SYNC_ANCHORS_TABLE = "public.wearable_sync_anchors"
+WEARABLE_ROLLUPS_TABLE = "public.wearable_rollups"
+WEARABLE_ANOMALIES_TABLE = "public.wearable_anomalies"
@@ -4,7 +4,7 @@
 
 import json
 from sqlalchemy import text
-from sqlalchemy.engine import Connection
+from sqlalchemy.ext.asyncio import AsyncConnection
 
 # 공통 update_record 함수
 from .helpers import update_record
@@ -12,28 +12,37 @@ from .helpers import update_record
 # 테이블 이름 불러오기
 from .tables import USER_BODY_TABLE
 
+# 프로필 변경 시 /me 캐시 무효화
+from services.cache_service import invalidate_profile
+from db.database import after_commit
+
+# upsert 로 새 행이 INSERT 될 때만 채우는 값
+# (height_cm, weight_kg 는 NOT NULL 이고, Postgres 는 ON CONFLICT 판단 전에
+#  INSERT 후보 행의 NOT NULL 을 먼저 검사하므로 키 / 몸무게 중 하나만 보내도 필요)
+BODY_INSERT_DEFAULTS = {"height_cm": 0, "weight_kg": 0, "bmi": 0}
+
 
 # --------------------------------------------
 # 🟦 1) user_body_info 조회
 # --------------------------------------------
-def get_body_info(db: Connection, user_id: str):
+async def get_body_info(db: AsyncConnection, user_id: str):
     """
     특정 사용자의 신체 정보 조회
     """
-    return db.execute(
+    return (await db.execute(
         text(f"SELECT * FROM {USER_BODY_TABLE} WHERE user_id = :uid"),
         {"uid": user_id}
-    ).mappings().first()
+    )).mappings().first()
 
 
 # --------------------------------------------
 # 🟩 2) user_body_info 신규 생성
 # --------------------------------------------
-def insert_body_info(db: Connection, user_id: str, height_cm=None, weight_kg=None, bmi=None):
+async def insert_body_info(db: AsyncConnection, user_id: str, height_cm=None, weight_kg=None, bmi=None):
     """
     body_info 신규 삽입
     """
-    db.execute(
+    await db.execute(
         text(f"""
         INSERT INTO {USER_BODY_TABLE}
         (user_id, height_cm, weight_kg, bmi)
@@ -46,23 +55,27 @@ def insert_body_info(db: Connection, user_id: str, height_cm=None, weight_kg=Non
             "bmi": bmi,
         }
     )
-    db.commit()
+    after_commit(db, invalidate_profile, user_id)
 
 
 # --------------------------------------------
 # 🟧 3) user_body_info 업데이트
 # --------------------------------------------
-def update_body_info(db: Connection, user_id: str, fields: dict, insert_if_missing=False):
+async def update_body_info(db: AsyncConnection, user_id: str, fields: dict, insert_if_missing=False, insert_defaults=None):
     """
     height_cm, weight_kg, bmi 같은 신체 정보만 업데이트
+    - insert_if_missing: True면 INSERT ... ON CONFLICT 로 원자적 upsert
+    - insert_defaults: upsert 로 INSERT 될 때만 채울 값 (height_cm, weight_kg 는 NOT NULL)
+    반환: 저장된 최신 행
     """
 
     # JSON 컬럼 없으므로 json_keys=[] 로 둔다
-    update_record(
+    return await update_record(
         db,
         table=USER_BODY_TABLE,
         user_id=user_id,
         fields=fields,
         json_keys=[],                     # ← pain 제거!
-        insert_func=insert_body_info if insert_if_missing else None
+        insert_if_missing=insert_if_missing,
+        insert_defaults=insert_defaults
     )
@@ -1,7 +1,7 @@
 # JSON 처리 및 SQLAlchemy import
 import json
 from sqlalchemy import text
-from sqlalchemy.engine import Connection
+from sqlalchemy.ext.asyncio import AsyncConnection
 
 # 공통 update_record 함수 import
 from .helpers import update_record
@@ -9,26 +9,33 @@ from .helpers import update_record
 # tables에 정의된 db의 테이블 불러오기
 from .tables import USER_INFO_TABLE
 
+# user_info 에서 JSON 문자열로 저장하는 컬럼
+USER_INFO_JSON_KEYS = ["prefer"]
+
+# 프로필 변경 시 /me 캐시 무효화
+from services.cache_service import invalidate_profile
+from db.database import after_commit
+
 # -----------------------------
 # user_info 조회 함수
 # -----------------------------
-def get_user_info(db: Connection, user_id: int):
+async def get_user_info(db: AsyncConnection, user_id: int):
     """
     특정 사용자의 user_info 조회
     - db: SQLAlchemy DB 연결 객체
     - user_id: 조회할 사용자 ID
     반환: dict 형태의 사용자 정보 또는 None
     """
-    return db.execute(
+    return (await db.execute(
         text(f"SELECT * FROM {USER_INFO_TABLE} WHERE user_id = :uid"),  # SQL문
         {"uid": user_id}  # 바인딩 파라미터
-    ).mappings().first()  # dict 형태로 반환
+    )).mappings().first()  # dict 형태로 반환
 
 # -----------------------------
 # user_info 삽입 함수
 # -----------------------------
-def insert_user_info(db: Connection, user_id: int, dailytime=None, weekly=None,
-                     activity=None, targetperiod=None, intro=None, prefer=None):
+async def insert_user_info(db: AsyncConnection, user_id: int, dailytime=None, weekly=None,
+                           activity=None, targetperiod=None, intro=None, prefer=None):
     """
     새로운 user_info 레코드 삽입
     - db: SQLAlchemy DB 연결 객체
@@ -36,7 +43,7 @@ def insert_user_info(db: Connection, user_id: int, dailytime=None, weekly=None,
     - dailytime, weekly, activity, targetperiod, intro: 사용자 정보 필드
     - prefer: 선호 항목 리스트, JSON 문자열로 저장
     """
-    db.execute(
+    await db.execute(
         text(f"""
             INSERT INTO {USER_INFO_TABLE}
             (user_id, dailytime, weekly, activity, targetperiod, intro, prefer)
@@ -52,29 +59,39 @@ def insert_user_info(db: Connection, user_id: int, dailytime=None, weekly=None,
             "prefer": json.dumps(prefer or []),  # 리스트 → JSON 문자열
         }
     )
-    db.commit()  # DB 반영
+    after_commit(db, invalidate_profile, user_id)  # 커밋 후 /me 캐시 무효화
 
 # -----------------------------
 # user_info 업데이트 함수
 # -----------------------------
-def update_user_info(db: Connection, user_id: int, fields: dict, insert_if_missing=False):
+async def update_user_info(db: AsyncConnection, user_id: int, fields: dict, insert_if_missing=False):
     """
     사용자 user_info 업데이트
     - fields: 업데이트할 필드 dict
-    - insert_if_missing: True면 레코드가 없을 경우 insert 수행
+    - insert_if_missing: True면 INSERT ... ON CONFLICT 로 원자적 upsert
+    반환: 저장된 최신 행
     """
-    # 프론트에서 전달된 camelCase 키를 DB 컬럼명 snake_case로 매핑
-    if "dailyTime" in fields:
-        fields["dailytime"] = fields.pop("dailyTime")
-    if "targetPeriod" in fields:
-        fields["targetperiod"] = fields.pop("targetPeriod")
+    map_user_info_fields(fields)
 
     # 공통 update_record 사용
-    update_record(
+    return await update_record(
         db,
         table=USER_INFO_TABLE,             # 테이블 이름
         user_id=user_id,                        # 대상 사용자 ID
         fields=fields,                          # 업데이트할 필드
-        json_keys=["prefer"],                   # JSON 변환할 필드
-        insert_func=insert_user_info if insert_if_missing else None  # insert 처리 함수
+        json_keys=USER_INFO_JSON_KEYS,          # JSON 변환할 필드
+        insert_if_missing=insert_if_missing     # 없으면 upsert
     )
+
+# -----------------------------
+# camelCase → snake_case 키 매핑
+# -----------------------------
+def map_user_info_fields(fields: dict):
+    """
+    프론트에서 전달된 camelCase 키를 DB 컬럼명 snake_case로 매핑 (제자리 변경)
+    """
+    if "dailyTime" in fields:
+        fields["dailytime"] = fields.pop("dailyTime")
+    if "targetPeriod" in fields:
+        fields["targetperiod"] = fields.pop("targetPeriod")
+    return fields
@@ -1,35 +1,45 @@
 # SQLAlchemy import
+import uuid
+from datetime import datetime
+
 from sqlalchemy import text
-from sqlalchemy.engine import Connection
+from sqlalchemy.ext.asyncio import AsyncConnection
 
 # tables에 정의된 db의 테이블 불러오기
 from .tables import USERS_TABLE
 
+# users 행 변경 시 인증 사용자 캐시 무효화
+from services.cache_service import invalidate_principal, invalidate_profile
+from db.database import after_commit
+
+# 키셋 페이지네이션 / 행 수 추정 헬퍼
+from .helpers import encode_cursor, decode_cursor, estimate_count
+
 # -----------------------------
 # 이메일로 사용자 조회
 # -----------------------------
-def get_user_by_email(db: Connection, email: str):
-    row = db.execute(
+async def get_user_by_email(db: AsyncConnection, email: str):
+    row = (await db.execute(
         text(f"SELECT * FROM {USERS_TABLE} WHERE email = :email"),
         {"email": email}
-    ).mappings().first()
+    )).mappings().first()
     return dict(row) if row else None
 
 # -----------------------------
 # ID로 사용자 조회
 # -----------------------------
-def get_user_by_id(db: Connection, user_id: str):
-    row = db.execute(
+async def get_user_by_id(db: AsyncConnection, user_id: str):
+    row = (await db.execute(
         text(f"SELECT * FROM {USERS_TABLE} WHERE id = :id"),
         {"id": user_id}
-    ).mappings().first()
+    )).mappings().first()
     return dict(row) if row else None
 
 # -----------------------------
 # 새로운 사용자 삽입
 # -----------------------------
-def insert_user(db, email, name, password_hash, goal=None):
-    result = db.execute(
+async def insert_user(db, email, name, password_hash, goal=None):
+    result = await db.execute(
         text(f"""
             INSERT INTO {USERS_TABLE} (email, name, password_hash, goal)
             VALUES (:email, :name, :password, :goal)
@@ -37,13 +47,12 @@ def insert_user(db, email, name, password_hash, goal=None):
         """),
         {"email": email, "name": name, "password": password_hash, "goal": goal}
     )
-    db.commit()
     return result.scalar()
 
 # -----------------------------
 # 🔵 기본 사용자 정보 업데이트 (프론트 프로필 수정용)
 # -----------------------------
-def update_basic_user(db: Connection, user_id: str, fields: dict):
+async def update_basic_user(db: AsyncConnection, user_id: str, fields: dict):
     """
     name, email, phone, age, gender, goal, avatar 등 기본 user 테이블 업데이트
     """
@@ -54,21 +63,105 @@ def update_basic_user(db: Connection, user_id: str, fields: dict):
     params = fields.copy()
     params["id"] = user_id
 
-    db.execute(
+    await db.execute(
         text(f"UPDATE {USERS_TABLE} SET {set_clause} WHERE id = :id"),
         params
     )
-    db.commit()
+    after_commit(db, invalidate_principal, user_id)
+    after_commit(db, invalidate_profile, user_id)
 
 # -----------------------------
 # 사용자 삭제
 # -----------------------------
-def delete_user(db: Connection, user_id: str):
-    db.execute(
+async def delete_user(db: AsyncConnection, user_id: str):
+    await db.execute(
         text(f"DELETE FROM {USERS_TABLE} WHERE id = :id"),
         {"id": user_id}
     )
-    db.commit()
+    after_commit(db, invalidate_principal, user_id)
+    after_commit(db, invalidate_profile, user_id)
+
+
+# -----------------------------
+# 🔵 관리자용 사용자 목록 (키셋 페이지네이션)
+# -----------------------------
+# 목록 화면에서 쓰는 컬럼만 조회 (password_hash 제외)
+USER_LIST_COLUMNS = "id, email, name, phone, gender, goal, role, is_subscribed, created_at"
+
+# 허용 필터 → 컬럼 이름
+USER_LIST_FILTERS = ("is_subscribed", "role", "gender", "goal")
+
+# 정렬 키: created_at 은 NULL 가능 → -infinity 로 바꿔서 맨 뒤로 (NULLS LAST)
+# (행 비교 (a, b) < (c, d) 에서도 NULL 행이 빠지지 않도록 키와 커서 모두 COALESCE)
+USER_LIST_SORT_KEY = "COALESCE(created_at, '-infinity'::timestamp)"
+
+# 커서 값 타입 (created_at 이 NULL 인 행에서 끝난 페이지는 None)
+USER_LIST_CURSOR_TYPES = {"created_at": (str, type(None)), "id": str}
+
+
+async def list_users_page(db: AsyncConnection, limit: int, cursor=None, filters=None):
+    """
+    (created_at NULLS LAST, id) 내림차순 키셋 페이지네이션
+    - cursor: 이전 페이지의 next_cursor (없으면 첫 페이지)
+    - filters: {"is_subscribed": bool, "role": bool, "gender": str, "goal": str} 중 일부
+    반환: {"items": [...], "next_cursor": str | None, "total_estimate": int}
+    - 잘못된 cursor 면 ValueError
+    """
+    conditions = []
+    params = {}
+
+    for key in USER_LIST_FILTERS:
+        value = (filters or {}).get(key)
+        if value is not None:
+            conditions.append(f"{key} = :{key}")
+            params[key] = value
+
+    from_where = f"FROM {USERS_TABLE}"
+    if conditions:
+        from_where += " WHERE " + " AND ".join(conditions)
+
+    # 총 개수는 플래너 통계로 추정 (COUNT(*) 없음)
+    total_estimate = await estimate_count(db, from_where, params)
+
+    # 커서 이후 행만 조회
+    page_conditions = list(conditions)
+    page_params = dict(params)
+    if cursor:
+        values = decode_cursor(cursor, USER_LIST_CURSOR_TYPES)
+        page_conditions.append(
+            f"({USER_LIST_SORT_KEY}, id) < "
+            f"(COALESCE(CAST(:cursor_created_at AS timestamp), '-infinity'::timestamp), :cursor_id)"
+        )
+        created_at = values["created_at"]
+        page_params["cursor_created_at"] = datetime.fromisoformat(created_at) if created_at else None
+        page_params["cursor_id"] = str(uuid.UUID(values["id"]))   # 형식이 틀리면 ValueError
+
+    sql = f"SELECT {USER_LIST_COLUMNS} FROM {USERS_TABLE}"
+    if page_conditions:
+        sql += " WHERE " + " AND ".join(page_conditions)
+    sql += f" ORDER BY {USER_LIST_SORT_KEY} DESC, id DESC LIMIT :limit"
+    page_params["limit"] = limit + 1   # 다음 페이지 존재 여부 확인용 1개 더
+
+    # 응답에서 바로 orjson 직렬화되도록 dict 로 한 번만 변환
+    rows = [dict(row) for row in (await db.execute(text(sql), page_params)).mappings()]
+
+    has_more = len(rows) > limit
+    rows = rows[:limit]
+
+    next_cursor = None
+    if has_more:
+        last = rows[-1]
+        created_at = last["created_at"]
+        next_cursor = encode_cursor({
+            "created_at": created_at.isoformat() if created_at else None,
+            "id": str(last["id"]),
+        })
+
+    return {
+        "items": rows,
+        "next_cursor": next_cursor,
+        "total_estimate": total_estimate,
+    }
 
 
 # =============================
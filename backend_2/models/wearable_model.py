@@ -0,0 +1,333 @@
+# ============================================
+# 🚀 wearable_model.py — 웨어러블(HealthKit) 데이터
+# ============================================
+
+import hashlib
+import json
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncConnection
+
+# 테이블 이름 불러오기
+from .tables import (
+    WEARABLE_DATA_TABLE,
+    WEARABLE_SYNC_ANCHORS_TABLE,
+    WEARABLE_ROLLUPS_TABLE,
+    WEARABLE_ANOMALIES_TABLE,
+)
+
+# timestamp 컬럼 바인딩용 시각 변환
+from .helpers import to_naive_utc
+
+# 한 문장에 넣을 최대 행 수 (행당 파라미터 8개 → asyncpg 파라미터 한도 32767 이내)
+INSERT_CHUNK_ROWS = 1000
+
+WEARABLE_COLUMNS = (
+    "steps", "heart_rate", "sleep_minutes", "calories_active", "recorded_at", "raw_json", "sample_hash"
+)
+
+# 일별 / 주별 집계 대상 지표 (raw_json 의 HealthData 필드 이름)
+ROLLUP_METRICS = (
+    "steps", "distance", "flights", "activeEnergy", "exerciseTime",
+    "heartRate", "restingHeartRate", "walkingHeartRate", "hrv", "sleepHours",
+    "weight", "height", "bmi", "bodyFat", "leanBody",
+    "systolic", "diastolic", "glucose", "oxygen", "calories", "water",
+)
+ROLLUP_GRANULARITIES = ("day", "week")
+
+# 실측값이 0 일 수 없는 지표 (활력 징후 / 신체 계측)
+# 배치 샘플이 미측정을 0 으로 저장하던 때의 행이 남아 있으므로 이 지표의 0 은 집계에서 제외한다.
+# 그 외 지표(걸음 수, 수면 등)의 0 은 실측값으로 집계한다.
+# (db/migrations/004, 011 의 backfill 도 같은 규칙)
+NONZERO_METRICS = (
+    "heartRate", "restingHeartRate", "walkingHeartRate", "hrv",
+    "weight", "height", "bmi", "leanBody",
+    "systolic", "diastolic", "glucose", "oxygen",
+)
+
+
+# --------------------------------------------
+# 🔄 HealthKit 샘플 → wearable_data 행
+# --------------------------------------------
+def map_health_sample(sample: dict):
+    """
+    HealthSample dict (camelCase) → wearable_data 컬럼 dict
+    - 전용 컬럼이 없는 지표(hrv, systolic 등)는 raw_json 에 그대로 보관
+    - 샘플에 없는 지표(None)는 raw_json 에서 빼고 전용 컬럼은 NULL
+    - recordedAt 은 UTC 기준 timestamp (tz 정보 제거)
+    - sample_hash: 측정 시각 + 값 전체의 SHA-256 (중복 샘플 판별용 자연 키)
+    """
+    raw = {key: value for key, value in sample.items() if value is not None}
+    recorded_at = to_naive_utc(raw.pop("recordedAt"))
+
+    raw_json = json.dumps(raw, sort_keys=True)
+    sample_hash = hashlib.sha256(f"{recorded_at.isoformat()}|{raw_json}".encode("utf-8")).hexdigest()
+
+    sleep_hours = raw.get("sleepHours")
+    return {
+        "steps": int(raw["steps"]) if raw.get("steps") is not None else None,
+        "heart_rate": int(round(raw["heartRate"])) if raw.get("heartRate") is not None else None,
+        "sleep_minutes": int(round(sleep_hours * 60)) if sleep_hours is not None else None,
+        "calories_active": raw.get("activeEnergy"),
+        "recorded_at": recorded_at,
+        "raw_json": raw_json,
+        "sample_hash": sample_hash,
+    }
+
+
+# --------------------------------------------
+# 🟩 여러 건 저장 (multi-row INSERT, INSERT_CHUNK_ROWS 씩)
+# --------------------------------------------
+# 같은 샘플을 다시 보내도 (user_id, source, sample_hash) 충돌로 버려진다.
+# (db/migrations/003_wearable_sync.sql 의 UNIQUE 인덱스 필요)
+#
+# 새로 삽입된 행(RETURNING)만 같은 문장에서 일별 / 주별 버킷으로 묶어
+# wearable_rollups 에 누적한다 → 이번 배치가 건드린 버킷만 갱신, 과거 재계산 없음.
+# - 버킷 날짜는 UTC 가 아니라 :tz (사용자 현지 시간대) 기준 날짜 / 주(월요일 시작)
+#   → KST 00:00~09:00 샘플이 전날로 집계되지 않음
+# - 샘플에 없는 지표는 raw_json 에 키가 없으므로 집계에 들어가지 않는다
+#   (0 은 NONZERO_METRICS 만 제외, 나머지는 실측값으로 집계)
+# (db/migrations/004_wearable_rollups.sql 필요)
+INSERT_WITH_ROLLUP_SQL = """
+    WITH ins AS (
+        INSERT INTO {data_table}
+        (user_id, source, {columns})
+        VALUES {values}
+        ON CONFLICT (user_id, source, sample_hash) DO NOTHING
+        RETURNING user_id, recorded_at, raw_json
+    ),
+    samples AS (
+        SELECT user_id, metric, local_at, value
+        FROM (
+            SELECT ins.user_id, m.key AS metric,
+                   ins.recorded_at AT TIME ZONE 'UTC' AT TIME ZONE CAST(:tz AS TEXT) AS local_at,
+                   CASE WHEN jsonb_typeof(m.value) = 'number' THEN (m.value #>> '{{}}')::float8 END AS value
+            FROM ins
+            CROSS JOIN LATERAL jsonb_each(ins.raw_json) AS m (key, value)
+            WHERE m.key = ANY(CAST(:metrics AS TEXT[]))
+        ) v
+        WHERE value IS NOT NULL
+          AND NOT (value = 0 AND metric = ANY(CAST(:nonzero_metrics AS TEXT[])))
+    ),
+    buckets AS (
+        SELECT user_id, metric, 'day' AS granularity, local_at::date AS bucket_start, value
+        FROM samples
+        UNION ALL
+        SELECT user_id, metric, 'week', date_trunc('week', local_at)::date, value
+        FROM samples
+    ),
+    rolled AS (
+        INSERT INTO {rollups_table} AS r
+        (user_id, metric, granularity, bucket_start, sum_value, min_value, max_value, sample_count, updated_at)
+        SELECT user_id, metric, granularity, bucket_start, SUM(value), MIN(value), MAX(value), COUNT(*), NOW()
+        FROM buckets
+        GROUP BY user_id, metric, granularity, bucket_start
+        ON CONFLICT (user_id, metric, granularity, bucket_start) DO UPDATE SET
+            sum_value = r.sum_value + EXCLUDED.sum_value,
+            min_value = LEAST(r.min_value, EXCLUDED.min_value),
+            max_value = GREATEST(r.max_value, EXCLUDED.max_value),
+            sample_count = r.sample_count + EXCLUDED.sample_count,
+            updated_at = NOW()
+    )
+    SELECT COUNT(*) AS inserted FROM ins
+"""
+
+
+async def insert_wearable_rows(db: AsyncConnection, user_id, source: str, rows: list, tz: str = "UTC"):
+    """
+    wearable_data 에 map_health_sample 결과 여러 건 삽입 (commit 은 호출한 쪽에서)
+    - 이미 저장된 샘플은 ON CONFLICT DO NOTHING 으로 건너뜀
+    - 새로 삽입된 샘플만 wearable_rollups 일별 / 주별 버킷에 누적
+    - tz: 버킷 날짜를 나눌 시간대 (IANA 이름, 예: "Asia/Seoul")
+    반환: 새로 삽입된 행 수
+    """
+    inserted = 0
+    for start in range(0, len(rows), INSERT_CHUNK_ROWS):
+        chunk = rows[start:start + INSERT_CHUNK_ROWS]
+
+        values = []
+        params = {
+            "user_id": user_id,
+            "source": source,
+            "tz": tz,
+            "metrics": list(ROLLUP_METRICS),
+            "nonzero_metrics": list(NONZERO_METRICS),
+        }
+        for i, row in enumerate(chunk):
+            values.append(
+                f"(:user_id, :source, :steps_{i}, :heart_rate_{i}, :sleep_minutes_{i}, "
+                f":calories_active_{i}, :recorded_at_{i}, CAST(:raw_json_{i} AS JSONB), :sample_hash_{i})"
+            )
+            for col in WEARABLE_COLUMNS:
+                params[f"{col}_{i}"] = row[col]
+
+        result = await db.execute(
+            text(INSERT_WITH_ROLLUP_SQL.format(
+                data_table=WEARABLE_DATA_TABLE,
+                rollups_table=WEARABLE_ROLLUPS_TABLE,
+                columns=", ".join(WEARABLE_COLUMNS),
+                values=", ".join(values),
+            )),
+            params
+        )
+        inserted += result.scalar_one()
+
+    return inserted
+
+
+# --------------------------------------------
+# 🟦 동기화 앵커 조회
+# --------------------------------------------
+async def get_sync_anchor(db: AsyncConnection, user_id, source: str):
+    """사용자 / source 의 마지막 수신 시각 (없으면 None)"""
+    return (await db.execute(
+        text(f"""
+            SELECT source, last_recorded_at, last_sample_hash, updated_at
+            FROM {WEARABLE_SYNC_ANCHORS_TABLE}
+            WHERE user_id = :user_id AND source = :source
+        """),
+        {"user_id": user_id, "source": source}
+    )).mappings().first()
+
+
+# --------------------------------------------
+# 🟩 동기화 앵커 갱신 (앞으로만 이동)
+# --------------------------------------------
+async def advance_sync_anchor(db: AsyncConnection, user_id, source: str, rows: list):
+    """
+    이번 배치에서 가장 늦은 샘플로 앵커를 옮긴다 (commit 은 호출한 쪽에서)
+    - 늦게 도착한 과거 샘플로는 앵커가 뒤로 가지 않음
+    반환: 갱신 후 앵커 행 (rows 가 비었으면 현재 앵커)
+    """
+    if not rows:
+        return await get_sync_anchor(db, user_id, source)
+
+    latest = max(rows, key=lambda r: (r["recorded_at"], r["sample_hash"]))
+
+    return (await db.execute(
+        text(f"""
+            INSERT INTO {WEARABLE_SYNC_ANCHORS_TABLE} AS a
+            (user_id, source, last_recorded_at, last_sample_hash, updated_at)
+            VALUES (:user_id, :source, :recorded_at, :sample_hash, NOW())
+            ON CONFLICT (user_id, source) DO UPDATE SET
+                last_sample_hash = CASE
+                    WHEN EXCLUDED.last_recorded_at >= a.last_recorded_at THEN EXCLUDED.last_sample_hash
+                    ELSE a.last_sample_hash
+                END,
+                last_recorded_at = GREATEST(a.last_recorded_at, EXCLUDED.last_recorded_at),
+                updated_at = NOW()
+            RETURNING source, last_recorded_at, last_sample_hash, updated_at
+        """),
+        {
+            "user_id": user_id,
+            "source": source,
+            "recorded_at": latest["recorded_at"],
+            "sample_hash": latest["sample_hash"],
+        }
+    )).mappings().first()
+
+
+# --------------------------------------------
+# 🟦 일별 / 주별 추이 조회 (rollup 테이블만 읽음)
+# --------------------------------------------
+async def get_rollups(db: AsyncConnection, user_id, metric: str, granularity: str, since, until):
+    """
+    [since, until] 구간의 버킷 목록 (bucket_start 오름차순)
+    반환: [{"bucket_start", "sum", "min", "max", "avg", "count"}]
+    """
+    rows = (await db.execute(
+        text(f"""
+            SELECT bucket_start,
+                   sum_value AS sum,
+                   min_value AS min,
+                   max_value AS max,
+                   sum_value / sample_count AS avg,
+                   sample_count AS count
+            FROM {WEARABLE_ROLLUPS_TABLE}
+            WHERE user_id = :user_id
+              AND metric = :metric
+              AND granularity = :granularity
+              AND bucket_start BETWEEN :since AND :until
+            ORDER BY bucket_start
+        """),
+        {"user_id": user_id, "metric": metric, "granularity": granularity, "since": since, "until": until}
+    )).mappings()
+    return [dict(row) for row in rows]   # 응답에서 바로 orjson 직렬화되도록 dict 로 한 번만 변환
+
+
+# --------------------------------------------
+# 🟦 활력 징후 시계열 조회 (전체 사용자, 이상치 배치용)
+# --------------------------------------------
+async def fetch_vitals(db: AsyncConnection, metrics: tuple, since):
+    """
+    since 이후 전체 사용자의 지표 값 (raw_json 에서 추출, 숫자가 아니면 NULL)
+    반환: (user_id, recorded_at, metric1, metric2, ...) 행 리스트 (user_id, recorded_at 순)
+    """
+    columns = ",\n".join(
+        f"CASE WHEN jsonb_typeof(raw_json -> '{m}') = 'number' "
+        f"THEN (raw_json ->> '{m}')::float8 END AS \"{m}\""
+        for m in metrics
+    )
+    return (await db.execute(
+        text(f"""
+            SELECT user_id, recorded_at,
+                   {columns}
+            FROM {WEARABLE_DATA_TABLE}
+            WHERE recorded_at >= :since
+            ORDER BY user_id, recorded_at
+        """),
+        {"since": since}
+    )).all()
+
+
+# --------------------------------------------
+# 🟩 이상치 플래그 저장 (multi-row INSERT, 중복 무시)
+# --------------------------------------------
+ANOMALY_COLUMNS = ("user_id", "metric", "recorded_at", "value", "baseline_median", "baseline_mad", "z_score", "reason")
+
+
+async def insert_anomalies(db: AsyncConnection, flags: list):
+    """
+    wearable_anomalies 에 플래그 삽입 (commit 은 호출한 쪽에서)
+    반환: 새로 삽입된 행 수
+    """
+    inserted = 0
+    for start in range(0, len(flags), INSERT_CHUNK_ROWS):
+        chunk = flags[start:start + INSERT_CHUNK_ROWS]
+
+        values = []
+        params = {}
+        for i, flag in enumerate(chunk):
+            values.append("(" + ", ".join(f":{col}_{i}" for col in ANOMALY_COLUMNS) + ")")
+            for col in ANOMALY_COLUMNS:
+                params[f"{col}_{i}"] = flag[col]
+
+        result = await db.execute(
+            text(f"""
+                INSERT INTO {WEARABLE_ANOMALIES_TABLE}
+                ({", ".join(ANOMALY_COLUMNS)})
+                VALUES {", ".join(values)}
+                ON CONFLICT (user_id, metric, recorded_at) DO NOTHING
+            """),
+            params
+        )
+        inserted += result.rowcount
+
+    return inserted
+
+
+# --------------------------------------------
+# 🟦 사용자 이상치 플래그 조회
+# --------------------------------------------
+async def get_anomalies(db: AsyncConnection, user_id, since, limit: int = 200):
+    rows = (await db.execute(
+        text(f"""
+            SELECT metric, recorded_at, value, baseline_median, z_score, reason, detected_at
+            FROM {WEARABLE_ANOMALIES_TABLE}
+            WHERE user_id = :user_id AND recorded_at >= :since
+            ORDER BY recorded_at DESC
+            LIMIT :limit
+        """),
+        {"user_id": user_id, "since": since, "limit": limit}
+    )).mappings()
+    return [dict(row) for row in rows]
@@ -1,10 +1,13 @@
-from fastapi import APIRouter, Depends, HTTPException, Body
-from sqlalchemy.orm import Session
-from sqlalchemy import text
-from db.database import get_db
-from services.oauth2_service import admin_required
+from datetime import datetime
+from typing import Optional
 
-LOGS_TABLE = "admin_logs"
+from fastapi import APIRouter, Depends, HTTPException, Body, Query
+from sqlalchemy.ext.asyncio import AsyncConnection
+from db.database import get_db, unit_of_work
+from services.oauth2_service import admin_required
+from models.admin_log_model import list_logs_page
+from services.audit_service import audit_buffer, make_entry, write_audit_now
+from services.json_service import ORJSONResponse
 
 router = APIRouter(
     prefix="/admin/logs",
@@ -12,39 +15,64 @@ router = APIRouter(
 )
 
 # ============================================
-# 📌 로그 조회
-#    GET /admin/logs
+# 📌 로그 조회 (키셋 페이지네이션)
+#    GET /admin/logs?limit=50&cursor=...&action=DELETE_USER&since=2025-01-01T00:00:00
 # ============================================
 @router.get("/")
-def get_logs(
-    db: Session = Depends(get_db),
+async def get_logs(
+    limit: int = Query(50, ge=1, le=200),
+    cursor: Optional[str] = None,
+    admin_email: Optional[str] = None,
+    action: Optional[str] = None,
+    target_user_id: Optional[str] = None,
+    since: Optional[datetime] = None,
+    until: Optional[datetime] = None,
+    db: AsyncConnection = Depends(get_db),
     admin = Depends(admin_required)
 ):
-    rows = db.execute(text(f"""
-        SELECT * FROM {LOGS_TABLE}
-        ORDER BY timestamp DESC
-    """)).mappings().all()
+    try:
+        page = await list_logs_page(
+            db,
+            limit=limit,
+            cursor=cursor,
+            filters={
+                "admin_email": admin_email,
+                "action": action,
+                "target_user_id": target_user_id,
+                "since": since,
+                "until": until,
+            }
+        )
+    except (ValueError, KeyError):
+        raise HTTPException(status_code=400, detail="잘못된 cursor 값입니다.")
 
-    return [dict(row) for row in rows]
+    # 행 dict 목록을 jsonable_encoder 없이 바로 직렬화
+    return ORJSONResponse(page)
 
 
 # ============================================
 # 📌 로그 저장
-#    POST /admin/logs
+#    POST /admin/logs          → 버퍼에 넣고 배치로 저장
+#    POST /admin/logs?sync=true → 즉시 INSERT + commit
 # ============================================
 @router.post("/")
-def create_log(
+async def create_log(
     data: dict = Body(...),
-    db: Session = Depends(get_db),
+    sync: bool = False,
+    db: AsyncConnection = Depends(get_db),
     admin = Depends(admin_required)
 ):
-    query = text(f"""
-        INSERT INTO {LOGS_TABLE}
-        (admin_email, action, target_user_id, target_user_email, timestamp)
-        VALUES (:admin_email, :action, :target_user_id, :target_user_email, NOW())
-    """)
-
-    db.execute(query, data)
-    db.commit()
+    entry = make_entry(
+        data.get("admin_email"),
+        data.get("action"),
+        data.get("target_user_id"),
+        data.get("target_user_email"),
+    )
+
+    if sync:
+        async with unit_of_work(db):
+            await write_audit_now(db, entry)
+    else:
+        await audit_buffer.add(entry)
 
     return {"message": "log created", "data": data}
@@ -0,0 +1,99 @@
+# ============================================
+# 📚 운동 카탈로그 API
+# ============================================
+# 메모리 스냅샷(catalog_service)만 읽는다 → DB 접근 없음
+# 응답에 strong ETag 를 붙이고, If-None-Match 가 같으면 304 (본문 없음)
+
+from typing import Optional
+
+from fastapi import APIRouter, HTTPException, Request, Response
+
+from services.catalog_service import get_catalog
+from services.compression_service import choose_encoding
+from services.json_service import ORJSONResponse
+
+router = APIRouter(tags=["exercise"])
+
+
+def _snapshot():
+    catalog = get_catalog()
+    if catalog is None:
+        raise HTTPException(status_code=503, detail="운동 카탈로그를 불러오는 중입니다. 잠시 후 다시 시도해주세요.")
+    return catalog
+
+
+def _etag_matches(if_none_match: Optional[str], etag: str):
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    # If-None-Match 는 약한 비교 (W/ 접두어 무시)
+    for tag in if_none_match.split(","):
+        tag = tag.strip()
+        if tag.startswith("W/"):
+            tag = tag[2:]
+        if tag == etag:
+            return True
+    return False
+
+
+def _cached_response(request: Request, body: bytes, etag: str, content_encoding: Optional[str]):
+    headers = {
+        "ETag": etag,
+        "Cache-Control": "no-cache",     # 매번 ETag 로 재검증
+        "Vary": "Accept-Encoding",
+    }
+    if _etag_matches(request.headers.get("if-none-match"), etag):
+        return Response(status_code=304, headers=headers)
+
+    if content_encoding:
+        headers["Content-Encoding"] = content_encoding
+    return Response(content=body, media_type="application/json", headers=headers)
+
+
+# ============================================
+# 📌 운동 목록
+#    GET /web/exercises?category=하체&difficulty=2&posture=서기
+#    필터는 미리 만든 인덱스의 교집합으로 처리
+# ============================================
+@router.get("")
+async def list_exercise_catalog(
+    request: Request,
+    category: Optional[str] = None,
+    difficulty: Optional[int] = None,
+    posture: Optional[str] = None,
+):
+    catalog = _snapshot()
+    filters = {
+        "category": category,
+        "difficulty": str(difficulty) if difficulty is not None else None,
+        "posture": posture,
+    }
+    body, etag, content_encoding = catalog.list_response(
+        filters, choose_encoding(request.headers.get("accept-encoding"))
+    )
+    return _cached_response(request, body, etag, content_encoding)
+
+
+# ============================================
+# 📌 필터 값 목록 (카테고리 / 난이도 / 자세)
+#    GET /web/exercises/facets
+# ============================================
+@router.get("/facets")
+async def exercise_facets():
+    catalog = _snapshot()
+    return ORJSONResponse({"version": catalog.version, **catalog.facets()})
+
+
+# ============================================
+# 📌 운동 1건
+#    GET /web/exercises/{exercise_id}
+# ============================================
+@router.get("/{exercise_id}")
+async def get_exercise_detail(request: Request, exercise_id: str):
+    response = _snapshot().item_response(
+        exercise_id.lower(), choose_encoding(request.headers.get("accept-encoding"))
+    )
+    if response is None:
+        raise HTTPException(status_code=404, detail="운동을 찾을 수 없습니다.")
+    return _cached_response(request, *response)
@@ -0,0 +1,144 @@
+# ============================================
+# 📡 실시간 운동 세션 (WebSocket)
+# ============================================
+# 연결: ws://.../web/live/session?token=<JWT>&exercise_id=<uuid>[&routine_id=<uuid>&step=0&fps=30&dims=2]
+#
+# 클라이언트 → 서버
+#   - 바이너리: float32 키포인트 (n × 17 × dims, little-endian) ← 권장
+#   - {"type": "frames", "keypoints": [[[x, y], ...17], ...], "confidence": [[...17], ...]}
+#   - {"type": "step", "current_step": 2}          (루틴의 다음 운동으로 이동)
+#   - {"type": "end", "status": "FINISHED" | "CANCELED"}
+# 서버 → 클라이언트
+#   - {"type": "reps", "reps", "new_reps", "set_number", "set_reps", "sets_finished", "score", "feedback"}
+#   - {"type": "error", "detail"}
+#
+# user_routine_progress 는 세트가 끝날 때 / 세션이 끝날 때만 저장한다 (프레임마다 DB 쓰기 없음).
+
+import json
+import uuid
+from typing import Optional
+
+from fastapi import APIRouter, WebSocket, WebSocketDisconnect, HTTPException, status
+
+from db.database import async_engine
+from models.exercise_model import get_exercise_by_id
+from models.routine_progress_model import (
+    save_routine_progress,
+    PROGRESS_IN_PROGRESS,
+    PROGRESS_CANCELED,
+    PROGRESS_FINISHED,
+)
+from services.oauth2_service import get_current_user
+from services.live_service import LiveSession, decode_binary_frames
+from services.log_service import get_logger
+
+logger = get_logger("live")
+
+# -----------------------------
+# 라우터 생성
+# -----------------------------
+router = APIRouter(
+    prefix="/web/live",
+    tags=["Live"]
+)
+
+
+async def _save_progress(user_id, routine_id, step: int, current_set: int, progress_status: str):
+    """세트 종료 시 진행 상황 저장 (실패해도 세션은 계속)"""
+    try:
+        async with async_engine.begin() as db:
+            await save_routine_progress(db, user_id, routine_id, step, current_set, progress_status)
+    except Exception:
+        logger.exception("live_progress_save_failed", extra={"fields": {"user_id": user_id, "routine_id": routine_id}})
+
+
+@router.websocket("/session")
+async def live_session(
+    websocket: WebSocket,
+    token: str,
+    exercise_id: str,
+    routine_id: Optional[str] = None,
+    step: int = 0,
+    fps: float = 30.0,
+    dims: int = 2
+):
+    # ----------------------------------------
+    # 1) 인증 / 운동 확인 (DB 연결은 여기서만 잠깐 사용)
+    # ----------------------------------------
+    try:
+        uuid.UUID(exercise_id)
+        if routine_id is not None:
+            uuid.UUID(routine_id)
+        if not 1 <= fps <= 120 or dims not in (2, 3):
+            raise ValueError("fps / dims")
+
+        async with async_engine.connect() as db:
+            user = await get_current_user(token=token, db=db)
+            exercise = await get_exercise_by_id(db, exercise_id)
+    except (ValueError, HTTPException):
+        await websocket.close(code=status.WS_1008_POLICY_VIOLATION)
+        return
+
+    if exercise is None:
+        await websocket.close(code=status.WS_1008_POLICY_VIOLATION)
+        return
+
+    await websocket.accept()
+    session = LiveSession(exercise["name"], fps)
+    end_status = None
+
+    # ----------------------------------------
+    # 2) 프레임 수신 → rep / 피드백 즉시 응답
+    # ----------------------------------------
+    try:
+        while True:
+            message = await websocket.receive()
+            if message["type"] == "websocket.disconnect":
+                break
+
+            try:
+                if message.get("bytes") is not None:
+                    reply = session.feed(decode_binary_frames(message["bytes"], dims))
+                else:
+                    data = json.loads(message.get("text") or "{}")
+                    kind = data.get("type")
+                    if kind == "frames":
+                        reply = session.feed(data["keypoints"], data.get("confidence"))
+                    elif kind == "step":
+                        step = int(data["current_step"])
+                        reply = {"type": "step", "current_step": step}
+                    elif kind == "end":
+                        end_status = data.get("status", PROGRESS_FINISHED)
+                        if end_status not in (PROGRESS_FINISHED, PROGRESS_CANCELED):
+                            end_status = PROGRESS_FINISHED
+                        break
+                    else:
+                        reply = {"type": "error", "detail": "알 수 없는 메시지 type 입니다."}
+            except (ValueError, KeyError, TypeError, IndexError) as exc:
+                reply = {"type": "error", "detail": str(exc)}
+
+            # 세트가 끝났을 때만 진행 상황 저장
+            if routine_id and reply.get("sets_finished"):
+                await _save_progress(user["id"], routine_id, step, session.counter.set_number, PROGRESS_IN_PROGRESS)
+
+            await websocket.send_json(reply)
+    except WebSocketDisconnect:
+        pass
+
+    # ----------------------------------------
+    # 3) 종료: 진행 중 세트 마감 후 저장
+    #    (finish() 후 set_number 는 다음 세트 번호 → 마감된 세트 수를 저장)
+    # ----------------------------------------
+    last_set = session.finish()
+    if routine_id and (last_set or end_status):
+        await _save_progress(
+            user["id"], routine_id, step, session.counter.sets_completed, end_status or PROGRESS_IN_PROGRESS
+        )
+
+    logger.info("live_session_closed", extra={"fields": {
+        "user_id": user["id"], "exercise": exercise["name"],
+        "reps": session.counter.reps, "status": end_status,
+    }})
+
+    if end_status is not None:
+        await websocket.close()
@@ -0,0 +1,65 @@
+# ============================================
+# 📊 운영 지표 API (관리자 전용)
+# ============================================
+
+from fastapi import APIRouter, Depends
+
+from services.oauth2_service import admin_required
+from services.hashing_service import get_hash_stats
+from services.cache_service import principal_cache, profile_cache
+from services.analysis_service import get_analysis_stats
+from services.catalog_service import get_catalog_stats
+
+
+# ============================================
+# 📌 라우터 설정
+# ============================================
+router = APIRouter(
+    prefix="/metrics",
+    tags=["admin metrics"]
+)
+
+
+# ============================================
+# 📌 bcrypt 해싱 풀 상태
+#    GET /admin/metrics/hashing
+# ============================================
+@router.get("/hashing")
+async def hashing_metrics(admin=Depends(admin_required)):
+    return get_hash_stats()
+
+
+# ============================================
+# 📌 인증 사용자(principal) 캐시 hit / miss
+#    GET /admin/metrics/principal-cache
+# ============================================
+@router.get("/principal-cache")
+async def principal_cache_metrics(admin=Depends(admin_required)):
+    return principal_cache.stats()
+
+
+# ============================================
+# 📌 프로필(/web/users/me) 캐시 hit / miss
+#    GET /admin/metrics/profile-cache
+# ============================================
+@router.get("/profile-cache")
+async def profile_cache_metrics(admin=Depends(admin_required)):
+    return profile_cache.stats()
+
+
+# ============================================
+# 📌 영상 분석 작업 큐 상태
+#    GET /admin/metrics/analysis
+# ============================================
+@router.get("/analysis")
+async def analysis_metrics(admin=Depends(admin_required)):
+    return await get_analysis_stats()
+
+
+# ============================================
+# 📌 운동 카탈로그 스냅샷 상태
+#    GET /admin/metrics/catalog
+# ============================================
+@router.get("/catalog")
+async def catalog_metrics(admin=Depends(admin_required)):
+    return get_catalog_stats()
@@ -2,14 +2,28 @@
 # 🛠 관리자 전용 API (Admin Router)
 # ============================================
 
-from fastapi import APIRouter, Depends, HTTPException, Body
-from sqlalchemy.orm import Session
+from typing import Optional
+
+from fastapi import APIRouter, Depends, HTTPException, Body, Query
+from sqlalchemy.ext.asyncio import AsyncConnection
 from sqlalchemy import text
 from pydantic import BaseModel
 
-from db.database import get_db
+from db.database import get_db, unit_of_work, after_commit
 from services.oauth2_service import admin_required
-from models.users_model import USERS_TABLE
+from models.users_model import USERS_TABLE, list_users_page
+from services.cache_service import invalidate_principal, invalidate_profile
+from services.log_service import get_logger
+from services.json_service import ORJSONResponse
+from services.audit_service import (
+    make_entry,
+    write_audit_now,
+    ACTION_DELETE_USER,
+    ACTION_CHANGE_ROLE,
+    ACTION_CHANGE_SUBSCRIPTION,
+)
+
+logger = get_logger("admin")
 
 
 # ============================================
@@ -28,67 +42,106 @@ router = APIRouter(
 
 
 # ============================================
-# 📌 1) 전체 사용자 조회
+# 📌 1) 전체 사용자 조회 (키셋 페이지네이션)
+#    GET /admin/users?limit=50&cursor=...&is_subscribed=true&role=admin
 # ============================================
 @router.get("/users")
-def get_all_users(
-    db: Session = Depends(get_db),
+async def get_all_users(
+    limit: int = Query(50, ge=1, le=200),
+    cursor: Optional[str] = None,
+    is_subscribed: Optional[bool] = None,
+    role: Optional[str] = None,
+    gender: Optional[str] = None,
+    goal: Optional[str] = None,
+    db: AsyncConnection = Depends(get_db),
     admin=Depends(admin_required)
 ):
-    print("\n🟦 [ADMIN] 전체 사용자 조회 요청")
-
-    rows = db.execute(text(f"SELECT * FROM {USERS_TABLE}")).mappings().all()
-    print(f"🟩 [ADMIN] 조회된 사용자 수: {len(rows)}")
-
-    return [dict(row) for row in rows]
+    # role 문자열 → boolean 맵핑 (역할 변경 API와 동일)
+    role_value = None
+    if role is not None:
+        if role not in ("admin", "user"):
+            raise HTTPException(status_code=400, detail="role 값은 admin 또는 user만 가능합니다.")
+        role_value = role == "admin"
+
+    try:
+        page = await list_users_page(
+            db,
+            limit=limit,
+            cursor=cursor,
+            filters={
+                "is_subscribed": is_subscribed,
+                "role": role_value,
+                "gender": gender,
+                "goal": goal,
+            }
+        )
+    except (ValueError, KeyError):
+        raise HTTPException(status_code=400, detail="잘못된 cursor 값입니다.")
+
+    logger.info("list_users", extra={"fields": {"admin": admin["email"], "count": len(page["items"])}})
+
+    # 행 dict 목록을 jsonable_encoder 없이 바로 직렬화
+    return ORJSONResponse(page)
 
 
 # ============================================
 # 📌 2) 특정 사용자 조회
 # ============================================
 @router.get("/users/{user_id}")
-def get_user_detail(
+async def get_user_detail(
     user_id: str,
-    db: Session = Depends(get_db),
+    db: AsyncConnection = Depends(get_db),
     admin=Depends(admin_required)
 ):
-    print(f"\n🟦 [ADMIN] 특정 사용자 조회 요청 → ID: {user_id}")
-
-    row = db.execute(
+    row = (await db.execute(
         text(f"SELECT * FROM {USERS_TABLE} WHERE id = :id"),
         {"id": user_id}
-    ).mappings().first()
+    )).mappings().first()
 
-    print(f"🟩 [ADMIN] 조회 결과: {row}")
+    logger.info("get_user", extra={"fields": {"admin": admin["email"], "user_id": user_id, "found": row is not None}})
 
     if not row:
         raise HTTPException(status_code=404, detail="사용자를 찾을 수 없습니다.")
 
-    return dict(row)
+    return ORJSONResponse(dict(row))
 
 
 # ============================================
 # 📌 3) 구독 상태 변경
+#    감사 로그는 같은 트랜잭션에서 함께 저장
 # ============================================
 @router.post("/users/{user_id}/subscription")
-def admin_change_subscription(
+async def admin_change_subscription(
     user_id: str,
     is_subscribed: bool,
-    db: Session = Depends(get_db),
+    db: AsyncConnection = Depends(get_db),
     admin=Depends(admin_required)
 ):
-    print(f"\n🟦 [ADMIN] 구독 상태 변경 요청 → ID: {user_id}, 상태: {is_subscribed}")
-
     update_query = text(f"""
         UPDATE {USERS_TABLE}
         SET is_subscribed = :sub
         WHERE id = :id
+        RETURNING email
     """)
 
-    result = db.execute(update_query, {"sub": is_subscribed, "id": user_id})
-    db.commit()
-
-    print(f"🟩 [ADMIN] 구독 상태 변경 rowcount: {result.rowcount}")
+    async with unit_of_work(db):
+        target = (await db.execute(update_query, {"sub": is_subscribed, "id": user_id})).first()
+        if target is None:
+            # 대상이 없으면 감사 로그 없이 404 (삭제 / 권한 변경과 동일)
+            logger.info("change_subscription", extra={"fields": {
+                "admin": admin["email"], "user_id": user_id, "found": False
+            }})
+            raise HTTPException(status_code=404, detail="해당 유저를 찾을 수 없습니다.")
+
+        await write_audit_now(db, make_entry(
+            admin["email"], ACTION_CHANGE_SUBSCRIPTION, user_id, target.email
+        ))
+        after_commit(db, invalidate_principal, user_id)
+
+    logger.info("change_subscription", extra={"fields": {
+        "admin": admin["email"], "user_id": user_id,
+        "is_subscribed": is_subscribed, "found": True
+    }})
 
     return {
         "message": f"구독을 {'활성화' if is_subscribed else '취소'}했습니다.",
@@ -99,22 +152,27 @@ def admin_change_subscription(
 
 # ============================================
 # 📌 4) 회원 삭제
+#    감사 로그는 같은 트랜잭션에서 함께 저장
 # ============================================
 @router.delete("/users/{user_id}")
-def delete_user(
+async def delete_user(
     user_id: str,
-    db: Session = Depends(get_db),
+    db: AsyncConnection = Depends(get_db),
     admin=Depends(admin_required)
 ):
-    print(f"\n🟦 [ADMIN] 회원 삭제 요청 → ID: {user_id}")
-
-    delete_query = text(f"DELETE FROM {USERS_TABLE} WHERE id = :id")
-    result = db.execute(delete_query, {"id": user_id})
-    db.commit()
-
-    print(f"🟩 [ADMIN] 삭제 rowcount: {result.rowcount}")
-
-    if result.rowcount == 0:
+    delete_query = text(f"DELETE FROM {USERS_TABLE} WHERE id = :id RETURNING email")
+    async with unit_of_work(db):
+        target = (await db.execute(delete_query, {"id": user_id})).first()
+        if target:
+            await write_audit_now(db, make_entry(
+                admin["email"], ACTION_DELETE_USER, user_id, target.email
+            ))
+        after_commit(db, invalidate_principal, user_id)
+        after_commit(db, invalidate_profile, user_id)
+
+    logger.info("delete_user", extra={"fields": {"admin": admin["email"], "user_id": user_id, "found": target is not None}})
+
+    if target is None:
         raise HTTPException(status_code=404, detail="해당 회원이 존재하지 않습니다.")
 
     return {
@@ -127,14 +185,12 @@ def delete_user(
 # 📌 5) 관리자 승급 / 강등
 # ============================================
 @router.patch("/users/{user_id}/role")
-def promote_user(
+async def promote_user(
     user_id: str,
     data: RoleUpdate,     
-    db: Session = Depends(get_db),
+    db: AsyncConnection = Depends(get_db),
     admin=Depends(admin_required)
 ):
-    print(f"\n🟦 [ADMIN] 역할 변경 요청 → ID: {user_id}, 변경할 role: {data.role}")
-
     # ======================================
     # 🔥 문자열 role → boolean 맵핑 처리
     # DB의 role 컬럼 타입은 boolean 이므로 변환 필요
@@ -150,18 +206,27 @@ def promote_user(
         UPDATE {USERS_TABLE}
         SET role = :role
         WHERE id = :id
+        RETURNING email
     """)
 
-    result = db.execute(update_query, {
-        "role": mapped_role,
-        "id": user_id
-    })
-
-    db.commit()
-
-    print(f"🟩 [ADMIN] 역할 변경 rowcount: {result.rowcount}")
-
-    if result.rowcount == 0:
+    # 감사 로그는 같은 트랜잭션에서 함께 저장
+    async with unit_of_work(db):
+        target = (await db.execute(update_query, {
+            "role": mapped_role,
+            "id": user_id
+        })).first()
+        if target:
+            await write_audit_now(db, make_entry(
+                admin["email"], ACTION_CHANGE_ROLE, user_id, target.email
+            ))
+        after_commit(db, invalidate_principal, user_id)
+
+    logger.info("change_role", extra={"fields": {
+        "admin": admin["email"], "user_id": user_id,
+        "role": data.role, "found": target is not None
+    }})
+
+    if target is None:
         raise HTTPException(status_code=404, detail="해당 유저를 찾을 수 없습니다.")
 
     return {
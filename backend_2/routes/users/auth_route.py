@@ -3,11 +3,11 @@
 # ============================================
 
 from fastapi import APIRouter, Depends, HTTPException, Body
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncConnection
 from sqlalchemy import text   # SQL 실행용
 
 # DB
-from db.database import get_db
+from db.database import async_engine, get_db, unit_of_work, after_commit
 
 # 컨트롤러
 from controllers.user.register_controller import register_user
@@ -15,13 +15,19 @@ from controllers.user.login_controller import login_user
 
 # JWT
 from services.oauth2_service import create_access_token, get_current_user
+from services.cache_service import invalidate_principal, invalidate_profile
+from services.hashing_service import password_hash_async
 
 # 모델
 from models.users_model import UserCreate
 
-# user_info / user_body_info 수정용 함수들
-from models.user_info_model import update_user_info
-from models.user_body_model import update_body_info
+# 로깅
+from services.log_service import get_logger
+
+logger = get_logger("auth")
+
+# user_info / user_body_info 동시 upsert
+from models.profile_model import upsert_profile
 
 
 # ============================================
@@ -35,10 +41,14 @@ router = APIRouter(tags=["auth"])
 # 1) 회원가입
 # ============================================
 @router.post("/register")
-async def register(user: UserCreate = Body(...), db: Session = Depends(get_db)):
-    print("\n🟦 [AUTH] 회원가입 요청:", user.dict())
+async def register(user: UserCreate = Body(...)):
+    logger.info("register_request", extra={"fields": {"email": user.email}})
+
+    # bcrypt 는 DB 연결을 잡기 전에 (해싱 중에 풀 연결 / 트랜잭션을 붙잡지 않도록 get_db 를 쓰지 않음)
+    hashed_pw = await password_hash_async(user.password)
 
-    res = register_user(user.dict(), db)
+    async with async_engine.connect() as db:
+        res = await register_user(user.dict(), db, hashed_pw)
     if "error" in res:
         raise HTTPException(status_code=400, detail=res["error"])
 
@@ -50,10 +60,8 @@ async def register(user: UserCreate = Body(...), db: Session = Depends(get_db)):
 # 2) 로그인
 # ============================================
 @router.post("/login")
-async def login(user: dict = Body(...), db: Session = Depends(get_db)):
-    print("\n🟦 [AUTH] 로그인 요청:", user)
-
-    res = login_user(user, db)
+async def login(user: dict = Body(...), db: AsyncConnection = Depends(get_db)):
+    res = await login_user(user, db)
     if "error" in res:
         raise HTTPException(status_code=400, detail=res["error"])
 
@@ -72,12 +80,9 @@ async def login(user: dict = Body(...), db: Session = Depends(get_db)):
 
 
 # ============================================
-# 3) 내 정보 조회
+# 3) 내 정보 조회 → routes/users/profile_route.py (GET /web/users/me)
+#    같은 경로를 여기서도 등록하면 먼저 등록된 이 라우터가 가로채므로 두지 않는다.
 # ============================================
-@router.get("/me")
-def get_me(current_user=Depends(get_current_user)):
-    print("🟦 [AUTH] /me 요청 →", current_user)
-    return current_user
 
 
 
@@ -85,12 +90,12 @@ def get_me(current_user=Depends(get_current_user)):
 # 4) 🔥 프로필 전체 업데이트
 # ============================================
 @router.put("/update")
-def update_profile(
+async def update_profile(
     data: dict = Body(...),
-    db: Session = Depends(get_db),
+    db: AsyncConnection = Depends(get_db),
     current_user=Depends(get_current_user)
 ):
-    print("\n🟦 [AUTH] 프로필 업데이트 요청:", data)
+    logger.info("profile_update_request", extra={"fields": {"user_id": current_user["id"], "keys": list(data.keys())}})
 
     uid = current_user["id"]
 
@@ -109,20 +114,6 @@ def update_profile(
     # ❌ avatar 컬럼 없음! → 절대 넣으면 안 됨
 
 
-    if user_fields:
-        print("🟩 users 업데이트:", user_fields)
-
-        db.execute(
-            text("""
-                UPDATE public.users
-                SET name = COALESCE(:name, name),
-                    email = COALESCE(:email, email)
-                WHERE id = :id
-            """),
-            {**user_fields, "id": uid}
-        )
-        db.commit()
-
 
 
     # ----------------------------------------
@@ -137,10 +128,6 @@ def update_profile(
         if key in data:
             info_fields[key] = data[key]
 
-    if info_fields:
-        print("🟩 user_info 업데이트:", info_fields)
-        update_user_info(db, uid, info_fields, insert_if_missing=True)
-
 
 
     # ----------------------------------------
@@ -160,10 +147,26 @@ def update_profile(
         w = data["weight"]
         body_fields["bmi"] = round(w / (h * h), 1)
 
-    if body_fields:
-        print("🟩 user_body_info 업데이트:", body_fields)
-        update_body_info(db, uid, body_fields, insert_if_missing=True)
-
+    # ----------------------------------------
+    # 4) 하나의 트랜잭션으로 저장 (commit 1회)
+    #    user_info + user_body_info upsert 는 SQL 1문장으로 처리
+    # ----------------------------------------
+    async with unit_of_work(db):
+        if user_fields:
+            await db.execute(
+                text("""
+                    UPDATE public.users
+                    SET name = COALESCE(:name, name),
+                        email = COALESCE(:email, email)
+                    WHERE id = :id
+                """),
+                {**user_fields, "id": uid}
+            )
+            after_commit(db, invalidate_principal, uid)
+            after_commit(db, invalidate_profile, uid)
+
+        if info_fields or body_fields:
+            await upsert_profile(db, uid, info_fields, body_fields)
 
 
     return {"message": "프로필 업데이트 완료", "success": True}
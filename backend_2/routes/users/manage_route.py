@@ -2,9 +2,10 @@
 from fastapi import APIRouter, Depends, HTTPException
 
 # DB 연결 및 서비스/모델 import
-from db.database import get_db
+from db.database import get_db, unit_of_work
 from services.oauth2_service import get_current_user, admin_required  # 역할 기반 인증
 from models.users_model import get_user_by_email, get_user_by_id, delete_user  # DB 조작 함수
+from services.audit_service import make_entry, write_audit_now, ACTION_DELETE_USER  # 감사 로그
 
 # -----------------------------
 # 사용자 관리 라우터 생성
@@ -25,12 +26,13 @@ async def delete_account(
     - user: 본인만 탈퇴 가능 (role과 관계 없음)
     """
     # DB에서 본인 정보 조회
-    user = get_user_by_email(db, current_user["email"])
+    user = await get_user_by_email(db, current_user["email"])
     if not user:
         raise HTTPException(status_code=404, detail="사용자를 찾을 수 없습니다.")
 
-    # 삭제 실행
-    delete_user(db, user["id"])
+    # 삭제 실행 (트랜잭션 1회)
+    async with unit_of_work(db):
+        await delete_user(db, user["id"])
 
     return {"message": "회원 탈퇴가 완료되었습니다."}
 
@@ -48,12 +50,16 @@ async def admin_delete_user(
     관리자 전용: 특정 사용자 계정 삭제
     """
     # 삭제할 대상 조회
-    target_user = get_user_by_id(db, target_user_id)
+    target_user = await get_user_by_id(db, target_user_id)
     if not target_user:
         raise HTTPException(status_code=404, detail="삭제할 사용자를 찾을 수 없습니다.")
 
-    # 삭제 실행
-    delete_user(db, target_user_id)
+    # 삭제 + 감사 로그 저장 (트랜잭션 1회)
+    async with unit_of_work(db):
+        await delete_user(db, target_user_id)
+        await write_audit_now(db, make_entry(
+            current_user["email"], ACTION_DELETE_USER, target_user_id, target_user["email"]
+        ))
 
     return {
         "message": f"관리자가 사용자(id={target_user_id})를 삭제했습니다.",
@@ -1,9 +1,11 @@
 # FastAPI 관련 import
-from fastapi import APIRouter, Depends, HTTPException, Body
+from fastapi import APIRouter, Depends, HTTPException, Body, Response
 
 # DB 연결 및 모델/컨트롤러 import
-from db.database import get_db
+from db.database import get_db, unit_of_work
 from services.oauth2_service import get_current_user
+from services.cache_service import profile_cache
+from services.json_service import dumps
 
 from models.users_model import (
     get_user_by_email,
@@ -11,15 +13,7 @@ from models.users_model import (
     delete_user
 )
 
-from models.user_body_model import (
-    get_body_info,
-    update_body_info
-)
-
-from models.user_info_model import (
-    get_user_info,
-    update_user_info as update_info
-)
+from models.profile_model import get_profile, upsert_profile
 
 
 # -----------------------------
@@ -39,54 +33,60 @@ async def get_my_info(
     current_user=Depends(get_current_user),
     db=Depends(get_db)
 ):
-    # 1) 기본 user 정보
-    user = get_user_by_email(db, current_user["email"])
-    if not user:
-        raise HTTPException(status_code=404, detail="사용자를 찾을 수 없습니다.")
-
-    user_id = user["id"]
+    user_id = str(current_user["id"])
 
-    # 2) body_info
-    body = get_body_info(db, user_id) or {}
+    # 0) 직렬화된 프로필 캐시 확인
+    cached = profile_cache.get(user_id)
+    if cached is not None:
+        return Response(content=cached, media_type="application/json")
 
-    # 3) user_info
-    info = get_user_info(db, user_id) or {}
+    # 1) users + body_info + user_info JOIN 1회 조회
+    profile = await get_profile(db, user_id)
+    if not profile:
+        raise HTTPException(status_code=404, detail="사용자를 찾을 수 없습니다.")
 
-    # 4) 날짜 처리
-    created_at = user.get("created_at")
+    # 2) 날짜 처리
+    created_at = profile["created_at"]
     if created_at:
         try:
             created_at = created_at.strftime("%Y-%m-%d")
         except:
             created_at = str(created_at)[:10]
 
-    # 5) 프론트로 반환
-    return {
+    # 3) 프론트로 반환할 데이터 구성
+    data = {
         # 기본 user 정보
-        "name": user.get("name"),
-        "email": user.get("email"),
-        "phone": user.get("phone"),
-        "age": user.get("age"),
-        "gender": user.get("gender"),
-        "goal": user.get("goal"),
-        "avatar": user.get("avatar"),
+        "id": str(profile["id"]),
+        "name": profile["name"],
+        "email": profile["email"],
+        "phone": profile["phone"],
+        "age": None,
+        "gender": profile["gender"],
+        "goal": profile["goal"],
+        "avatar": None,
 
         # body_info
-        "height": body.get("height_cm"),
-        "weight": body.get("weight_kg"),
-        "bmi": body.get("bmi"),
+        "height": profile["height_cm"],
+        "weight": profile["weight_kg"],
+        "bmi": profile["bmi"],
 
         # user_info
-        "dailyTime": info.get("dailytime"),
-        "weekly": info.get("weekly"),
-        "activity": info.get("activity"),
-        "targetPeriod": info.get("targetperiod"),
-        "intro": info.get("intro"),
-        "prefer": info.get("prefer") if info.get("prefer") else [],
+        "dailyTime": profile["dailytime"],
+        "weekly": profile["weekly"],
+        "activity": profile["activity"],
+        "targetPeriod": profile["targetperiod"],
+        "intro": profile["intro"],
+        "prefer": profile["prefer"] if profile["prefer"] else [],
 
         "created_at": created_at
     }
 
+    # 4) 직렬화 후 캐시에 저장
+    content = dumps(data)
+    profile_cache.set(user_id, content)
+
+    return Response(content=content, media_type="application/json")
+
 
 # =============================
 # 🔵 내 정보 수정 (update)
@@ -97,7 +97,7 @@ async def update_user_all(
     db=Depends(get_db),
     body: dict = Body(...)
 ):
-    user = get_user_by_email(db, current_user["email"])
+    user = await get_user_by_email(db, current_user["email"])
     if not user:
         raise HTTPException(status_code=404, detail="사용자를 찾을 수 없습니다.")
 
@@ -111,9 +111,6 @@ async def update_user_all(
         if key in body:
             basic_fields[key] = body[key]
 
-    if basic_fields:
-        update_basic_user(db, user_id, basic_fields)
-
     # ----------------------------------------
     # 2) user_info 테이블 업데이트
     # ----------------------------------------
@@ -122,9 +119,6 @@ async def update_user_all(
         if key in body:
             info_fields[key] = body[key]
 
-    if info_fields:
-        update_info(db, user_id, info_fields, insert_if_missing=True)
-
     # ----------------------------------------
     # 3) body_info 테이블 업데이트
     # ----------------------------------------
@@ -142,8 +136,16 @@ async def update_user_all(
         if h and w:
             body_fields["bmi"] = round(w / ((h / 100) ** 2), 1)
 
-    if body_fields:
-        update_body_info(db, user_id, body_fields, insert_if_missing=True)
+    # ----------------------------------------
+    # 4) 하나의 트랜잭션으로 저장 (commit 1회)
+    #    user_info + body_info upsert 는 SQL 1문장으로 처리
+    # ----------------------------------------
+    async with unit_of_work(db):
+        if basic_fields:
+            await update_basic_user(db, user_id, basic_fields)
+
+        if info_fields or body_fields:
+            await upsert_profile(db, user_id, info_fields, body_fields)
 
     return {"message": "프로필 업데이트 완료"}
 
@@ -156,9 +158,10 @@ async def delete_my_account(
     current_user=Depends(get_current_user),
     db=Depends(get_db)
 ):
-    user = get_user_by_email(db, current_user["email"])
+    user = await get_user_by_email(db, current_user["email"])
     if not user:
         raise HTTPException(status_code=404, detail="사용자를 찾을 수 없습니다.")
 
-    delete_user(db, user["id"])
+    async with unit_of_work(db):
+        await delete_user(db, user["id"])
     return {"message": "계정 삭제 완료"}
@@ -1,26 +1,159 @@
+# 표준 라이브러리 import
+import uuid
+from typing import Optional
+
 # FastAPI 관련 import
-from fastapi import APIRouter, UploadFile, File
+from fastapi import APIRouter, UploadFile, File, Form, Request, Query, Depends, HTTPException
+from pydantic import BaseModel
+
+# 인증
+from services.oauth2_service import get_current_user
+
+# 영상 분석 작업 큐
+from services.analysis_service import submit_job, get_job, public_job
+from services.json_service import ORJSONResponse
+
+# 업로드 파일 저장소
+from services.storage_service import (
+    save_upload,
+    create_upload_session,
+    get_upload_offset,
+    write_upload_chunk,
+    finalize_upload,
+    abort_upload,
+)
 
 # -----------------------------
 # 비디오 업로드 라우터 생성
 # -----------------------------
 router = APIRouter(tags=["Video"])  # Swagger UI에서 그룹화
 
+
+# -----------------------------
+# 요청 body 모델 (이어 올리기 세션 생성)
+# -----------------------------
+class UploadSessionCreate(BaseModel):
+    filename: str
+    size: int     # 전체 파일 크기 (bytes)
+
+
+# -----------------------------
+# 분석 작업 등록 (exercise_id 가 있을 때만)
+# -----------------------------
+async def _enqueue_analysis(stored: dict, user, exercise_id: Optional[str], activity_id: Optional[str] = None):
+    """
+    저장 결과에 분석 작업 id 를 붙여 응답 dict 구성
+    - exercise_id 가 없으면 저장만 하고 분석하지 않음
+    - activity_id 가 있으면 세트별 rep 수를 activity_detail_logs 에 저장
+    """
+    if exercise_id is None:
+        return {**stored, "job_id": None, "status": "업로드 성공!"}
+
+    job = await submit_job(stored["id"], user["id"], exercise_id, activity_id)
+    return {**stored, "job_id": job["id"], "status": "업로드 성공! AI 분석 대기 중"}
+
+
+def _check_uuid(name: str, value: Optional[str]):
+    if value is None:
+        return
+    try:
+        uuid.UUID(value)
+    except ValueError:
+        raise HTTPException(status_code=400, detail=f"{name} 형식이 올바르지 않습니다.")
+
+
 # -----------------------------
 # 비디오 업로드 엔드포인트
 # -----------------------------
 @router.post("/upload")
-async def upload_video(file: UploadFile = File(...)):
+async def upload_video(
+    file: UploadFile = File(...),
+    exercise_id: Optional[str] = Form(None),
+    activity_id: Optional[str] = Form(None),
+    current_user=Depends(get_current_user)
+):
     """
     비디오 파일 업로드 처리
     - file: 클라이언트가 전송한 업로드 파일 (UploadFile)
-    반환: 업로드 파일명 및 상태 메시지
+    - exercise_id: 함께 보내면 업로드 후 자세 분석 작업을 큐에 등록
+    - activity_id: 함께 보내면 세트별 rep 수를 운동 기록에 저장
+    반환: 저장 객체 id, 파일명, 크기, SHA-256, 분석 작업 id 및 상태 메시지
+    """
+    _check_uuid("exercise_id", exercise_id)
+    _check_uuid("activity_id", activity_id)
+
+    # 1. 청크 단위로 디스크에 저장 (전체를 메모리에 올리지 않음)
+    stored = await save_upload(file)
+
+    # 2. 분석 작업은 큐에 넣기만 하고 바로 응답
+    return await _enqueue_analysis(stored, current_user, exercise_id, activity_id)
+
+
+# =============================
+# 🔁 이어 올리기(resumable) 업로드
+# =============================
+# 1) POST   /uploads                          → upload_id 발급
+# 2) PUT    /uploads/{upload_id}?offset=N     → body(raw bytes)를 offset 위치에 이어 쓰기
+# 3) GET    /uploads/{upload_id}              → 연결이 끊긴 뒤 이어 보낼 offset 조회
+# 4) POST   /uploads/{upload_id}/finalize     → 저장 객체로 확정
+# (취소) DELETE /uploads/{upload_id}
+# 모든 세션 API 는 로그인 필요, 세션을 만든 사용자만 접근 가능 (다른 사용자는 404)
+@router.post("/uploads")
+async def create_upload(data: UploadSessionCreate, current_user=Depends(get_current_user)):
+    return await create_upload_session(data.filename, data.size, str(current_user["id"]))
+
+
+@router.get("/uploads/{upload_id}")
+async def get_upload(upload_id: str, current_user=Depends(get_current_user)):
+    return await get_upload_offset(upload_id, str(current_user["id"]))
+
+
+@router.put("/uploads/{upload_id}")
+async def put_upload_chunk(
+    upload_id: str,
+    request: Request,
+    offset: int = Query(..., ge=0),
+    current_user=Depends(get_current_user)
+):
+    """
+    청크 전송 (Content-Type: application/octet-stream)
+    - offset 이 서버 위치와 다르면 409, detail.offset 부터 다시 전송
+    """
+    return await write_upload_chunk(upload_id, str(current_user["id"]), offset, request.stream())
+
+
+@router.post("/uploads/{upload_id}/finalize")
+async def finalize(
+    upload_id: str,
+    exercise_id: Optional[str] = None,
+    activity_id: Optional[str] = None,
+    current_user=Depends(get_current_user)
+):
+    _check_uuid("exercise_id", exercise_id)
+    _check_uuid("activity_id", activity_id)
+    stored = await finalize_upload(upload_id, str(current_user["id"]))
+    return await _enqueue_analysis(stored, current_user, exercise_id, activity_id)
+
+
+@router.delete("/uploads/{upload_id}")
+async def delete_upload(upload_id: str, current_user=Depends(get_current_user)):
+    await abort_upload(upload_id, str(current_user["id"]))
+    return {"message": "업로드가 취소되었습니다."}
+
+
+# =============================
+# 🎬 영상 분석 작업 상태 조회
+#    GET /web/video/jobs/{job_id}
+# =============================
+@router.get("/jobs/{job_id}")
+async def get_analysis_job(job_id: str, current_user=Depends(get_current_user)):
+    """
+    분석 작업 진행 상황 (queued → running → done / failed)
+    - 본인 작업만 조회 가능 (관리자는 전체)
     """
-    # 1. 파일 내용 읽기
-    video_bytes = await file.read()  # 실제 저장 또는 AI 분석 로직 연동 가능
+    job = await get_job(job_id)
+    if job is None or (str(job["user_id"]) != str(current_user["id"]) and not current_user["role"]):
+        raise HTTPException(status_code=404, detail="분석 작업을 찾을 수 없습니다.")
 
-    # 2. 성공 메시지 반환 (현재는 단순 확인용)
-    return {
-        "filename": file.filename,
-        "status": "업로드 성공! (AI 분석 연동 예정)"
-    }
+    # 클라이언트가 주기적으로 폴링하는 경로 → jsonable_encoder 없이 바로 직렬화
+    return ORJSONResponse(public_job(job))
@@ -0,0 +1,321 @@
+# ============================================
+# 🎬 영상 분석 작업 큐 (백그라운드 워커)
+# ============================================
+# 업로드 요청에서는 작업을 analysis_jobs 테이블에 넣고 job id 만 바로 돌려준다.
+# 프로세스마다 ANALYSIS_WORKERS 개의 워커가 FOR UPDATE SKIP LOCKED 로 작업을 하나씩 가져가
+#   1) 분석기(analyzer)를 전용 스레드 풀에서 실행하고
+#   2) 프레임별 결과를 pose_analysis 에 multi-row INSERT 로 저장한다.
+# 진행 상황은 GET /web/video/jobs/{job_id} 로 조회한다 (어느 워커 프로세스에서든 같은 결과).
+#
+# 분석기 교체: .env 의 ANALYSIS_ANALYZER="패키지.모듈:함수"
+#   def analyzer(video_path: Path, exercise: dict, progress) -> dict
+#     - progress(0.0 ~ 1.0) 로 진행률 보고
+#     - 반환: {"score", "feedback", "frames": [{"frame_file_name", "angles", "issues", "score", "feedback"}],
+#              "sets": [{"set_number", "reps_done", "score"}]}   (sets 는 선택)
+#     - 작업에 activity_id 가 있으면 sets 를 activity_detail_logs 에 함께 저장
+#
+# 작업 상태는 DB 에 보관한다 (db/migrations/010_analysis_jobs.sql)
+# - 실행 중 작업은 ANALYSIS_HEARTBEAT_SECONDS 마다 progress / updated_at 갱신
+# - heartbeat 가 ANALYSIS_STALE_SECONDS 이상 끊긴 작업(프로세스 종료 등)은 다른 워커가 다시 실행
+#   (ANALYSIS_MAX_ATTEMPTS 회를 넘으면 failed)
+# - 서버 종료 시 실행 중이던 작업은 queued 로 되돌린다
+
+import asyncio
+import hashlib
+import importlib
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+from fastapi import HTTPException, status
+
+from config.settings import settings
+from db.database import async_engine
+from models.activity_model import insert_activity_details
+from models.analysis_job_model import (
+    insert_job,
+    get_job_by_id,
+    claim_job,
+    update_job_progress,
+    finish_job,
+    count_jobs_by_status,
+)
+from models.exercise_model import get_exercise_by_id
+from models.pose_analysis_model import insert_pose_analyses
+from services.log_service import get_logger
+from services.pose_service import score_keypoints, frames_for_storage
+from services.rep_service import count_reps
+from services.storage_service import object_path
+
+logger = get_logger("analysis")
+
+# 작업 상태
+JOB_QUEUED = "queued"
+JOB_RUNNING = "running"
+JOB_DONE = "done"
+JOB_FAILED = "failed"
+
+_workers = []
+_wakeup = None           # 같은 프로세스에 작업이 등록되면 대기 중인 워커를 바로 깨움
+_executor = None
+_analyzer = None
+
+
+# -----------------------------
+# 기본 분석기 (오프라인 테스트용 stub)
+# -----------------------------
+STUB_FRAMES = 30       # 생성할 프레임 수
+STUB_SAVE_EVERY = 6    # pose_analysis 에 저장할 프레임 간격
+STUB_FPS = 30.0
+
+# 선 자세 기준 키포인트 (COCO 17, 정규화 좌표 x, y)
+STUB_BASE_POSE = [
+    (0.50, 0.10), (0.48, 0.08), (0.52, 0.08), (0.46, 0.09), (0.54, 0.09),
+    (0.42, 0.22), (0.58, 0.22), (0.38, 0.36), (0.62, 0.36), (0.36, 0.50),
+    (0.64, 0.50), (0.45, 0.52), (0.55, 0.52), (0.45, 0.72), (0.55, 0.72),
+    (0.45, 0.92), (0.55, 0.92),
+]
+
+
+def stub_analyzer(video_path, exercise, progress):
+    """
+    결정적(deterministic) stub 분석기
+    - 같은 영상이면 항상 같은 결과 (파일 앞부분 SHA-256 을 시드로 사용)
+    - 실제 자세 추정 대신 기준 자세에 노이즈를 더한 키포인트로 점수 엔진(pose_service) 실행
+    """
+    with open(video_path, "rb") as f:
+        seed = hashlib.sha256(f.read(settings.VIDEO_CHUNK_SIZE)).hexdigest()
+    rng = np.random.default_rng(int(seed[:16], 16))
+    progress(0.3)
+
+    keypoints = rng.normal(np.array(STUB_BASE_POSE), 0.03, size=(STUB_FRAMES, len(STUB_BASE_POSE), 2))
+    result = score_keypoints(exercise["name"], keypoints)
+    progress(0.8)
+
+    reps = count_reps(exercise["name"], result["angles"], STUB_FPS, result["frame_scores"])
+
+    names = [f"{video_path.name}_{i:04d}" for i in range(STUB_FRAMES)]
+    score = result["score"]
+    return {
+        "score": score,
+        "feedback": f"{exercise['name']} 평균 점수 {score}점" if score is not None else "기준 자세 정보가 없는 운동입니다.",
+        "frames": frames_for_storage(result, names, step=STUB_SAVE_EVERY),
+        "sets": reps["sets"],
+    }
+
+
+def load_analyzer(path: str):
+    """'패키지.모듈:함수' 문자열 → 분석기 함수"""
+    module_name, _, attr = path.partition(":")
+    return getattr(importlib.import_module(module_name), attr)
+
+
+def set_analyzer(analyzer):
+    """분석기 직접 지정 (테스트 / 다른 모듈에서 교체할 때)"""
+    global _analyzer
+    _analyzer = analyzer
+
+
+# -----------------------------
+# 워커 시작 / 종료
+# -----------------------------
+async def start_analysis_workers():
+    """서버 시작 시 호출"""
+    global _wakeup, _executor, _analyzer
+    if _workers:
+        return
+
+    if _analyzer is None:
+        _analyzer = load_analyzer(settings.ANALYSIS_ANALYZER)
+
+    _wakeup = asyncio.Event()
+    _executor = ThreadPoolExecutor(
+        max_workers=settings.ANALYSIS_WORKERS,
+        thread_name_prefix="analysis"
+    )
+    for _ in range(settings.ANALYSIS_WORKERS):
+        _workers.append(asyncio.create_task(_worker()))
+
+
+async def stop_analysis_workers():
+    """
+    서버 종료 시 호출
+    - 실행 중이던 작업은 queued 로 되돌려 다른 프로세스(또는 재시작 후)가 이어서 처리
+    """
+    global _executor
+    for task in _workers:
+        task.cancel()
+    await asyncio.gather(*_workers, return_exceptions=True)
+    _workers.clear()
+
+    if _executor is not None:
+        _executor.shutdown(wait=True)
+        _executor = None
+
+
+# -----------------------------
+# 작업 등록 / 조회
+# -----------------------------
+async def submit_job(video_id: str, user_id, exercise_id: str, activity_id=None):
+    """
+    분석 작업을 analysis_jobs 에 등록하고 바로 반환
+    - activity_id: 있으면 세트별 rep 수를 activity_detail_logs 에 저장
+    - 대기 중 작업이 ANALYSIS_QUEUE_MAX 이상이면 503
+    반환: 작업 상태 dict
+    """
+    async with async_engine.begin() as db:
+        job = await insert_job(db, {
+            "user_id": str(user_id),
+            "video_id": video_id,
+            "exercise_id": str(exercise_id),
+            "activity_id": str(activity_id) if activity_id else None,
+        }, settings.ANALYSIS_QUEUE_MAX)
+
+    if job is None:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="분석 요청이 많아 잠시 후 다시 시도해주세요.",
+            headers={"Retry-After": "5"}
+        )
+
+    if _wakeup is not None:
+        _wakeup.set()
+    return public_job(job)
+
+
+async def get_job(job_id: str):
+    """작업 행 (없거나 id 형식이 아니면 None)"""
+    try:
+        job_id = str(uuid.UUID(job_id))
+    except ValueError:
+        return None
+    async with async_engine.connect() as db:
+        return await get_job_by_id(db, job_id)
+
+
+def public_job(job):
+    """응답용 작업 상태 (user_id / attempts 제외)"""
+    data = {k: v for k, v in dict(job).items() if k not in ("user_id", "attempts")}
+    for key in ("id", "exercise_id", "activity_id"):
+        if data.get(key) is not None:
+            data[key] = str(data[key])
+    return data
+
+
+async def get_analysis_stats():
+    """운영 지표 (상태별 작업 수 / 이 프로세스의 워커 수)"""
+    async with async_engine.connect() as db:
+        counts = await count_jobs_by_status(db)
+    return {
+        "workers": len(_workers),
+        "jobs": {s: counts.get(s, 0) for s in (JOB_QUEUED, JOB_RUNNING, JOB_DONE, JOB_FAILED)},
+    }
+
+
+# -----------------------------
+# 워커
+# -----------------------------
+async def _claim():
+    async with async_engine.begin() as db:
+        return await claim_job(db, settings.ANALYSIS_STALE_SECONDS)
+
+
+async def _finish(job, status_, fields=None):
+    async with async_engine.begin() as db:
+        return await finish_job(db, job["id"], job["attempts"], status_, fields)
+
+
+async def _worker():
+    while True:
+        try:
+            job = await _claim()
+        except Exception:
+            logger.exception("analysis_claim_failed")
+            job = None
+
+        if job is None:
+            # 대기 작업이 없으면 다른 프로세스가 등록한 작업은 주기적으로 확인
+            try:
+                await asyncio.wait_for(_wakeup.wait(), timeout=settings.ANALYSIS_POLL_SECONDS)
+            except asyncio.TimeoutError:
+                pass
+            _wakeup.clear()
+            continue
+
+        await _run_job(dict(job))
+
+
+class _JobLost(Exception):
+    """heartbeat 가 끊긴 사이 다른 워커가 같은 작업을 다시 가져감"""
+
+
+async def _run_and_heartbeat(job: dict, exercise: dict):
+    """분석기를 스레드 풀에서 실행하면서 ANALYSIS_HEARTBEAT_SECONDS 마다 진행률 저장"""
+    state = {"progress": 0.0}
+
+    def progress(value):
+        # 워커 스레드에서 호출 (float 대입은 원자적)
+        state["progress"] = round(min(max(float(value), 0.0), 1.0), 3)
+
+    loop = asyncio.get_running_loop()
+    future = loop.run_in_executor(
+        _executor, _analyzer, object_path(job["video_id"]), exercise, progress
+    )
+    while True:
+        done, _ = await asyncio.wait({future}, timeout=settings.ANALYSIS_HEARTBEAT_SECONDS)
+        if done:
+            return future.result()
+        async with async_engine.begin() as db:
+            alive = await update_job_progress(db, job["id"], job["attempts"], state["progress"])
+        if not alive:
+            raise _JobLost()
+
+
+async def _run_job(job: dict):
+    started = asyncio.get_running_loop().time()
+    outcome = {}
+    try:
+        if job["attempts"] > settings.ANALYSIS_MAX_ATTEMPTS:
+            raise RuntimeError("분석 재시도 횟수를 초과했습니다.")
+
+        async with async_engine.connect() as db:
+            exercise = await get_exercise_by_id(db, job["exercise_id"])
+        if exercise is None:
+            raise LookupError("운동 정보를 찾을 수 없습니다.")
+
+        result = await _run_and_heartbeat(job, dict(exercise))
+
+        # 결과 저장과 상태 변경을 한 트랜잭션으로 (다른 워커가 가져간 작업이면 롤백)
+        async with async_engine.begin() as db:
+            outcome["frames"] = await insert_pose_analyses(
+                db, job["user_id"], job["exercise_id"], result.get("frames", [])
+            )
+            outcome["sets"] = 0
+            if job["activity_id"]:
+                outcome["sets"] = await insert_activity_details(
+                    db, job["user_id"], job["activity_id"], job["exercise_id"], result.get("sets", [])
+                )
+            outcome.update(score=result.get("score"), feedback=result.get("feedback"), progress=1.0)
+            if not await finish_job(db, job["id"], job["attempts"], JOB_DONE, outcome):
+                raise _JobLost()
+        job_status = JOB_DONE
+    except asyncio.CancelledError:
+        # 서버 종료: 다음 워커가 처음부터 다시 실행하도록 queued 로 되돌림
+        await _finish(job, JOB_QUEUED, {"progress": 0.0})
+        raise
+    except _JobLost:
+        job_status = "lost"
+        logger.warning("analysis_job_lost", extra={"fields": {"job_id": str(job["id"])}})
+    except Exception as exc:
+        job_status = JOB_FAILED
+        logger.exception("analysis_failed", extra={"fields": {"job_id": str(job["id"]), "video_id": job["video_id"]}})
+        try:
+            await _finish(job, JOB_FAILED, {"error": str(exc)})
+        except Exception:
+            logger.exception("analysis_status_save_failed", extra={"fields": {"job_id": str(job["id"])}})
+
+    logger.info("analysis_finished", extra={"fields": {
+        "job_id": str(job["id"]), "status": job_status, "frames": outcome.get("frames", 0),
+        "attempts": job["attempts"],
+        "duration_ms": round((asyncio.get_running_loop().time() - started) * 1000, 2),
+    }})
@@ -0,0 +1,280 @@
+# ============================================
+# 🩺 활력 징후 이상치 탐지 (야간 배치, NumPy 벡터 연산)
+# ============================================
+# 전체 사용자의 최근 ANOMALY_LOOKBACK_DAYS 일 샘플을 한 번에 읽고
+# 지표마다 "사용자별 중앙값 / MAD" 기준선을 그룹 정렬 한 번으로 계산한다 (사용자별 파이썬 루프 없음).
+#   robust z = (값 - 중앙값) / max(1.4826 × MAD, MIN_SCALE[지표])
+# - 기준선은 평가 구간(evaluate_since 이후) 이전 샘플로만 계산 → 이상한 날이 자기 기준선을 끌어당기지 않음
+# - MIN_SCALE: 값이 거의 일정한 사용자(MAD = 0)에서도 z 검사가 꺼지지 않도록 하는 지표별 최소 척도
+# - |z| > Z_THRESHOLD (기준선 샘플이 MIN_BASELINE_SAMPLES 이상일 때) → 'robust_z'
+# - 생리적 허용 범위(VITAL_LIMITS) 밖 → 'out_of_range'
+# 플래그는 wearable_anomalies 에 저장 (같은 구간을 다시 돌려도 중복 없음).
+#
+# 실행: 앱 내 스케줄(매일 ANOMALY_RUN_HOUR 시, UTC) 또는 cron 에서
+#       python -m services.anomaly_service
+# 워커 프로세스가 여러 개여도 advisory lock(ANOMALY_LOCK_KEY)을 잡은 한 프로세스만 실행한다.
+
+import asyncio
+from datetime import datetime, timedelta
+
+import numpy as np
+from fastapi.concurrency import run_in_threadpool
+
+from config.settings import settings
+from db.database import async_engine, try_advisory_lock, advisory_lock_alive, release_advisory_lock
+from models.wearable_model import fetch_vitals, insert_anomalies
+from services.log_service import get_logger
+
+logger = get_logger("anomaly")
+
+# 대상 지표 (raw_json 의 HealthData 필드 이름)
+VITAL_METRICS = ("heartRate", "restingHeartRate", "hrv", "systolic", "diastolic", "glucose", "oxygen")
+
+# 생리적 허용 범위 (이 범위를 벗어나면 기준선과 무관하게 플래그)
+VITAL_LIMITS = {
+    "heartRate": (40.0, 180.0),
+    "restingHeartRate": (40.0, 100.0),
+    "hrv": (10.0, 200.0),
+    "systolic": (90.0, 180.0),
+    "diastolic": (60.0, 120.0),
+    "glucose": (70.0, 180.0),     # mg/dL
+    "oxygen": (92.0, 100.0),      # % (0~1 로 들어오면 % 로 변환)
+}
+
+# 기준선 척도 하한 (지표 단위, 측정기 분해능 / 일상 변동 수준)
+MIN_SCALE = {
+    "heartRate": 3.0,          # bpm
+    "restingHeartRate": 2.0,
+    "hrv": 5.0,                # ms
+    "systolic": 4.0,           # mmHg
+    "diastolic": 3.0,
+    "glucose": 5.0,            # mg/dL
+    "oxygen": 1.0,             # %
+}
+
+Z_THRESHOLD = 3.5
+MIN_BASELINE_SAMPLES = 10
+MAD_SCALE = 1.4826   # 정규분포에서 MAD → 표준편차 환산
+
+# 배치 단일 실행용 advisory lock 키 (다른 배치와 겹치지 않는 임의의 값)
+ANOMALY_LOCK_KEY = 72_210_001
+
+_scheduler = None
+_lock_conn = None    # advisory lock 을 잡고 있는 연결 (이 프로세스가 배치 담당일 때)
+
+
+# -----------------------------
+# 그룹별 중앙값 (정렬 1회)
+# -----------------------------
+def group_median(groups, values, n_groups: int):
+    """
+    groups: (N,) 0 ~ n_groups-1 그룹 번호, values: (N,) 값 (NaN 없음)
+    반환: (그룹별 중앙값 (n_groups,), 그룹별 개수 (n_groups,)) — 비어 있는 그룹은 NaN
+    """
+    order = np.lexsort((values, groups))
+    sorted_values = values[order]
+
+    counts = np.bincount(groups, minlength=n_groups)
+    starts = np.concatenate(([0], np.cumsum(counts)[:-1]))
+
+    median = np.full(n_groups, np.nan)
+    has = counts > 0
+    lo = starts[has] + (counts[has] - 1) // 2
+    hi = starts[has] + counts[has] // 2
+    median[has] = (sorted_values[lo] + sorted_values[hi]) / 2.0
+    return median, counts
+
+
+def _finite(value):
+    """NaN (기준선 없음) → None"""
+    return float(value) if np.isfinite(value) else None
+
+
+# -----------------------------
+# 이상치 탐지 (순수 계산)
+# -----------------------------
+def detect_anomalies(user_ids, recorded_at, values: dict, evaluate_since):
+    """
+    user_ids: 행별 사용자 id 리스트, recorded_at: 행별 측정 시각 리스트
+    values: {지표: (N,) float 배열 (미측정은 NaN)}
+    evaluate_since: 이 시각 이후 측정값만 플래그 (기준선은 이전 값으로만 계산)
+    반환: wearable_anomalies 행 dict 리스트
+    """
+    if not user_ids:
+        return []
+
+    users, codes = np.unique(np.asarray([str(u) for u in user_ids]), return_inverse=True)
+    times = np.asarray(recorded_at, dtype="datetime64[us]")
+    recent = times >= np.datetime64(evaluate_since, "us")
+
+    flags = []
+    for metric, x in values.items():
+        x = np.asarray(x, dtype=np.float64)
+        if metric == "oxygen":
+            x = np.where(x <= 1.0, x * 100.0, x)
+
+        # 미측정은 NaN (raw_json 에 키 없음)
+        # 0 은 배치 샘플이 미측정을 0 으로 저장하던 때의 행 → 활력 징후에서 실측 0 은 없으므로 제외
+        # (집계의 wearable_model.NONZERO_METRICS 와 같은 규칙)
+        valid = np.isfinite(x) & (x != 0)
+
+        # 기준선: 평가 구간 이전 샘플만
+        base = np.flatnonzero(valid & ~recent)
+        median, counts = group_median(codes[base], x[base], users.size)
+        mad, _ = group_median(codes[base], np.abs(x[base] - median[codes[base]]), users.size)
+        scale = np.maximum(MAD_SCALE * mad, MIN_SCALE[metric])
+
+        # 평가: 최근 샘플만
+        rows = np.flatnonzero(valid & recent)
+        if rows.size == 0:
+            continue
+        g = codes[rows]
+        v = x[rows]
+
+        with np.errstate(invalid="ignore"):
+            z = (v - median[g]) / scale[g]
+        z_flag = (counts[g] >= MIN_BASELINE_SAMPLES) & (np.abs(z) > Z_THRESHOLD)
+
+        lo, hi = VITAL_LIMITS[metric]
+        range_flag = (v < lo) | (v > hi)
+
+        hit = np.flatnonzero(z_flag | range_flag)
+        for k in hit.tolist():
+            row = int(rows[k])
+            flags.append({
+                "user_id": str(user_ids[row]),
+                "metric": metric,
+                "recorded_at": recorded_at[row],
+                "value": float(v[k]),
+                "baseline_median": _finite(median[g[k]]),
+                "baseline_mad": _finite(mad[g[k]]),
+                "z_score": _finite(z[k]),
+                "reason": "out_of_range" if range_flag[k] else "robust_z",
+            })
+    return flags
+
+
+# -----------------------------
+# 배치 실행
+# -----------------------------
+async def run_anomaly_detection(evaluate_since=None):
+    """
+    전체 사용자 이상치 탐지 1회 실행
+    - evaluate_since: 플래그 대상 시작 시각 (기본: 24시간 전)
+    반환: {"rows", "flags", "inserted", "duration_ms"}
+    """
+    started = datetime.utcnow()
+    evaluate_since = evaluate_since or started - timedelta(days=1)
+    lookback = min(evaluate_since, started - timedelta(days=settings.ANOMALY_LOOKBACK_DAYS))
+
+    async with async_engine.connect() as db:
+        rows = await fetch_vitals(db, VITAL_METRICS, lookback)
+
+    def compute():
+        if not rows:
+            return []
+        columns = list(zip(*rows))
+        values = {
+            metric: np.array(columns[2 + i], dtype=np.float64)   # None → NaN
+            for i, metric in enumerate(VITAL_METRICS)
+        }
+        return detect_anomalies(list(columns[0]), list(columns[1]), values, evaluate_since)
+
+    # NumPy 계산은 이벤트 루프 밖에서
+    flags = await run_in_threadpool(compute)
+
+    async with async_engine.begin() as db:
+        inserted = await insert_anomalies(db, flags)
+
+    stats = {
+        "rows": len(rows),
+        "flags": len(flags),
+        "inserted": inserted,
+        "duration_ms": round((datetime.utcnow() - started).total_seconds() * 1000, 2),
+    }
+    logger.info("anomaly_batch", extra={"fields": stats})
+    return stats
+
+
+# -----------------------------
+# 앱 내 야간 스케줄
+# -----------------------------
+def _seconds_until_next_run(now: datetime):
+    run_at = now.replace(hour=settings.ANOMALY_RUN_HOUR, minute=0, second=0, microsecond=0)
+    if run_at <= now:
+        run_at += timedelta(days=1)
+    return (run_at - now).total_seconds()
+
+
+async def _acquire_batch_lock():
+    """
+    이 프로세스가 배치 담당인지 확인 (advisory lock 을 잡았거나 이미 들고 있으면 True)
+    - 잡은 연결은 프로세스가 끝날 때까지 유지 → 같은 시각에 깨어난 다른 워커는 건너뜀
+    """
+    global _lock_conn
+    if _lock_conn is not None:
+        if await advisory_lock_alive(_lock_conn):
+            return True
+        # 연결이 끊겼으면 락도 풀렸으므로 다시 잡는다
+        await _lock_conn.close()
+        _lock_conn = None
+
+    _lock_conn = await try_advisory_lock(ANOMALY_LOCK_KEY)
+    return _lock_conn is not None
+
+
+async def _release_batch_lock():
+    global _lock_conn
+    if _lock_conn is not None:
+        try:
+            await release_advisory_lock(_lock_conn, ANOMALY_LOCK_KEY)
+        except Exception:
+            logger.exception("anomaly_lock_release_failed")
+        _lock_conn = None
+
+
+async def _run_daily():
+    while True:
+        await asyncio.sleep(_seconds_until_next_run(datetime.utcnow()))
+        try:
+            if not await _acquire_batch_lock():
+                logger.debug("anomaly_batch_skipped", extra={"fields": {"reason": "locked"}})
+                continue
+            await run_anomaly_detection()
+        except Exception:
+            logger.exception("anomaly_batch_failed")
+
+
+async def start_anomaly_scheduler():
+    """서버 시작 시 호출 (ANOMALY_RUN_HOUR < 0 이면 실행하지 않음)"""
+    global _scheduler
+    if _scheduler is None and 0 <= settings.ANOMALY_RUN_HOUR <= 23:
+        _scheduler = asyncio.create_task(_run_daily())
+
+
+async def stop_anomaly_scheduler():
+    global _scheduler
+    if _scheduler is not None:
+        _scheduler.cancel()
+        try:
+            await _scheduler
+        except asyncio.CancelledError:
+            pass
+        _scheduler = None
+    await _release_batch_lock()
+
+
+async def _run_once():
+    """cron 단독 실행: 앱 스케줄러 등 다른 프로세스가 락을 잡고 있으면 건너뜀"""
+    if not await _acquire_batch_lock():
+        logger.warning("anomaly_batch_skipped", extra={"fields": {"reason": "locked"}})
+        return
+    try:
+        await run_anomaly_detection()
+    finally:
+        await _release_batch_lock()
+
+
+# cron 등에서 단독 실행: python -m services.anomaly_service
+if __name__ == "__main__":
+    asyncio.run(_run_once())
@@ -0,0 +1,152 @@
+# ============================================
+# 🧾 관리자 감사 로그 버퍼 (배치 저장)
+# ============================================
+# 로그 1건마다 INSERT + commit(fsync) 하지 않고,
+# 메모리 버퍼에 모았다가 건수(AUDIT_FLUSH_SIZE) 또는 시간(AUDIT_FLUSH_INTERVAL)
+# 기준으로 multi-row INSERT 1문장 + commit 1회로 저장한다.
+#
+# 사용 예:
+#     await audit_buffer.add(make_entry(admin["email"], "DELETE_USER", user_id))   # 버퍼
+#     await write_audit_now(db, entry)                                             # 즉시 저장 (동기 fallback)
+
+import asyncio
+from datetime import datetime
+
+from config.settings import settings
+from db.database import async_engine
+from models.admin_log_model import insert_logs_bulk
+from services.log_service import get_logger
+
+logger = get_logger("audit")
+
+# 관리자 작업 종류 (admin_logs.action)
+ACTION_DELETE_USER = "DELETE_USER"
+ACTION_CHANGE_ROLE = "CHANGE_ROLE"
+ACTION_CHANGE_SUBSCRIPTION = "CHANGE_SUBSCRIPTION"
+
+
+# -----------------------------
+# 로그 항목 생성
+# -----------------------------
+def make_entry(admin_email, action, target_user_id=None, target_user_email=None):
+    """
+    admin_logs 한 행에 해당하는 dict 생성
+    - timestamp 는 저장 시각이 아니라 발생 시각으로 기록
+    - admin_logs.timestamp 는 naive UTC 로 저장 (admin_log_model 의 since/until 필터와 같은 기준)
+    """
+    return {
+        "admin_email": admin_email,
+        "action": action,
+        "target_user_id": str(target_user_id) if target_user_id is not None else None,
+        "target_user_email": target_user_email,
+        "timestamp": datetime.utcnow(),
+    }
+
+
+# -----------------------------
+# 감사 로그 버퍼
+# -----------------------------
+class AuditLogBuffer:
+    """
+    프로세스 내 감사 로그 버퍼
+    - start(): 주기적 flush 백그라운드 태스크 시작 (서버 시작 시)
+    - add(): 버퍼에 추가, AUDIT_FLUSH_SIZE 이상이면 flush 태스크를 깨움
+    - stop(): 남은 로그 모두 저장 후 종료 (서버 종료 시)
+    """
+
+    def __init__(self):
+        self._entries = []
+        self._wakeup = None
+        self._task = None
+        self._flush_lock = None
+        self._stopping = False
+
+    async def start(self):
+        if self._task is not None:
+            return
+        self._stopping = False
+        self._wakeup = asyncio.Event()
+        self._flush_lock = asyncio.Lock()
+        self._task = asyncio.create_task(self._run())
+
+    async def stop(self):
+        if self._task is not None:
+            # cancel() 하면 진행 중인 flush 의 배치를 잃을 수 있으므로
+            # 루프에 종료를 알리고 현재 flush 가 끝날 때까지 기다린다.
+            self._stopping = True
+            self._wakeup.set()
+            await self._task
+            self._task = None
+        await self.flush()
+
+    async def add(self, entry: dict):
+        """버퍼에 추가 (버퍼가 시작되지 않았으면 즉시 저장)"""
+        if self._task is None:
+            await self._write([entry])
+            return
+
+        self._entries.append(entry)
+
+        # DB 장애로 계속 밀리면 가장 오래된 항목부터 버림 (메모리 보호)
+        overflow = len(self._entries) - settings.AUDIT_BUFFER_MAX
+        if overflow > 0:
+            del self._entries[:overflow]
+            logger.error("audit_buffer_overflow", extra={"fields": {"dropped": overflow}})
+
+        if len(self._entries) >= settings.AUDIT_FLUSH_SIZE:
+            self._wakeup.set()
+
+    async def flush(self):
+        """버퍼에 쌓인 로그를 multi-row INSERT 로 저장"""
+        if not self._entries:
+            return
+
+        lock = self._flush_lock or asyncio.Lock()
+        async with lock:
+            entries, self._entries = self._entries, []
+            size = settings.AUDIT_FLUSH_SIZE
+            written = 0
+            try:
+                while written < len(entries):
+                    await self._write(entries[written:written + size])
+                    written += size
+            except Exception:
+                # 저장 실패분은 버퍼 앞쪽에 되돌려 두고 다음 주기에 재시도
+                self._entries = entries[written:] + self._entries
+                logger.exception("audit_flush_failed", extra={"fields": {"pending": len(self._entries)}})
+            except BaseException:
+                # 취소 등으로 중단돼도 아직 저장하지 못한 로그는 버퍼로 되돌린 뒤 그대로 전파
+                self._entries = entries[written:] + self._entries
+                raise
+
+    def pending(self):
+        """저장 대기 중인 로그 수"""
+        return len(self._entries)
+
+    async def _write(self, entries):
+        async with async_engine.begin() as conn:
+            await insert_logs_bulk(conn, entries)
+
+    async def _run(self):
+        while not self._stopping:
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout=settings.AUDIT_FLUSH_INTERVAL)
+            except asyncio.TimeoutError:
+                pass
+            self._wakeup.clear()
+            await self.flush()
+
+
+# 앱 전역 버퍼
+audit_buffer = AuditLogBuffer()
+
+
+# -----------------------------
+# 동기 fallback (즉시 저장)
+# -----------------------------
+async def write_audit_now(db, entry: dict):
+    """
+    버퍼를 거치지 않고 호출한 쪽 트랜잭션(unit_of_work)에서 바로 INSERT
+    - 로그가 작업과 함께 반드시 커밋되어야 할 때 사용
+    """
+    await insert_logs_bulk(db, [entry])
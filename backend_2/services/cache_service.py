@@ -0,0 +1,125 @@
+# ============================================
+# 🗃 In-process TTL + LRU 캐시
+# ============================================
+
+import threading
+import time
+from collections import OrderedDict
+
+from config.settings import settings
+
+
+# -----------------------------
+# TTL + LRU 캐시 클래스
+# -----------------------------
+class TTLCache:
+    """
+    최대 크기(maxsize)와 만료 시간(ttl, 초)을 가진 프로세스 내 캐시
+    - maxsize 초과 시 가장 오래 사용하지 않은 항목부터 제거 (LRU)
+    - ttl 이 지난 항목은 조회 시 miss 처리 후 제거
+    - hits / misses 카운터로 캐시 크기 조정에 참고
+    """
+
+    def __init__(self, maxsize: int, ttl: float):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data = OrderedDict()   # key → (만료 시각, 값)
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key):
+        """캐시 조회 (없거나 만료되면 None)"""
+        now = time.monotonic()
+        with self._lock:
+            item = self._data.get(key)
+            if item is None:
+                self.misses += 1
+                return None
+
+            expires_at, value = item
+            if expires_at <= now:
+                del self._data[key]
+                self.misses += 1
+                return None
+
+            self._data.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def set(self, key, value):
+        """캐시 저장 (maxsize 초과 시 LRU 제거)"""
+        with self._lock:
+            self._data[key] = (time.monotonic() + self.ttl, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+                self.evictions += 1
+
+    def invalidate(self, key):
+        """특정 키 제거"""
+        with self._lock:
+            self._data.pop(key, None)
+
+    def invalidate_where(self, predicate):
+        """값이 predicate(value) 를 만족하는 항목 모두 제거"""
+        with self._lock:
+            for key in [k for k, (_, v) in self._data.items() if predicate(v)]:
+                del self._data[key]
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+
+    def stats(self):
+        """hit / miss 지표 반환"""
+        with self._lock:
+            total = self.hits + self.misses
+            return {
+                "size": len(self._data),
+                "maxsize": self.maxsize,
+                "ttl_sec": self.ttl,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "hit_ratio": round(self.hits / total, 4) if total else 0.0,
+            }
+
+
+# ============================================
+# 👤 인증 사용자(principal) 캐시
+# ============================================
+# get_current_user 가 매 요청마다 users 테이블을 조회하지 않도록
+# user_id → {"id", "email", "name"} 를 캐시한다.
+# users 행이 바뀌는 곳(수정/삭제/구독/권한 변경)에서 반드시 invalidate 해야 한다.
+principal_cache = TTLCache(
+    maxsize=settings.PRINCIPAL_CACHE_SIZE,
+    ttl=settings.PRINCIPAL_CACHE_TTL
+)
+
+
+def invalidate_principal(user_id):
+    """user_id 기준 principal 캐시 제거"""
+    principal_cache.invalidate(str(user_id))
+
+
+def invalidate_principal_by_email(email: str):
+    """email 기준 principal 캐시 제거 (구독 변경 등 email로만 식별되는 경우)"""
+    principal_cache.invalidate_where(lambda user: user["email"] == email)
+
+
+# ============================================
+# 🧾 프로필(/web/users/me) 캐시
+# ============================================
+# user_id → 직렬화된 JSON bytes
+# users / user_body_info / user_info 가 바뀌면 invalidate_profile 호출
+profile_cache = TTLCache(
+    maxsize=settings.PROFILE_CACHE_SIZE,
+    ttl=settings.PROFILE_CACHE_TTL
+)
+
+
+def invalidate_profile(user_id):
+    """user_id 기준 프로필 캐시 제거"""
+    profile_cache.invalidate(str(user_id))
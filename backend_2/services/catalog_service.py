@@ -0,0 +1,203 @@
+# ============================================
+# 📚 운동 카탈로그 (메모리 스냅샷 + 인덱스 + ETag)
+# ============================================
+# - 서버 시작 시 exercise 테이블 전체를 읽어 불변 스냅샷(CatalogSnapshot)으로 보관
+# - category(category_1 / category_2) / difficulty / posture 별 인덱스를 미리 만들어 두고
+#   필터 조회는 인덱스 교집합으로만 처리 → 조회 요청은 DB 에 접근하지 않음
+# - 필터 조합 / 인코딩(gzip, br)별 응답 본문과 strong ETag 를 한 번만 만들어 재사용
+# - CATALOG_REFRESH_SECONDS 마다 catalog_versions.version 만 확인해서
+#   바뀌었을 때만 다시 읽고 스냅샷을 통째로 교체 (db/migrations/006_catalog_versions.sql)
+
+import asyncio
+import hashlib
+from datetime import datetime
+from decimal import Decimal
+
+from config.settings import settings
+from db.database import async_engine
+from models.exercise_model import list_exercises, get_catalog_version
+from services.compression_service import compress_bytes
+from services.json_service import dumps
+from services.log_service import get_logger
+
+logger = get_logger("catalog")
+
+# 필터 이름 → 인덱싱할 컬럼
+INDEX_FIELDS = {
+    "category": ("category_1", "category_2"),
+    "difficulty": ("difficulty",),
+    "posture": ("posture",),
+}
+
+_snapshot = None
+_refresher = None
+
+
+def _etag(body: bytes, encoding: str = None):
+    digest = hashlib.sha256(body).hexdigest()[:32]
+    return f'"{digest}-{encoding}"' if encoding else f'"{digest}"'
+
+
+def _catalog_item(row):
+    item = dict(row)
+    item["id"] = str(item["id"])
+    if isinstance(item.get("met"), Decimal):
+        item["met"] = float(item["met"])
+    return item
+
+
+# -----------------------------
+# 불변 스냅샷
+# -----------------------------
+class CatalogSnapshot:
+    """
+    한 버전의 운동 목록 + 필터 인덱스
+    - 교체만 하고 수정하지 않으므로 요청 처리 중 잠금이 필요 없음
+    - 응답 캐시(_responses) 는 인덱스에 있는 값 조합만 저장 → 크기가 카탈로그에 비례
+    """
+
+    def __init__(self, version, rows):
+        self.version = version
+        self.loaded_at = datetime.utcnow()
+        self.items = tuple(_catalog_item(row) for row in rows)
+        self.by_id = {item["id"]: item for item in self.items}
+
+        indexes = {name: {} for name in INDEX_FIELDS}
+        for pos, item in enumerate(self.items):
+            for name, columns in INDEX_FIELDS.items():
+                for column in columns:
+                    if item[column] is not None:
+                        indexes[name].setdefault(str(item[column]), set()).add(pos)
+        self.indexes = {
+            name: {value: frozenset(positions) for value, positions in values.items()}
+            for name, values in indexes.items()
+        }
+        self._responses = {}
+
+    def select(self, filters: dict):
+        """필터 조합에 맞는 항목 (목록 순서 유지)"""
+        positions = None
+        for name, value in filters.items():
+            if value is None:
+                continue
+            matched = self.indexes[name].get(value, frozenset())
+            positions = matched if positions is None else positions & matched
+        if positions is None:
+            return list(self.items)
+        return [self.items[pos] for pos in sorted(positions)]
+
+    def facets(self):
+        """필터로 쓸 수 있는 값 목록"""
+        return {name: sorted(values) for name, values in self.indexes.items()}
+
+    def _encode(self, payload, encoding):
+        body = dumps(payload)
+        if encoding and len(body) >= settings.COMPRESS_MIN_BYTES:
+            return compress_bytes(body, encoding), encoding
+        return body, None
+
+    def list_response(self, filters: dict, encoding: str = None):
+        """
+        목록 응답 (body, etag, content_encoding)
+        - content_encoding 이 None 이 아니면 body 는 그 인코딩으로 압축된 상태
+        """
+        key = ("list", tuple(sorted(filters.items())), encoding)
+        cached = self._responses.get(key)
+        if cached is not None:
+            return cached
+
+        items = self.select(filters)
+        body, content_encoding = self._encode({
+            "version": self.version,
+            "count": len(items),
+            "items": items,
+        }, encoding)
+        response = (body, _etag(body, content_encoding), content_encoding)
+
+        # 인덱스에 없는 값(사용자 입력)으로 캐시가 커지지 않도록
+        if all(value is None or value in self.indexes[name] for name, value in filters.items()):
+            self._responses[key] = response
+        return response
+
+    def item_response(self, exercise_id: str, encoding: str = None):
+        """운동 1건 응답 (없으면 None)"""
+        item = self.by_id.get(exercise_id)
+        if item is None:
+            return None
+
+        key = ("item", exercise_id, encoding)
+        cached = self._responses.get(key)
+        if cached is None:
+            body, content_encoding = self._encode(item, encoding)
+            cached = self._responses[key] = (body, _etag(body, content_encoding), content_encoding)
+        return cached
+
+    def stats(self):
+        return {
+            "version": self.version,
+            "loaded_at": self.loaded_at,
+            "count": len(self.items),
+            "cached_responses": len(self._responses),
+        }
+
+
+def get_catalog():
+    """현재 스냅샷 (아직 적재 전이면 None)"""
+    return _snapshot
+
+
+def get_catalog_stats():
+    return _snapshot.stats() if _snapshot is not None else {"loaded": False}
+
+
+# -----------------------------
+# 적재 / 갱신
+# -----------------------------
+async def refresh_catalog(force: bool = False):
+    """
+    버전이 바뀌었으면 (또는 force) exercise 전체를 다시 읽어 스냅샷 교체
+    반환: 교체했으면 True
+    """
+    global _snapshot
+
+    async with async_engine.connect() as db:
+        version = await get_catalog_version(db)
+        if not force and _snapshot is not None and version == _snapshot.version:
+            return False
+        rows = await list_exercises(db)
+
+    _snapshot = CatalogSnapshot(version, rows)
+    logger.info("catalog_loaded", extra={"fields": {"version": version, "count": len(rows)}})
+    return True
+
+
+async def _poll_version():
+    while True:
+        await asyncio.sleep(settings.CATALOG_REFRESH_SECONDS)
+        try:
+            await refresh_catalog()
+        except Exception:
+            logger.exception("catalog_refresh_failed")
+
+
+async def start_catalog():
+    """서버 시작 시 호출: 최초 적재 + 버전 확인 작업 시작 (적재 실패 시 다음 주기에 재시도)"""
+    global _refresher
+    try:
+        await refresh_catalog(force=True)
+    except Exception:
+        logger.exception("catalog_load_failed")
+
+    if _refresher is None and settings.CATALOG_REFRESH_SECONDS > 0:
+        _refresher = asyncio.create_task(_poll_version())
+
+
+async def stop_catalog():
+    global _refresher
+    if _refresher is not None:
+        _refresher.cancel()
+        try:
+            await _refresher
+        except asyncio.CancelledError:
+            pass
+        _refresher = None
@@ -0,0 +1,284 @@
+# ============================================
+# 🗜 HTTP 압축 (응답 gzip/brotli + 요청 gzip 해제)
+# ============================================
+# - CompressionMiddleware: Accept-Encoding 에 따라 응답 본문을 br / gzip 으로 스트리밍 압축
+#   (COMPRESS_MIN_BYTES 미만이거나 COMPRESS_CONTENT_TYPES 에 없는 타입은 그대로 전송)
+# - RequestDecompressionMiddleware: DECOMPRESS_PATH_PREFIXES 경로에서
+#   Content-Encoding: gzip 요청 본문을 청크 단위로 풀어서 라우터에 전달
+#   (압축 해제 크기 / 압축률 상한 초과 시 413 → gzip 폭탄 방지)
+#
+# brotli 패키지가 없으면 응답은 gzip 만 사용한다.
+
+import json
+import zlib
+
+from fastapi import HTTPException
+
+from config.settings import settings
+from services.log_service import get_logger
+
+try:
+    import brotli
+except ImportError:   # 선택 의존성
+    brotli = None
+
+logger = get_logger("compression")
+
+# 압축률 검사는 이 크기 이상 풀린 뒤부터 (작은 본문은 압축률이 높아도 무해)
+RATIO_CHECK_MIN_BYTES = 1024 * 1024
+
+# 한 번의 decompress 호출이 만들 수 있는 최대 크기 (요청 1건당 메모리 상한)
+DECOMPRESS_STEP_BYTES = 64 * 1024
+
+
+def _header(headers, name: bytes):
+    for key, value in headers:
+        if key.lower() == name:
+            return value.decode("latin-1")
+    return None
+
+
+# -----------------------------
+# 응답 압축
+# -----------------------------
+def choose_encoding(accept_encoding: str):
+    """Accept-Encoding 에서 사용할 인코딩 선택 (br > gzip, q=0 은 제외)"""
+    accepted = set()
+    for part in (accept_encoding or "").split(","):
+        name, _, params = part.strip().partition(";")
+        params = params.replace(" ", "")
+        if params.startswith("q="):
+            try:
+                if float(params[2:]) <= 0:
+                    continue
+            except ValueError:
+                continue
+        accepted.add(name.strip().lower())
+
+    if brotli is not None and "br" in accepted:
+        return "br"
+    if "gzip" in accepted:
+        return "gzip"
+    return None
+
+
+def _compressible(content_type: str):
+    if not content_type:
+        return False
+    content_type = content_type.split(";")[0].strip().lower()
+    return any(content_type.startswith(t) for t in settings.COMPRESS_CONTENT_TYPES)
+
+
+class _Compressor:
+    """gzip / brotli 스트리밍 압축기 공통 인터페이스"""
+
+    def __init__(self, encoding: str):
+        if encoding == "br":
+            self._c = brotli.Compressor(quality=settings.BROTLI_QUALITY)
+            self._compress = self._c.process
+            self._flush = self._c.finish
+        else:
+            # wbits=31 → gzip 헤더/트레일러 포함
+            self._c = zlib.compressobj(settings.GZIP_LEVEL, zlib.DEFLATED, 31)
+            self._compress = self._c.compress
+            self._flush = self._c.flush
+
+    def compress(self, data: bytes):
+        return self._compress(data)
+
+    def finish(self):
+        return self._flush()
+
+
+def compress_bytes(data: bytes, encoding: str):
+    """본문 전체를 한 번에 압축 (미리 압축해 두고 재사용하는 응답용)"""
+    compressor = _Compressor(encoding)
+    return compressor.compress(data) + compressor.finish()
+
+
+class CompressionMiddleware:
+    """
+    응답 압축 ASGI 미들웨어
+    - 본문을 COMPRESS_MIN_BYTES 까지만 모아 보고 크기를 판단 (큰 응답 전체를 버퍼링하지 않음)
+    - 이미 Content-Encoding 이 있는 응답 (파일 등) 은 건드리지 않음
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        encoding = choose_encoding(_header(scope["headers"], b"accept-encoding"))
+        if encoding is None:
+            await self.app(scope, receive, send)
+            return
+
+        start = None          # 보류 중인 http.response.start
+        pending = []          # 크기 판단 전까지 모은 본문
+        pending_size = 0
+        compressor = None
+        passthrough = False
+
+        async def send_compressed(body: bytes, more_body: bool):
+            data = compressor.compress(body)
+            if not more_body:
+                data += compressor.finish()
+            if data or not more_body:
+                await send({"type": "http.response.body", "body": data, "more_body": more_body})
+
+        async def send_wrapper(message):
+            nonlocal start, pending_size, compressor, passthrough
+
+            if message["type"] == "http.response.start":
+                headers = message.get("headers", [])
+                if (_header(headers, b"content-encoding")
+                        or not _compressible(_header(headers, b"content-type"))):
+                    passthrough = True
+                    await send(message)
+                else:
+                    start = message
+                return
+
+            if message["type"] != "http.response.body" or passthrough:
+                await send(message)
+                return
+
+            body = message.get("body", b"")
+            more_body = message.get("more_body", False)
+
+            if compressor is not None:
+                await send_compressed(body, more_body)
+                return
+
+            pending.append(body)
+            pending_size += len(body)
+            if more_body and pending_size < settings.COMPRESS_MIN_BYTES:
+                return
+
+            body = b"".join(pending)
+            pending.clear()
+
+            # 작은 응답은 압축하지 않음 (압축 오버헤드 > 절약)
+            if not more_body and pending_size < settings.COMPRESS_MIN_BYTES:
+                passthrough = True
+                await send(start)
+                await send({"type": "http.response.body", "body": body, "more_body": False})
+                return
+
+            headers = [
+                (k, v) for k, v in start.get("headers", [])
+                if k.lower() not in (b"content-length", b"vary")
+            ]
+            vary = _header(start.get("headers", []), b"vary")
+            headers.append((b"content-encoding", encoding.encode("latin-1")))
+            headers.append((b"vary", (f"{vary}, Accept-Encoding" if vary else "Accept-Encoding").encode("latin-1")))
+
+            compressor = _Compressor(encoding)
+            await send({**start, "headers": headers})
+            await send_compressed(body, more_body)
+
+        await self.app(scope, receive, send_wrapper)
+
+
+# -----------------------------
+# 요청 본문 gzip 해제
+# -----------------------------
+class _GzipRequestBody:
+    """수신 청크를 순서대로 풀면서 크기 / 압축률 상한을 검사"""
+
+    def __init__(self):
+        # wbits=47 → gzip / zlib 헤더 자동 인식
+        self._d = zlib.decompressobj(47)
+        self.compressed = 0
+        self.decompressed = 0
+
+    def _check(self):
+        if self.decompressed > settings.DECOMPRESS_MAX_BYTES:
+            raise HTTPException(status_code=413, detail="압축 해제된 요청 본문이 너무 큽니다.")
+        if (self.decompressed >= RATIO_CHECK_MIN_BYTES
+                and self.decompressed > self.compressed * settings.DECOMPRESS_MAX_RATIO):
+            raise HTTPException(status_code=413, detail="요청 본문 압축률이 허용 범위를 넘었습니다.")
+
+    def feed(self, data: bytes, more_body: bool):
+        self.compressed += len(data)
+        out = []
+        try:
+            while data:
+                piece = self._d.decompress(data, DECOMPRESS_STEP_BYTES)
+                self.decompressed += len(piece)
+                self._check()
+                out.append(piece)
+                data = self._d.unconsumed_tail
+            if not more_body:
+                piece = self._d.flush()
+                self.decompressed += len(piece)
+                self._check()
+                out.append(piece)
+        except zlib.error:
+            raise HTTPException(status_code=400, detail="gzip 요청 본문을 해제할 수 없습니다.")
+
+        if not more_body and not self._d.eof:
+            raise HTTPException(status_code=400, detail="gzip 요청 본문이 잘렸습니다.")
+        return b"".join(out)
+
+
+class RequestDecompressionMiddleware:
+    """
+    Content-Encoding: gzip 요청 본문 해제 ASGI 미들웨어
+    - DECOMPRESS_PATH_PREFIXES 경로 (기본: /ios/) 에만 적용
+    - 본문 전체를 압축된 채로 모으지 않고 receive() 호출마다 해당 청크만 풀어서 전달
+    - 그 외 인코딩은 415
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or not scope["path"].startswith(tuple(settings.DECOMPRESS_PATH_PREFIXES)):
+            await self.app(scope, receive, send)
+            return
+
+        content_encoding = (_header(scope["headers"], b"content-encoding") or "identity").strip().lower()
+        if content_encoding == "identity":
+            await self.app(scope, receive, send)
+            return
+
+        if content_encoding != "gzip":
+            await send({
+                "type": "http.response.start",
+                "status": 415,
+                "headers": [(b"content-type", b"application/json")],
+            })
+            await send({
+                "type": "http.response.body",
+                "body": json.dumps({"detail": "gzip 인코딩만 지원합니다."}, ensure_ascii=False).encode("utf-8"),
+            })
+            return
+
+        # 라우터에는 압축이 풀린 본문으로 보이도록 헤더 정리
+        headers = [
+            (k, v) for k, v in scope["headers"]
+            if k.lower() not in (b"content-encoding", b"content-length")
+        ]
+        scope = {**scope, "headers": headers}
+        body = _GzipRequestBody()
+
+        async def receive_decompressed():
+            message = await receive()
+            if message["type"] != "http.request":
+                return message
+
+            more_body = message.get("more_body", False)
+            data = body.feed(message.get("body", b""), more_body)
+            if not more_body:
+                logger.debug("request_decompressed", extra={"fields": {
+                    "path": scope["path"],
+                    "compressed": body.compressed,
+                    "decompressed": body.decompressed,
+                }})
+            return {"type": "http.request", "body": data, "more_body": more_body}
+
+        await self.app(scope, receive_decompressed, send)
@@ -1,6 +1,14 @@
 # 비밀번호 해싱 및 검증을 위한 passlib import
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from fastapi import HTTPException, status
 from passlib.context import CryptContext
 
+from config.settings import settings
+
 # -----------------------------
 # Bcrypt 해싱 컨텍스트 생성
 # -----------------------------
@@ -46,3 +54,126 @@ def verify_password(plain_pw: str, hashed_pw: str):
 
     # bcrypt 검증
     return pwd_cxt.verify(plain_pw, hashed_pw)
+
+
+# ============================================
+# 🧵 bcrypt 전용 워커 풀 (이벤트 루프 블로킹 방지)
+# ============================================
+# bcrypt 한 번에 ~250ms → async 라우터에서 직접 호출하면 이벤트 루프 전체가 멈춘다.
+# 전용 스레드 풀에서 실행하고 (bcrypt는 해싱 중 GIL을 놓음),
+# 실행 중 + 대기 중 작업 수가 한도를 넘으면 바로 503을 돌려준다.
+_hash_executor = ThreadPoolExecutor(
+    max_workers=settings.HASH_WORKERS,
+    thread_name_prefix="bcrypt"
+)
+
+# 실행 중 + 대기 중 작업 수 (이벤트 루프 스레드에서만 변경)
+_pending = 0
+
+# 지표 (워커 스레드에서 갱신하므로 lock 사용)
+_stats_lock = threading.Lock()
+_stats = {
+    "completed": 0,        # 완료된 해싱/검증 수
+    "rejected": 0,         # 대기열 초과로 503 처리된 수
+    "total_hash_ms": 0.0,  # 누적 bcrypt 실행 시간
+    "max_hash_ms": 0.0,    # 최대 bcrypt 실행 시간
+    "total_wait_ms": 0.0,  # 누적 대기열 대기 시간
+}
+
+
+def _timed(func, submitted_at: float, *args):
+    """
+    워커 스레드에서 실행되는 래퍼
+    - 대기 시간(제출 → 시작)과 bcrypt 실행 시간을 기록
+    """
+    started_at = time.perf_counter()
+    try:
+        return func(*args)
+    finally:
+        finished_at = time.perf_counter()
+        hash_ms = (finished_at - started_at) * 1000
+        wait_ms = (started_at - submitted_at) * 1000
+        with _stats_lock:
+            _stats["completed"] += 1
+            _stats["total_hash_ms"] += hash_ms
+            _stats["total_wait_ms"] += wait_ms
+            _stats["max_hash_ms"] = max(_stats["max_hash_ms"], hash_ms)
+
+
+async def _run_in_hash_pool(func, *args):
+    """
+    해싱 함수를 전용 풀에서 실행
+    - 실행 중 + 대기 중 작업이 HASH_WORKERS + HASH_QUEUE_MAX 이상이면 503
+    """
+    global _pending
+
+    if _pending >= settings.HASH_WORKERS + settings.HASH_QUEUE_MAX:
+        with _stats_lock:
+            _stats["rejected"] += 1
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="요청이 많아 잠시 후 다시 시도해주세요.",
+            headers={"Retry-After": "1"}
+        )
+
+    _pending += 1
+    try:
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            _hash_executor, _timed, func, time.perf_counter(), *args
+        )
+    finally:
+        _pending -= 1
+
+
+# -----------------------------
+# 비밀번호 해싱 (async)
+# -----------------------------
+async def password_hash_async(password: str):
+    """
+    password_hash 의 async 버전 (전용 워커 풀에서 실행)
+    """
+    return await _run_in_hash_pool(password_hash, password)
+
+
+# -----------------------------
+# 비밀번호 검증 (async)
+# -----------------------------
+async def verify_password_async(plain_pw: str, hashed_pw: str):
+    """
+    verify_password 의 async 버전 (전용 워커 풀에서 실행)
+    """
+    return await _run_in_hash_pool(verify_password, plain_pw, hashed_pw)
+
+
+# -----------------------------
+# 해싱 풀 종료 (서버 종료 시)
+# -----------------------------
+def shutdown_hash_pool():
+    _hash_executor.shutdown(wait=False)
+
+
+# -----------------------------
+# 해싱 풀 상태 조회
+# -----------------------------
+def get_hash_stats():
+    """
+    해싱 풀 지표 반환
+    - queue_depth: 워커를 기다리는 작업 수
+    - in_flight: 실행 중 + 대기 중 작업 수
+    - avg_hash_ms / max_hash_ms: bcrypt 실행 시간
+    - avg_wait_ms: 대기열에서 기다린 평균 시간
+    """
+    with _stats_lock:
+        completed = _stats["completed"]
+        return {
+            "workers": settings.HASH_WORKERS,
+            "queue_max": settings.HASH_QUEUE_MAX,
+            "in_flight": _pending,
+            "queue_depth": max(0, _pending - settings.HASH_WORKERS),
+            "completed": completed,
+            "rejected": _stats["rejected"],
+            "avg_hash_ms": round(_stats["total_hash_ms"] / completed, 2) if completed else 0.0,
+            "max_hash_ms": round(_stats["max_hash_ms"], 2),
+            "avg_wait_ms": round(_stats["total_wait_ms"] / completed, 2) if completed else 0.0,
+        }
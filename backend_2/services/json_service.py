@@ -0,0 +1,34 @@
+# ============================================
+# ⚡ orjson 기반 JSON 응답
+# ============================================
+# - dict / list / datetime / date / UUID / numpy 배열은 orjson 이 C 코드로 직접 직렬화
+# - default 훅은 numeric(Decimal) → float 만 처리 (행마다 파이썬 호출이 생기지 않도록)
+#   → SQLAlchemy 행은 모델에서 [dict(row) for row in result.mappings()] 로 한 번만 dict 변환해 넘긴다
+# - 라우터가 dict 를 반환하면 FastAPI 가 jsonable_encoder 로 먼저 훑은 뒤 이 클래스로 렌더링하므로
+#   자주 호출되는 / 큰 응답은 ORJSONResponse(...) 를 직접 반환해 그 단계를 건너뛴다
+
+from decimal import Decimal
+
+import orjson
+from fastapi.responses import JSONResponse
+
+DUMPS_OPTIONS = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+
+
+def _default(value):
+    """orjson 이 모르는 타입 변환 (처리 못 하면 TypeError → orjson 이 JSONEncodeError 로 올림)"""
+    if isinstance(value, Decimal):
+        return float(value)
+    raise TypeError(f"Type is not JSON serializable: {type(value).__name__}")
+
+
+def dumps(value) -> bytes:
+    """값 → UTF-8 JSON bytes"""
+    return orjson.dumps(value, default=_default, option=DUMPS_OPTIONS)
+
+
+class ORJSONResponse(JSONResponse):
+    """앱 기본 응답 클래스 (main.py 의 default_response_class)"""
+
+    def render(self, content) -> bytes:
+        return dumps(content)
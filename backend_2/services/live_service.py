@@ -0,0 +1,98 @@
+# ============================================
+# 📡 실시간 운동 세션 (WebSocket) 상태
+# ============================================
+# 클라이언트가 키포인트 프레임을 계속 보내면
+# - 관절 각도를 NumPy 링 버퍼(LIVE_WINDOW_SECONDS 분량)에 쌓고
+# - RepCounter 로 rep / 세트를 이어서 센다
+# - 최근 윈도우로 자세 점수 / 피드백을 계산해 바로 돌려준다
+# DB 에는 프레임마다 쓰지 않고, 세트가 끝날 때만 user_routine_progress 를 갱신한다.
+
+import numpy as np
+
+from config.settings import settings
+from services.pose_service import ANGLE_NAMES, NUM_KEYPOINTS, joint_angles, score_angles, issue_feedback
+from services.rep_service import RepCounter
+
+
+# -----------------------------
+# 링 버퍼
+# -----------------------------
+class AngleRingBuffer:
+    """
+    최근 capacity 프레임의 관절 각도를 고정 크기 float32 배열에 보관
+    - 메모리: capacity × 관절 수 × 4 bytes (세션당 고정)
+    """
+
+    def __init__(self, capacity: int, joints: int = len(ANGLE_NAMES)):
+        self.data = np.full((capacity, joints), np.nan, dtype=np.float32)
+        self.capacity = capacity
+        self.size = 0
+        self.head = 0   # 다음에 쓸 위치
+
+    def push(self, rows):
+        """(n, J) 각도를 한 번에 기록 (capacity 보다 많으면 마지막 capacity 개만)"""
+        rows = np.asarray(rows, dtype=np.float32)[-self.capacity:]
+        n = rows.shape[0]
+        idx = (self.head + np.arange(n)) % self.capacity
+        self.data[idx] = rows
+        self.head = (self.head + n) % self.capacity
+        self.size = min(self.size + n, self.capacity)
+
+    def window(self):
+        """오래된 순서로 정렬된 (size, J) 배열"""
+        if self.size < self.capacity:
+            return self.data[:self.size]
+        return np.concatenate((self.data[self.head:], self.data[:self.head]))
+
+
+# -----------------------------
+# 세션
+# -----------------------------
+class LiveSession:
+    """
+    WebSocket 연결 1개의 상태
+    - feed(): 키포인트 묶음 → 응답 메시지 dict
+    """
+
+    def __init__(self, exercise_name: str, fps: float):
+        self.exercise_name = exercise_name
+        self.buffer = AngleRingBuffer(max(1, int(settings.LIVE_WINDOW_SECONDS * fps)))
+        self.counter = RepCounter(exercise_name, fps)
+
+    def feed(self, keypoints, confidence=None):
+        """
+        keypoints: (n, 17, 2|3)
+        반환: {"type": "reps", "reps", "new_reps", "set_number", "set_reps", "sets_finished",
+               "score", "feedback"}
+        """
+        kp = np.asarray(keypoints, dtype=np.float32)
+        if kp.ndim != 3 or kp.shape[0] > settings.LIVE_MAX_FRAMES_PER_MESSAGE:
+            raise ValueError(f"한 번에 최대 {settings.LIVE_MAX_FRAMES_PER_MESSAGE} 프레임까지 보낼 수 있습니다.")
+
+        angles = joint_angles(kp, confidence)
+        self.buffer.push(angles)
+        progress = self.counter.update(angles)
+
+        # 최근 윈도우 점수 + 마지막 프레임 피드백
+        scored = score_angles(self.exercise_name, self.buffer.window())
+        return {
+            "type": "reps",
+            **progress,
+            "score": scored["score"],
+            "feedback": issue_feedback(scored["issues"][-1]) if scored["issues"] else None,
+        }
+
+    def finish(self):
+        """세션 종료 시 진행 중 세트 마감 (rep 이 없으면 None)"""
+        return self.counter.finish()
+
+
+def decode_binary_frames(payload: bytes, dims: int):
+    """
+    바이너리 메시지 → (n, 17, dims) float32 키포인트
+    - JSON 보다 작고 파싱 비용이 없음 (little-endian float32 연속 배열)
+    """
+    frame_size = NUM_KEYPOINTS * dims * 4
+    if dims not in (2, 3) or len(payload) % frame_size:
+        raise ValueError("바이너리 프레임 크기가 올바르지 않습니다.")
+    return np.frombuffer(payload, dtype="<f4").reshape(-1, NUM_KEYPOINTS, dims)
@@ -0,0 +1,167 @@
+# ============================================
+# 📝 구조화 로깅 (큐 + 백그라운드 writer 스레드)
+# ============================================
+# print() 는 요청 처리 중에 dict 전체를 문자열로 만들고 stdout 에 동기로 쓴다.
+# 여기서는 요청 경로에서 LogRecord 를 큐에 넣기만 하고,
+# 포맷팅(JSON 직렬화) / 민감정보 마스킹 / 출력은 백그라운드 스레드가 처리한다.
+#
+# 사용 예:
+#     logger = get_logger("auth")
+#     logger.info("login_success", extra={"fields": {"user_id": uid, "role": role}})
+
+import json
+import logging
+import queue
+import random
+import sys
+from datetime import datetime, timezone
+from logging.handlers import QueueHandler, QueueListener
+
+from config.settings import settings
+
+# 모든 앱 로거의 부모 이름
+ROOT_LOGGER = "ai_trainer"
+
+# 마스킹할 필드 이름 (소문자 비교)
+REDACT_KEYS = {"password", "password_hash", "access_token", "token", "secret_key", "authorization"}
+REDACTED = "***"
+
+_listener = None
+
+
+# -----------------------------
+# 민감정보 마스킹
+# -----------------------------
+def redact(value):
+    """
+    dict / list 를 재귀적으로 돌며 REDACT_KEYS 에 해당하는 값을 *** 로 치환
+    """
+    if isinstance(value, dict):
+        return {
+            k: REDACTED if str(k).lower() in REDACT_KEYS else redact(v)
+            for k, v in value.items()
+        }
+    if isinstance(value, (list, tuple)):
+        return [redact(v) for v in value]
+    return value
+
+
+# -----------------------------
+# JSON 포맷터 (writer 스레드에서 실행)
+# -----------------------------
+class JsonFormatter(logging.Formatter):
+    """
+    LogRecord → 한 줄 JSON
+    - extra={"fields": {...}} 로 넘긴 값은 마스킹 후 최상위 키로 병합
+    """
+
+    def format(self, record):
+        entry = {
+            "ts": datetime.fromtimestamp(record.created, tz=timezone.utc).isoformat(),
+            "level": record.levelname,
+            "logger": record.name,
+            "msg": record.getMessage(),
+        }
+
+        fields = getattr(record, "fields", None)
+        if fields:
+            entry.update(redact(fields))
+
+        if record.exc_info:
+            entry["exc"] = self.formatException(record.exc_info)
+
+        return json.dumps(entry, ensure_ascii=False, default=str)
+
+
+# -----------------------------
+# 요청 경로용 QueueHandler
+# -----------------------------
+class _DeferredQueueHandler(QueueHandler):
+    """
+    기본 QueueHandler.prepare() 는 호출한 스레드에서 메시지를 포맷한다.
+    포맷은 writer 스레드로 미루고, 레코드만 그대로 큐에 넣는다.
+    (프로세스 내 queue.Queue 이므로 pickle 불필요)
+    """
+
+    def prepare(self, record):
+        return record
+
+    def enqueue(self, record):
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            # 로그 때문에 요청이 막히면 안 되므로 가득 차면 버린다
+            pass
+
+
+# -----------------------------
+# 로거별 샘플링 필터
+# -----------------------------
+class SamplingFilter(logging.Filter):
+    """
+    LOG_SAMPLE_RATES = {"ai_trainer.auth": 0.1} 처럼 로거 이름별 샘플링 비율 적용
+    - WARNING 이상은 항상 기록
+    - 가장 구체적인(긴) 이름이 우선
+    """
+
+    def __init__(self, rates: dict):
+        super().__init__()
+        self.rates = sorted(rates.items(), key=lambda kv: len(kv[0]), reverse=True)
+
+    def filter(self, record):
+        if record.levelno >= logging.WARNING or not self.rates:
+            return True
+
+        for name, rate in self.rates:
+            if record.name == name or record.name.startswith(name + "."):
+                return random.random() < rate
+        return True
+
+
+# -----------------------------
+# 로깅 초기화
+# -----------------------------
+def setup_logging():
+    """
+    ai_trainer 로거에 QueueHandler 를 붙이고 writer 스레드(QueueListener) 시작
+    - 여러 번 호출해도 한 번만 초기화
+    """
+    global _listener
+    if _listener is not None:
+        return
+
+    log_queue = queue.Queue(maxsize=settings.LOG_QUEUE_MAX)
+
+    queue_handler = _DeferredQueueHandler(log_queue)
+    queue_handler.addFilter(SamplingFilter(settings.LOG_SAMPLE_RATES))
+
+    stream_handler = logging.StreamHandler(sys.stdout)
+    stream_handler.setFormatter(JsonFormatter())
+
+    root = logging.getLogger(ROOT_LOGGER)
+    root.setLevel(settings.LOG_LEVEL.upper())
+    root.addHandler(queue_handler)
+    root.propagate = False
+
+    for name, level in settings.LOG_LEVELS.items():
+        logging.getLogger(f"{ROOT_LOGGER}.{name}").setLevel(level.upper())
+
+    _listener = QueueListener(log_queue, stream_handler, respect_handler_level=True)
+    _listener.start()
+
+
+def shutdown_logging():
+    """남은 로그를 모두 출력하고 writer 스레드 종료 (서버 종료 시)"""
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
+
+
+def get_logger(name: str):
+    """
+    ai_trainer.<name> 로거 반환
+    - 첫 호출 시 로깅 초기화
+    """
+    setup_logging()
+    return logging.getLogger(f"{ROOT_LOGGER}.{name}")
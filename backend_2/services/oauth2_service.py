@@ -11,6 +11,7 @@ from fastapi.security import OAuth2PasswordBearer
 from db.database import get_db
 from models.users_model import get_user_by_id
 from config.settings import settings
+from services.cache_service import principal_cache
 
 
 # ---------------------------------------------------
@@ -38,7 +39,7 @@ def create_access_token(data: dict):
 # ---------------------------------------------------
 # 현재 로그인 사용자 조회
 # ---------------------------------------------------
-def get_current_user(token: str = Depends(oauth2_scheme), db=Depends(get_db)):
+async def get_current_user(token: str = Depends(oauth2_scheme), db=Depends(get_db)):
     """
     Authorization 헤더에서 JWT 추출 → 디코딩 → 사용자 검증
     """
@@ -63,13 +64,18 @@ def get_current_user(token: str = Depends(oauth2_scheme), db=Depends(get_db)):
             detail="잘못되었거나 만료된 토큰입니다."
         )
 
-    # DB에서 유저 조회
-    user = get_user_by_id(db, user_id)
-    if not user:
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="유저를 찾을 수 없습니다."
-        )
+    # 캐시 → 없으면 DB에서 유저 조회
+    user = principal_cache.get(user_id)
+    if user is None:
+        row = await get_user_by_id(db, user_id)
+        if not row:
+            raise HTTPException(
+                status_code=status.HTTP_401_UNAUTHORIZED,
+                detail="유저를 찾을 수 없습니다."
+            )
+
+        user = {"id": row["id"], "email": row["email"], "name": row["name"]}
+        principal_cache.set(user_id, user)
 
     # 👉 최종 반환 (boolean role 적용)
     return {
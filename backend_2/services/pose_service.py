@@ -0,0 +1,239 @@
+# ============================================
+# 🦴 자세 점수 계산 (NumPy 벡터 연산)
+# ============================================
+# 입력: 키포인트 시계열 (frames × joints × 2/3), COCO 17 키포인트 순서
+# 1) 모든 프레임의 관절 각도를 한 번에 계산 (프레임별 파이썬 루프 없음)
+# 2) 운동별 기준 각도 범위와 비교 → 범위를 벗어난 정도(deviation)
+# 3) 프레임별 점수 / 이슈, 전체 평균 점수
+#
+# 사용 예:
+#     result = score_keypoints("푸시업", keypoints)       # keypoints: np.ndarray (F, 17, 2)
+#     result["score"], result["frame_scores"], result["issues"][i]
+#     frames = frames_for_storage(result, names)        # pose_analysis 저장용
+
+import numpy as np
+
+# -----------------------------
+# COCO 17 키포인트 인덱스
+# -----------------------------
+NOSE = 0
+L_SHOULDER, R_SHOULDER = 5, 6
+L_ELBOW, R_ELBOW = 7, 8
+L_WRIST, R_WRIST = 9, 10
+L_HIP, R_HIP = 11, 12
+L_KNEE, R_KNEE = 13, 14
+L_ANKLE, R_ANKLE = 15, 16
+NUM_KEYPOINTS = 17
+
+# -----------------------------
+# 관절 각도 정의: 이름 → (a, b, c)  (b 에서의 a-b-c 사잇각)
+# -----------------------------
+ANGLE_JOINTS = {
+    "left_elbow": (L_SHOULDER, L_ELBOW, L_WRIST),
+    "right_elbow": (R_SHOULDER, R_ELBOW, R_WRIST),
+    "left_shoulder": (L_HIP, L_SHOULDER, L_ELBOW),
+    "right_shoulder": (R_HIP, R_SHOULDER, R_ELBOW),
+    "left_hip": (L_SHOULDER, L_HIP, L_KNEE),
+    "right_hip": (R_SHOULDER, R_HIP, R_KNEE),
+    "left_knee": (L_HIP, L_KNEE, L_ANKLE),
+    "right_knee": (R_HIP, R_KNEE, R_ANKLE),
+}
+ANGLE_NAMES = list(ANGLE_JOINTS)
+_IDX_A, _IDX_B, _IDX_C = (np.array(idx) for idx in zip(*ANGLE_JOINTS.values()))
+
+# 피드백 문구용 한글 이름
+ANGLE_LABELS = {
+    "left_elbow": "왼쪽 팔꿈치",
+    "right_elbow": "오른쪽 팔꿈치",
+    "left_shoulder": "왼쪽 어깨",
+    "right_shoulder": "오른쪽 어깨",
+    "left_hip": "왼쪽 엉덩이",
+    "right_hip": "오른쪽 엉덩이",
+    "left_knee": "왼쪽 무릎",
+    "right_knee": "오른쪽 무릎",
+}
+
+# -----------------------------
+# 운동별 기준 각도 범위 (도, 동작 전체에서 유지되어야 하는 범위)
+# db/init.sql 에 등록된 17개 운동, 키는 관절 종류 (좌우 동일 적용)
+# -----------------------------
+REFERENCE_RANGES = {
+    "스탠딩 사이드 크런치": {"hip": (70, 180), "knee": (60, 180)},
+    "스탠딩 니업": {"hip": (60, 180), "knee": (50, 180)},
+    "버피 테스트": {"hip": (40, 180), "knee": (40, 180), "elbow": (70, 180)},
+    "스텝 포워드 다이나믹 런지": {"hip": (70, 180), "knee": (80, 180)},
+    "스텝 백워드 다이나믹 런지": {"hip": (70, 180), "knee": (80, 180)},
+    "사이드 런지": {"hip": (60, 180), "knee": (70, 180)},
+    "크로스 런지": {"hip": (70, 180), "knee": (80, 180)},
+    "굿모닝": {"hip": (80, 180), "knee": (150, 180)},
+    "라잉 레그 레이즈": {"hip": (80, 180), "knee": (150, 180)},
+    "크런치": {"hip": (60, 130), "knee": (60, 110)},
+    "바이시클 크런치": {"hip": (40, 180), "knee": (40, 180)},
+    "시저크로스": {"hip": (60, 180), "knee": (150, 180)},
+    "힙쓰러스트": {"hip": (90, 180), "knee": (70, 110)},
+    "플랭크": {"hip": (160, 180), "knee": (160, 180), "shoulder": (70, 110), "elbow": (70, 110)},
+    "푸시업": {"hip": (160, 180), "knee": (160, 180), "elbow": (60, 180)},
+    "니푸쉬업": {"hip": (150, 180), "knee": (60, 120), "elbow": (60, 180)},
+    "와이 엑서사이즈": {"shoulder": (140, 180), "elbow": (150, 180)},
+}
+
+# 이 각도 이상 벗어나면 해당 관절 점수 0
+TOLERANCE_DEG = 30.0
+
+# 신뢰도가 이 값보다 낮은 키포인트는 계산에서 제외 (NaN)
+MIN_CONFIDENCE = 0.5
+
+
+def _reference_bounds(exercise_name: str):
+    """운동 이름 → (lo, hi) 배열 (J,), 기준이 없는 관절은 NaN"""
+    ranges = REFERENCE_RANGES.get(exercise_name, {})
+    lo = np.full(len(ANGLE_NAMES), np.nan)
+    hi = np.full(len(ANGLE_NAMES), np.nan)
+    for j, name in enumerate(ANGLE_NAMES):
+        joint = name.split("_", 1)[1]
+        if joint in ranges:
+            lo[j], hi[j] = ranges[joint]
+    return lo, hi
+
+
+# -----------------------------
+# 관절 각도 (전체 프레임 한 번에)
+# -----------------------------
+def joint_angles(keypoints, confidence=None):
+    """
+    keypoints: (F, K, 2|3) 좌표 배열
+    confidence: (F, K) 키포인트 신뢰도 (없으면 전부 사용)
+    반환: (F, J) 각도 배열 (도), 계산할 수 없는 값은 NaN
+    """
+    kp = np.asarray(keypoints, dtype=np.float64)
+    if kp.ndim != 3 or kp.shape[1] < NUM_KEYPOINTS or kp.shape[2] not in (2, 3):
+        raise ValueError("keypoints 는 (frames, 17, 2|3) 배열이어야 합니다.")
+
+    a, b, c = kp[:, _IDX_A], kp[:, _IDX_B], kp[:, _IDX_C]
+    v1 = a - b
+    v2 = c - b
+
+    norms = np.linalg.norm(v1, axis=-1) * np.linalg.norm(v2, axis=-1)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        cos = np.einsum("fjd,fjd->fj", v1, v2) / norms
+    angles = np.degrees(np.arccos(np.clip(cos, -1.0, 1.0)))
+    angles[norms == 0] = np.nan
+
+    if confidence is not None:
+        conf = np.asarray(confidence, dtype=np.float64)
+        if conf.ndim != 2 or conf.shape[0] != kp.shape[0] or conf.shape[1] < NUM_KEYPOINTS:
+            raise ValueError("confidence 는 (frames, 17) 배열이어야 합니다.")
+        low = (
+            (conf[:, _IDX_A] < MIN_CONFIDENCE)
+            | (conf[:, _IDX_B] < MIN_CONFIDENCE)
+            | (conf[:, _IDX_C] < MIN_CONFIDENCE)
+        )
+        angles[low] = np.nan
+
+    return angles
+
+
+# -----------------------------
+# 점수 계산
+# -----------------------------
+def score_angles(exercise_name: str, angles):
+    """
+    angles: (F, J) 관절 각도
+    반환: {
+        "angle_names", "angles", "deviation" (F, J, 범위 미만이면 음수 / 초과면 양수 / 범위 안이면 0),
+        "frame_scores" (F,), "score", "issues" (프레임별 리스트), "summary" (관절별 이탈 비율)
+    }
+    - 기준 범위가 없는 운동 / 관절은 점수에 반영하지 않음 (score None)
+    """
+    angles = np.asarray(angles, dtype=np.float64)
+    lo, hi = _reference_bounds(exercise_name)
+
+    with np.errstate(invalid="ignore"):
+        below = np.where(angles < lo, angles - lo, 0.0)
+        above = np.where(angles > hi, angles - hi, 0.0)
+    deviation = below + above
+    deviation[np.isnan(angles) | np.isnan(lo)] = np.nan
+
+    # 관절별 점수 (0 ~ 1) → 프레임 평균 → 전체 평균
+    joint_scores = 1.0 - np.minimum(np.abs(deviation) / TOLERANCE_DEG, 1.0)
+    valid = np.isfinite(joint_scores)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        frame_scores = np.round(
+            np.where(valid, joint_scores, 0.0).sum(axis=1) / valid.sum(axis=1) * 100.0, 2
+        )
+    scored = np.isfinite(frame_scores)
+    score = float(np.round(frame_scores[scored].mean(), 2)) if scored.any() else None
+
+    # 이슈는 범위를 벗어난 (프레임, 관절) 만 순회
+    issues = [[] for _ in range(angles.shape[0])]
+    frame_idx, joint_idx = np.nonzero(np.nan_to_num(deviation) != 0)
+    for f, j in zip(frame_idx.tolist(), joint_idx.tolist()):
+        name = ANGLE_NAMES[j]
+        issues[f].append({
+            "joint": name,
+            "angle": round(float(angles[f, j]), 1),
+            "range": [float(lo[j]), float(hi[j])],
+            "direction": "too_small" if deviation[f, j] < 0 else "too_large",
+        })
+
+    measured = np.isfinite(deviation)
+    out_of_range = np.nan_to_num(deviation) != 0
+    with np.errstate(invalid="ignore", divide="ignore"):
+        ratios = out_of_range.sum(axis=0) / measured.sum(axis=0)
+    summary = {
+        name: round(float(ratios[j]), 3)
+        for j, name in enumerate(ANGLE_NAMES)
+        if measured[:, j].any()
+    }
+
+    return {
+        "angle_names": ANGLE_NAMES,
+        "angles": angles,
+        "deviation": deviation,
+        "frame_scores": frame_scores,
+        "score": score,
+        "issues": issues,
+        "summary": summary,
+    }
+
+
+def score_keypoints(exercise_name: str, keypoints, confidence=None):
+    """키포인트 → 관절 각도 → 점수 (score_angles 참고)"""
+    return score_angles(exercise_name, joint_angles(keypoints, confidence))
+
+
+# -----------------------------
+# 피드백 / 저장용 변환
+# -----------------------------
+def issue_feedback(issues: list):
+    """프레임 이슈 리스트 → 한 줄 피드백"""
+    if not issues:
+        return "좋은 자세입니다."
+    parts = [
+        f"{ANGLE_LABELS[i['joint']]} 각도가 너무 {'작습니다' if i['direction'] == 'too_small' else '큽니다'}"
+        for i in issues
+    ]
+    return ", ".join(parts) + "."
+
+
+def frames_for_storage(result: dict, frame_names: list, step: int = 1):
+    """
+    score_angles 결과 → pose_analysis 저장용 프레임 dict 리스트
+    - step: 몇 프레임마다 저장할지 (30fps 전체를 저장하지 않도록)
+    """
+    frames = []
+    angles = np.round(result["angles"], 1)
+    for f in range(0, angles.shape[0], step):
+        frame_score = result["frame_scores"][f]
+        frames.append({
+            "frame_file_name": frame_names[f],
+            "angles": {
+                name: float(angles[f, j])
+                for j, name in enumerate(ANGLE_NAMES)
+                if not np.isnan(angles[f, j])
+            },
+            "issues": result["issues"][f],
+            "score": None if np.isnan(frame_score) else float(frame_score),
+            "feedback": issue_feedback(result["issues"][f]),
+        })
+    return frames
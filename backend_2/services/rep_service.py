@@ -0,0 +1,234 @@
+# ============================================
+# 🔢 반복 횟수(rep) 카운트 / 세트 구분
+# ============================================
+# 관절 각도 시계열(pose_service.joint_angles 결과)에서
+# - 운동별 기준 관절 각도를 하나의 신호로 만들고
+# - 히스테리시스(low / high 두 임계값)로 바닥(valley) → 꼭대기(peak) 전환을 찾아 1회로 센다
+#   (임계값 사이에서 흔들리는 노이즈는 상태를 바꾸지 않음)
+# - rep 사이 간격이 REST_GAP_SECONDS 보다 길면 새 세트로 구분
+#
+# 오프라인(영상 전체): count_reps(...)
+# 실시간(슬라이딩 윈도우): RepCounter.update(...) 에 새 프레임 묶음을 계속 넣는다
+
+import numpy as np
+
+from services.pose_service import ANGLE_NAMES
+
+# -----------------------------
+# 운동별 rep 신호 정의
+# -----------------------------
+# angles : 신호로 쓸 관절 각도
+# combine: "mean" (양쪽 평균) / "min" (좌우 번갈아 하는 운동 → 더 많이 굽힌 쪽)
+# low    : 이 각도 아래로 내려가면 '바닥' 상태
+# high   : 이 각도 위로 올라가면 '꼭대기' 상태 → 바닥에서 넘어오면 1회
+REP_SIGNALS = {
+    "스쿼트": {"angles": ["left_knee", "right_knee"], "combine": "mean", "low": 100, "high": 160},
+    "푸시업": {"angles": ["left_elbow", "right_elbow"], "combine": "mean", "low": 100, "high": 150},
+    "니푸쉬업": {"angles": ["left_elbow", "right_elbow"], "combine": "mean", "low": 100, "high": 150},
+    "크런치": {"angles": ["left_hip", "right_hip"], "combine": "mean", "low": 90, "high": 105},
+    "바이시클 크런치": {"angles": ["left_hip", "right_hip"], "combine": "min", "low": 80, "high": 120},
+    "스탠딩 니업": {"angles": ["left_hip", "right_hip"], "combine": "min", "low": 110, "high": 150},
+    "스탠딩 사이드 크런치": {"angles": ["left_hip", "right_hip"], "combine": "min", "low": 120, "high": 155},
+    "스텝 포워드 다이나믹 런지": {"angles": ["left_knee", "right_knee"], "combine": "min", "low": 100, "high": 150},
+    "스텝 백워드 다이나믹 런지": {"angles": ["left_knee", "right_knee"], "combine": "min", "low": 100, "high": 150},
+    "사이드 런지": {"angles": ["left_knee", "right_knee"], "combine": "min", "low": 110, "high": 155},
+    "크로스 런지": {"angles": ["left_knee", "right_knee"], "combine": "min", "low": 100, "high": 150},
+    "버피 테스트": {"angles": ["left_hip", "right_hip"], "combine": "mean", "low": 90, "high": 160},
+    "굿모닝": {"angles": ["left_hip", "right_hip"], "combine": "mean", "low": 120, "high": 160},
+    "라잉 레그 레이즈": {"angles": ["left_hip", "right_hip"], "combine": "mean", "low": 120, "high": 160},
+    "시저크로스": {"angles": ["left_hip", "right_hip"], "combine": "min", "low": 130, "high": 165},
+    "힙쓰러스트": {"angles": ["left_hip", "right_hip"], "combine": "mean", "low": 120, "high": 160},
+    "와이 엑서사이즈": {"angles": ["left_shoulder", "right_shoulder"], "combine": "mean", "low": 60, "high": 140},
+}
+# 플랭크는 버티는 운동이므로 rep 을 세지 않는다.
+
+# rep 사이가 이 시간보다 길면 휴식 → 새 세트
+REST_GAP_SECONDS = 10.0
+
+# rep 간격을 알 수 없을 때(세트당 1회 등) 가정하는 1회 시간
+DEFAULT_REP_SECONDS = 3.0
+
+_ANGLE_INDEX = {name: j for j, name in enumerate(ANGLE_NAMES)}
+
+
+# -----------------------------
+# 신호 / 전환 검출
+# -----------------------------
+def rep_signal(exercise_name: str, angles):
+    """
+    (F, J) 관절 각도 → (F,) rep 신호
+    - 기준이 없는 운동이면 None
+    """
+    spec = REP_SIGNALS.get(exercise_name)
+    if spec is None:
+        return None
+    return _combine(spec, np.asarray(angles, dtype=np.float64))
+
+
+def _combine(spec: dict, angles):
+    cols = angles[:, [_ANGLE_INDEX[a] for a in spec["angles"]]]
+    if spec["combine"] == "min":
+        return np.fmin.reduce(cols, axis=1)
+
+    valid = np.isfinite(cols)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        return np.where(valid, cols, 0.0).sum(axis=1) / valid.sum(axis=1)
+
+
+def rep_transitions(signal, low, high, state=0):
+    """
+    히스테리시스 기반 바닥 → 꼭대기 전환 위치
+    - state: 이전 구간 마지막 상태 (-1 바닥, 1 꼭대기, 0 모름)
+    반환: (rep 완료 프레임 인덱스 배열, 마지막 상태)
+    """
+    signal = np.asarray(signal, dtype=np.float64)
+
+    # 0 번 칸에 이전 상태를 두고, 임계값을 넘은 프레임만 상태 이벤트로 표시
+    events = np.zeros(signal.shape[0] + 1, dtype=np.int8)
+    events[0] = state
+    with np.errstate(invalid="ignore"):
+        events[1:][signal < low] = -1
+        events[1:][signal > high] = 1
+
+    idx = np.flatnonzero(events)
+    if idx.size == 0:
+        return np.empty(0, dtype=np.int64), state
+
+    seq = events[idx]
+    done = np.flatnonzero((seq[:-1] == -1) & (seq[1:] == 1)) + 1
+    return idx[done] - 1, int(seq[-1])
+
+
+# -----------------------------
+# 세트 구분
+# -----------------------------
+def segment_sets(rep_frames, fps: float, frame_scores=None, first_set: int = 1):
+    """
+    rep 완료 프레임 → 세트 목록
+    - rep 간격이 REST_GAP_SECONDS * fps 프레임보다 길면 새 세트
+    - frame_scores (F,) 가 있으면 세트 구간 평균 점수
+    반환: [{"set_number", "reps_done", "start_frame", "end_frame", "score"}]
+    """
+    rep_frames = np.asarray(rep_frames, dtype=np.int64)
+    if rep_frames.size == 0:
+        return []
+
+    gaps = np.diff(rep_frames)
+    rest = gaps > REST_GAP_SECONDS * fps
+    breaks = np.flatnonzero(rest) + 1
+    starts = np.concatenate(([0], breaks))
+    ends = np.concatenate((breaks, [rep_frames.size]))
+
+    # 세트 첫 rep 의 시작 위치는 평소 rep 간격만큼 앞으로 잡는다 (휴식 구간 제외)
+    rep_gaps = gaps[~rest]
+    typical = int(np.median(rep_gaps)) if rep_gaps.size else int(DEFAULT_REP_SECONDS * fps)
+
+    sets = []
+    for n, (s, e) in enumerate(zip(starts.tolist(), ends.tolist())):
+        start_frame = max(int(rep_frames[s]) - typical, int(rep_frames[s - 1]) + 1 if s > 0 else 0)
+        end_frame = int(rep_frames[e - 1])
+        score = None
+        if frame_scores is not None:
+            window = np.asarray(frame_scores, dtype=np.float64)[start_frame:end_frame + 1]
+            window = window[np.isfinite(window)]
+            if window.size:
+                score = round(float(window.mean()), 2)
+        sets.append({
+            "set_number": first_set + n,
+            "reps_done": e - s,
+            "start_frame": start_frame,
+            "end_frame": end_frame,
+            "score": score,
+        })
+    return sets
+
+
+# -----------------------------
+# 오프라인 (영상 전체)
+# -----------------------------
+def count_reps(exercise_name: str, angles, fps: float = 30.0, frame_scores=None):
+    """
+    영상 전체 관절 각도로 rep / 세트 계산
+    반환: {"reps", "rep_frames", "sets"} (기준이 없는 운동이면 reps 0)
+    """
+    signal = rep_signal(exercise_name, angles)
+    if signal is None:
+        return {"reps": 0, "rep_frames": [], "sets": []}
+
+    spec = REP_SIGNALS[exercise_name]
+    rep_frames, _ = rep_transitions(signal, spec["low"], spec["high"])
+    return {
+        "reps": int(rep_frames.size),
+        "rep_frames": rep_frames.tolist(),
+        "sets": segment_sets(rep_frames, fps, frame_scores),
+    }
+
+
+# -----------------------------
+# 실시간 (슬라이딩 윈도우)
+# -----------------------------
+class RepCounter:
+    """
+    프레임 묶음이 들어올 때마다 이어서 rep 을 센다
+    - 직전 묶음의 마지막 히스테리시스 상태만 들고 있으므로 윈도우 크기와 무관하게 O(1) 상태
+    - update() 반환: {"new_reps", "reps", "set_number", "set_reps", "sets_finished"}
+      sets_finished: 휴식 간격이 지나 이번 묶음에서 끝난 세트 [{"set_number", "reps_done"}]
+    """
+
+    def __init__(self, exercise_name: str, fps: float = 30.0):
+        self.spec = REP_SIGNALS.get(exercise_name)
+        self.rest_frames = REST_GAP_SECONDS * fps
+        self.state = 0
+        self.frames_seen = 0
+        self.reps = 0
+        self.set_number = 1
+        self.set_reps = 0
+        self.last_rep_frame = None
+
+    def update(self, angles):
+        """angles: 새로 들어온 (n, J) 관절 각도"""
+        angles = np.asarray(angles, dtype=np.float64)
+        offset = self.frames_seen
+        self.frames_seen += angles.shape[0]
+
+        new_frames = []
+        if self.spec is not None and angles.shape[0]:
+            local, self.state = rep_transitions(
+                _combine(self.spec, angles), self.spec["low"], self.spec["high"], self.state
+            )
+            new_frames = (local + offset).tolist()
+
+        finished = []
+        for frame in new_frames:
+            if self.set_reps and frame - self.last_rep_frame > self.rest_frames:
+                finished.append(self._close_set())
+            self.last_rep_frame = frame
+            self.set_reps += 1
+            self.reps += 1
+
+        # 마지막 rep 이후 휴식 시간이 지나면 세트 종료
+        if self.set_reps and self.frames_seen - self.last_rep_frame > self.rest_frames:
+            finished.append(self._close_set())
+
+        return {
+            "new_reps": len(new_frames),
+            "reps": self.reps,
+            "set_number": self.set_number,
+            "set_reps": self.set_reps,
+            "sets_finished": finished,
+        }
+
+    def finish(self):
+        """세션 종료 시 진행 중인 세트 마감 (rep 이 없으면 None)"""
+        return self._close_set() if self.set_reps else None
+
+    @property
+    def sets_completed(self):
+        """마감된 세트 수 (set_number 는 다음에 시작할 세트 번호)"""
+        return self.set_number - 1
+
+    def _close_set(self):
+        done = {"set_number": self.set_number, "reps_done": self.set_reps}
+        self.set_number += 1
+        self.set_reps = 0
+        return done
@@ -0,0 +1,468 @@
+# ============================================
+# 📦 업로드 파일 저장소 (로컬 디스크)
+# ============================================
+# await file.read() 로 영상 전체를 메모리에 올리지 않고,
+# VIDEO_CHUNK_SIZE 단위로 읽어 디스크에 쓰면서 SHA-256 을 함께 계산한다.
+# - 업로드 1건당 메모리 사용량은 청크 1개로 제한
+# - 디스크 쓰기 / 해시 계산은 스레드풀에서 실행 (이벤트 루프 블로킹 방지)
+# - VIDEO_MAX_BYTES 초과 시 413 + 임시 파일 삭제
+#
+# 저장 중인 파일은 <id>.part 로 쓰고, 완료되면 <id> 로 이름을 바꾼다.
+#
+# 이어 올리기(resumable) 업로드
+# - 세션 생성 → 청크 PUT (offset 지정) → offset 조회 → finalize
+# - 세션 상태는 디스크에 보관: uploads/<upload_id>/meta.json + data
+#   (확인된 offset = data 파일 크기, 서버가 재시작되어도 이어서 받을 수 있음)
+# - 세션은 만든 사용자(meta.json 의 owner_id)만 사용할 수 있고,
+#   UPLOAD_SESSION_TTL_HOURS 동안 진행이 없는 세션은 주기적으로 삭제한다.
+
+import asyncio
+import hashlib
+import json
+import os
+import re
+import shutil
+import time
+import uuid
+from datetime import datetime
+from pathlib import Path
+
+from fastapi import HTTPException, UploadFile
+from fastapi.concurrency import run_in_threadpool
+
+from config.settings import settings
+from services.log_service import get_logger
+
+logger = get_logger("storage")
+
+VIDEO_DIR = Path(settings.VIDEO_STORAGE_DIR)
+UPLOAD_SESSION_DIR = VIDEO_DIR / "uploads"
+
+# 저장 객체 id 형식 (uuid4 hex)
+_OBJECT_ID = re.compile(r"^[0-9a-f]{32}$")
+
+# multipart 경계 / 폼 필드 등 파일 외 본문 여유분
+MULTIPART_OVERHEAD_BYTES = 1024 * 1024
+
+
+# -----------------------------
+# 경로 / id
+# -----------------------------
+def new_object_id():
+    return uuid.uuid4().hex
+
+
+def object_path(object_id: str) -> Path:
+    """
+    저장 객체 id → 파일 경로
+    - id 형식이 아니면 ValueError (경로 조작 방지)
+    """
+    if not _OBJECT_ID.match(object_id or ""):
+        raise ValueError("invalid object id")
+    return VIDEO_DIR / object_id
+
+
+# -----------------------------
+# 디스크 작업 (스레드풀에서 실행)
+# -----------------------------
+def _open_part(path: Path):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    return open(path, "wb")
+
+
+def _write_chunk(f, hasher, chunk: bytes):
+    f.write(chunk)
+    hasher.update(chunk)
+
+
+def _commit(f, part: Path, final: Path):
+    f.close()
+    os.replace(part, final)
+
+
+def _discard(f, part: Path):
+    f.close()
+    part.unlink(missing_ok=True)
+
+
+def _too_large():
+    return HTTPException(
+        status_code=413,
+        detail=f"파일 크기는 최대 {settings.VIDEO_MAX_BYTES // (1024 * 1024)}MB 까지 업로드할 수 있습니다."
+    )
+
+
+# -----------------------------
+# 업로드 저장
+# -----------------------------
+async def save_upload(upload: UploadFile):
+    """
+    UploadFile 을 청크 단위로 디스크에 저장
+    반환: {"id", "filename", "size", "sha256"}
+    - VIDEO_MAX_BYTES 초과 시 HTTPException(413)
+    """
+    object_id = new_object_id()
+    final = object_path(object_id)
+    part = final.with_suffix(".part")
+
+    hasher = hashlib.sha256()
+    size = 0
+
+    f = await run_in_threadpool(_open_part, part)
+    try:
+        while True:
+            chunk = await upload.read(settings.VIDEO_CHUNK_SIZE)
+            if not chunk:
+                break
+
+            size += len(chunk)
+            if size > settings.VIDEO_MAX_BYTES:
+                raise _too_large()
+
+            await run_in_threadpool(_write_chunk, f, hasher, chunk)
+
+        await run_in_threadpool(_commit, f, part, final)
+    except BaseException:
+        await run_in_threadpool(_discard, f, part)
+        raise
+
+    return {
+        "id": object_id,
+        "filename": upload.filename,
+        "size": size,
+        "sha256": hasher.hexdigest(),
+    }
+
+
+# ============================================
+# 🚧 업로드 요청 본문 크기 제한 (ASGI 미들웨어)
+# ============================================
+class UploadSizeLimitMiddleware:
+    """
+    업로드 경로의 요청 본문을 받는 단계에서 크기 제한
+    - Starlette 는 multipart 본문 전체를 임시 파일로 받은 뒤에 핸들러를 호출하므로
+      save_upload 의 VIDEO_MAX_BYTES 검사만으로는 받는 양 자체를 막지 못한다.
+    - Content-Length 가 한도를 넘으면 본문을 읽기 전에 바로 413
+    - Content-Length 가 없으면 (chunked) 받은 바이트를 세다가 한도를 넘는 순간 413
+    """
+
+    def __init__(self, app, path_prefixes=("/web/video/upload",)):
+        self.app = app
+        self.path_prefixes = tuple(path_prefixes)
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or not scope["path"].startswith(self.path_prefixes):
+            await self.app(scope, receive, send)
+            return
+
+        limit = settings.VIDEO_MAX_BYTES + MULTIPART_OVERHEAD_BYTES
+        headers = dict(scope["headers"])
+        try:
+            content_length = int(headers.get(b"content-length", b"-1"))
+        except ValueError:
+            content_length = -1
+        if content_length > limit:
+            await self._send_too_large(send)
+            return
+
+        received = 0
+        exceeded = False
+        started = False
+
+        async def receive_limited():
+            nonlocal received, exceeded
+            message = await receive()
+            if message["type"] == "http.request":
+                received += len(message.get("body", b""))
+                if received > limit:
+                    exceeded = True
+                    raise _too_large()
+            return message
+
+        async def send_checked(message):
+            nonlocal started
+            # 한도 초과 후 앱이 만든 응답(400 등)은 413 으로 바꿔서 한 번만 보냄
+            if exceeded:
+                if message["type"] == "http.response.start" and not started:
+                    started = True
+                    await self._send_too_large(send)
+                return
+            if message["type"] == "http.response.start":
+                started = True
+            await send(message)
+
+        try:
+            await self.app(scope, receive_limited, send_checked)
+        except Exception:
+            # 초과 예외가 앱 밖까지 올라온 경우 (라우터가 다른 예외로 감쌌을 수도 있음)
+            if not exceeded:
+                raise
+            if not started:
+                await self._send_too_large(send)
+
+    @staticmethod
+    async def _send_too_large(send):
+        error = _too_large()
+        await send({
+            "type": "http.response.start",
+            "status": error.status_code,
+            "headers": [(b"content-type", b"application/json"), (b"connection", b"close")],
+        })
+        await send({
+            "type": "http.response.body",
+            "body": json.dumps({"detail": error.detail}, ensure_ascii=False).encode("utf-8"),
+        })
+
+
+# ============================================
+# 🔁 이어 올리기 업로드 세션
+# ============================================
+# 같은 세션에 청크가 동시에 들어오면 offset 검사와 쓰기가 꼬이므로 세션별 Lock
+_session_locks = {}
+_sweeper = None
+
+
+def _session_dir(upload_id: str) -> Path:
+    if not _OBJECT_ID.match(upload_id or ""):
+        raise HTTPException(status_code=404, detail="업로드 세션을 찾을 수 없습니다.")
+    return UPLOAD_SESSION_DIR / upload_id
+
+
+def _session_lock(upload_id: str):
+    _session_dir(upload_id)   # id 형식 검사 (잘못된 id 로 Lock 이 쌓이지 않도록)
+    return _session_locks.setdefault(upload_id, asyncio.Lock())
+
+
+def _create_session(path: Path, meta: dict):
+    path.mkdir(parents=True, exist_ok=True)
+    (path / "data").touch()
+    (path / "meta.json").write_text(json.dumps(meta, ensure_ascii=False))
+
+
+def _read_session(path: Path):
+    """세션 meta + 현재 offset (없으면 None)"""
+    try:
+        meta = json.loads((path / "meta.json").read_text())
+        meta["offset"] = (path / "data").stat().st_size
+    except FileNotFoundError:
+        return None
+    return meta
+
+
+def _append(path: Path, chunks: list):
+    with open(path / "data", "ab") as f:
+        for chunk in chunks:
+            f.write(chunk)
+        f.flush()
+        os.fsync(f.fileno())   # 응답으로 offset 을 알려주기 전에 디스크에 반영
+
+
+def _finalize(path: Path, final: Path):
+    """data 파일 SHA-256 계산 후 저장 객체로 이동, 세션 디렉토리 삭제"""
+    hasher = hashlib.sha256()
+    with open(path / "data", "rb") as f:
+        for chunk in iter(lambda: f.read(settings.VIDEO_CHUNK_SIZE), b""):
+            hasher.update(chunk)
+    final.parent.mkdir(parents=True, exist_ok=True)
+    os.replace(path / "data", final)
+    shutil.rmtree(path, ignore_errors=True)
+    return hasher.hexdigest()
+
+
+async def _load_session(upload_id: str, owner_id: str):
+    """세션 meta 조회 (없거나 다른 사용자의 세션이면 404 → 세션 존재 여부도 노출하지 않음)"""
+    path = _session_dir(upload_id)
+    meta = await run_in_threadpool(_read_session, path)
+    if meta is None:
+        _session_locks.pop(upload_id, None)
+        raise HTTPException(status_code=404, detail="업로드 세션을 찾을 수 없습니다.")
+    if meta.get("owner_id") != str(owner_id):
+        raise HTTPException(status_code=404, detail="업로드 세션을 찾을 수 없습니다.")
+    return path, meta
+
+
+async def create_upload_session(filename: str, size: int, owner_id: str):
+    """
+    이어 올리기 세션 생성
+    - owner_id: 세션을 만든 사용자 (이후 요청은 같은 사용자만 가능)
+    반환: {"upload_id", "offset", "size", "chunk_size"}
+    """
+    if size <= 0:
+        raise HTTPException(status_code=400, detail="파일 크기가 올바르지 않습니다.")
+    if size > settings.VIDEO_MAX_BYTES:
+        raise _too_large()
+
+    upload_id = new_object_id()
+    meta = {
+        "filename": filename,
+        "size": size,
+        "owner_id": str(owner_id),
+        "created_at": datetime.now().isoformat(),
+    }
+    await run_in_threadpool(_create_session, UPLOAD_SESSION_DIR / upload_id, meta)
+
+    return {
+        "upload_id": upload_id,
+        "offset": 0,
+        "size": size,
+        "chunk_size": settings.VIDEO_CHUNK_SIZE,
+    }
+
+
+async def get_upload_offset(upload_id: str, owner_id: str):
+    """
+    지금까지 확인된 바이트 수 조회 (재연결 후 이 위치부터 이어서 전송)
+    반환: {"upload_id", "offset", "size"}
+    """
+    _, meta = await _load_session(upload_id, owner_id)
+    return {"upload_id": upload_id, "offset": meta["offset"], "size": meta["size"]}
+
+
+async def write_upload_chunk(upload_id: str, owner_id: str, offset: int, stream):
+    """
+    offset 위치에 청크 이어 쓰기
+    - stream: request.stream() 처럼 bytes 를 내보내는 async iterator
+    - offset 이 현재 위치와 다르면 409 (응답의 offset 부터 다시 보내면 됨)
+    - 세션 크기를 넘으면 413
+    반환: {"upload_id", "offset", "size"}
+    """
+    async with _session_lock(upload_id):
+        path, meta = await _load_session(upload_id, owner_id)
+
+        if offset != meta["offset"]:
+            raise HTTPException(
+                status_code=409,
+                detail={"message": "offset 이 일치하지 않습니다.", "offset": meta["offset"]}
+            )
+
+        # VIDEO_CHUNK_SIZE 만큼 모아서 디스크에 쓰기
+        pending, pending_size = [], 0
+        written = meta["offset"]
+        async for data in stream:
+            if not data:
+                continue
+            if written + pending_size + len(data) > meta["size"]:
+                # 이미 받은 부분은 반영해 두고 초과분만 거절
+                await run_in_threadpool(_append, path, pending)
+                raise _too_large()
+
+            pending.append(data)
+            pending_size += len(data)
+            if pending_size >= settings.VIDEO_CHUNK_SIZE:
+                await run_in_threadpool(_append, path, pending)
+                written += pending_size
+                pending, pending_size = [], 0
+
+        if pending:
+            await run_in_threadpool(_append, path, pending)
+            written += pending_size
+
+    return {"upload_id": upload_id, "offset": written, "size": meta["size"]}
+
+
+async def finalize_upload(upload_id: str, owner_id: str):
+    """
+    모든 바이트를 받은 세션을 저장 객체로 확정
+    반환: save_upload 와 같은 {"id", "filename", "size", "sha256"}
+    """
+    async with _session_lock(upload_id):
+        path, meta = await _load_session(upload_id, owner_id)
+
+        if meta["offset"] != meta["size"]:
+            raise HTTPException(
+                status_code=409,
+                detail={"message": "아직 모든 데이터를 받지 못했습니다.", "offset": meta["offset"]}
+            )
+
+        object_id = new_object_id()
+        digest = await run_in_threadpool(_finalize, path, object_path(object_id))
+
+    _session_locks.pop(upload_id, None)
+
+    return {
+        "id": object_id,
+        "filename": meta["filename"],
+        "size": meta["size"],
+        "sha256": digest,
+    }
+
+
+async def abort_upload(upload_id: str, owner_id: str):
+    """세션과 받은 데이터 삭제"""
+    async with _session_lock(upload_id):
+        path, _ = await _load_session(upload_id, owner_id)
+        await run_in_threadpool(shutil.rmtree, path, True)
+    _session_locks.pop(upload_id, None)
+
+
+# -----------------------------
+# 오래된 세션 정리
+# -----------------------------
+def _stale_sessions(cutoff: float):
+    """마지막 변경 시각(meta / data mtime)이 cutoff 이전인 세션 id 목록"""
+    if not UPLOAD_SESSION_DIR.is_dir():
+        return []
+
+    stale = []
+    for path in UPLOAD_SESSION_DIR.iterdir():
+        try:
+            touched = max(
+                p.stat().st_mtime for p in (path, path / "meta.json", path / "data") if p.exists()
+            )
+        except (FileNotFoundError, ValueError):
+            touched = 0
+        if touched < cutoff:
+            stale.append(path.name)
+    return stale
+
+
+async def sweep_upload_sessions():
+    """
+    UPLOAD_SESSION_TTL_HOURS 동안 진행이 없는 이어 올리기 세션 삭제
+    - 청크를 받고 있는 세션(Lock 보유 중)은 건너뜀
+    반환: 삭제한 세션 수
+    """
+    cutoff = time.time() - settings.UPLOAD_SESSION_TTL_HOURS * 3600
+    removed = 0
+
+    for upload_id in await run_in_threadpool(_stale_sessions, cutoff):
+        if not _OBJECT_ID.match(upload_id):
+            continue
+        lock = _session_lock(upload_id)
+        if lock.locked():
+            continue
+        async with lock:
+            await run_in_threadpool(shutil.rmtree, UPLOAD_SESSION_DIR / upload_id, True)
+        _session_locks.pop(upload_id, None)
+        removed += 1
+
+    if removed:
+        logger.info("upload_sessions_swept", extra={"fields": {"removed": removed}})
+    return removed
+
+
+async def _sweep_periodically():
+    while True:
+        try:
+            await sweep_upload_sessions()
+        except Exception:
+            logger.exception("upload_sweep_failed")
+        await asyncio.sleep(settings.UPLOAD_SWEEP_INTERVAL)
+
+
+async def start_upload_sweeper():
+    """서버 시작 시 호출 (시작 직후 1회 + UPLOAD_SWEEP_INTERVAL 초마다 정리)"""
+    global _sweeper
+    if _sweeper is None and settings.UPLOAD_SWEEP_INTERVAL > 0:
+        _sweeper = asyncio.create_task(_sweep_periodically())
+
+
+async def stop_upload_sweeper():
+    global _sweeper
+    if _sweeper is not None:
+        _sweeper.cancel()
+        try:
+            await _sweeper
+        except asyncio.CancelledError:
+            pass
+        _sweeper = None
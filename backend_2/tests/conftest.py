@@ -0,0 +1,11 @@
+# ============================================
+# 🧪 pytest 공통 설정
+# ============================================
+# 앱과 같은 방식(backend_2 를 기준으로 `from services... import`)으로 import 하도록
+# backend_2 디렉터리를 sys.path 맨 앞에 둔다.
+# 실행: backend_2 에서 python -m pytest -q tests
+
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -0,0 +1,79 @@
+# ============================================
+# 🧪 anomaly_service.group_median / detect_anomalies
+# ============================================
+
+from datetime import datetime, timedelta
+
+import numpy as np
+import pytest
+
+# anomaly_service 는 스케줄러 / DB 모듈을 함께 import 한다
+pytest.importorskip("fastapi")
+pytest.importorskip("sqlalchemy")
+
+from services.anomaly_service import detect_anomalies, group_median
+
+NAN = np.nan
+SINCE = datetime(2026, 1, 20)
+
+
+@pytest.mark.parametrize("groups, values, n_groups, median, counts", [
+    ([0, 0, 0], [3.0, 1.0, 2.0], 1, [2.0], [3]),
+    ([0, 0, 0, 0], [4.0, 1.0, 3.0, 2.0], 1, [2.5], [4]),          # 짝수 개 → 가운데 두 값 평균
+    ([1, 0, 1, 0, 0], [20.0, 3.0, 10.0, 1.0, 2.0], 2, [2.0, 15.0], [3, 2]),
+    ([0, 2], [5.0, 7.0], 3, [5.0, NAN, 7.0], [1, 0, 1]),          # 빈 그룹은 NaN
+])
+def test_group_median(groups, values, n_groups, median, counts):
+    got_median, got_counts = group_median(np.asarray(groups), np.asarray(values), n_groups)
+    np.testing.assert_array_equal(got_median, median)
+    assert got_counts.tolist() == counts
+
+
+def _series(metric, baseline, recent, user="u1"):
+    """기준선(평가 구간 이전) + 최근 값 → detect_anomalies 인자"""
+    times = [SINCE - timedelta(hours=len(baseline) - i) for i in range(len(baseline))]
+    times += [SINCE + timedelta(hours=i) for i in range(len(recent))]
+    values = {metric: np.asarray(list(baseline) + list(recent), dtype=np.float64)}
+    return [user] * len(times), times, values
+
+
+@pytest.mark.parametrize("metric, baseline, recent, flagged", [
+    # 값이 일정한 기준선 (MAD 0) → MIN_SCALE 로 척도 하한
+    ("heartRate", [70.0] * 19, [150.0], [(150.0, "robust_z")]),
+    ("heartRate", [70.0] * 19, [75.0], []),
+    # 최근 값이 여러 개여도 기준선에 섞이지 않음
+    ("heartRate", [70.0] * 10, [150.0] * 10, [(150.0, "robust_z")] * 10),
+    # 기준선 샘플 부족 → z 검사 생략, 허용 범위만 검사
+    ("heartRate", [70.0] * 9, [150.0], []),
+    ("heartRate", [], [190.0], [(190.0, "out_of_range")]),
+    # 0 / NaN 은 미측정 → 기준선에서도 평가에서도 제외
+    ("heartRate", [70.0] * 19 + [0.0] * 5, [0.0, NAN], []),
+    # oxygen 이 0~1 로 들어오면 % 로 환산
+    ("oxygen", [0.98] * 19, [0.90], [(90.0, "out_of_range")]),
+])
+def test_detect_anomalies(metric, baseline, recent, flagged):
+    user_ids, times, values = _series(metric, baseline, recent)
+    flags = detect_anomalies(user_ids, times, values, SINCE)
+    assert [(f["value"], f["reason"]) for f in flags] == flagged
+    assert all(f["recorded_at"] >= SINCE for f in flags)
+
+
+def test_detect_anomalies_flat_baseline_scores():
+    user_ids, times, values = _series("heartRate", [70.0] * 19, [150.0])
+    (flag,) = detect_anomalies(user_ids, times, values, SINCE)
+
+    assert flag["baseline_median"] == 70.0
+    assert flag["baseline_mad"] == 0.0
+    assert flag["z_score"] == pytest.approx((150.0 - 70.0) / 3.0)
+
+
+def test_detect_anomalies_baseline_is_per_user():
+    a = _series("heartRate", [70.0] * 19, [150.0], user="a")
+    b = _series("heartRate", [150.0] * 19, [150.0], user="b")
+    flags = detect_anomalies(
+        a[0] + b[0], a[1] + b[1],
+        {"heartRate": np.concatenate((a[2]["heartRate"], b[2]["heartRate"]))},
+        SINCE,
+    )
+    assert [f["user_id"] for f in flags] == ["a"]
+    assert detect_anomalies([], [], {"heartRate": np.empty(0)}, SINCE) == []
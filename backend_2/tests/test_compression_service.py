@@ -0,0 +1,77 @@
+# ============================================
+# 🧪 compression_service.choose_encoding / _GzipRequestBody
+# ============================================
+
+import gzip
+import os
+
+import pytest
+
+pytest.importorskip("fastapi")
+pytest.importorskip("pydantic")
+
+from fastapi import HTTPException
+
+from config.settings import settings
+from services import compression_service
+from services.compression_service import RATIO_CHECK_MIN_BYTES, _GzipRequestBody, choose_encoding
+
+MB = 1024 * 1024
+
+
+@pytest.mark.parametrize("accept_encoding, with_brotli, expected", [
+    ("gzip, deflate, br", True, "br"),
+    ("gzip, deflate, br", False, "gzip"),
+    ("br", False, None),
+    ("br;q=0, gzip", True, "gzip"),
+    ("gzip;q=0, br", False, None),
+    ("gzip; q=0.5", False, "gzip"),              # 파라미터 공백 허용
+    ("gzip;q=abc", False, None),                 # 잘못된 q 값은 제외
+    ("GZIP", False, "gzip"),
+    ("identity", True, None),
+    ("", True, None),
+    (None, True, None),
+])
+def test_choose_encoding(monkeypatch, accept_encoding, with_brotli, expected):
+    monkeypatch.setattr(compression_service, "brotli", object() if with_brotli else None)
+    assert choose_encoding(accept_encoding) == expected
+
+
+def _feed_in_chunks(payload: bytes, chunk: int = 16 * 1024):
+    body = _GzipRequestBody()
+    out = []
+    for start in range(0, len(payload), chunk):
+        piece = payload[start:start + chunk]
+        out.append(body.feed(piece, start + chunk < len(payload)))
+    return b"".join(out)
+
+
+@pytest.mark.parametrize("raw, max_bytes, max_ratio, status", [
+    (b'{"steps": 1}' * 100, 32 * MB, 100, None),
+    (b"\0" * (RATIO_CHECK_MIN_BYTES // 2), 32 * MB, 100, None),   # 작은 본문은 압축률 검사 안 함
+    (b"\0" * (2 * MB), 32 * MB, 100, 413),                        # 압축률 상한 초과 (gzip 폭탄)
+    (b"\0" * (2 * MB), 32 * MB, 10 ** 6, None),
+    (os.urandom(2 * MB), MB, 100, 413),                           # 해제 크기 상한 초과
+    (os.urandom(MB), MB, 100, None),                              # 상한과 같은 크기는 허용
+])
+def test_gzip_request_body_limits(monkeypatch, raw, max_bytes, max_ratio, status):
+    monkeypatch.setattr(settings, "DECOMPRESS_MAX_BYTES", max_bytes)
+    monkeypatch.setattr(settings, "DECOMPRESS_MAX_RATIO", max_ratio)
+    payload = gzip.compress(raw)
+
+    if status is None:
+        assert _feed_in_chunks(payload) == raw
+    else:
+        with pytest.raises(HTTPException) as exc:
+            _feed_in_chunks(payload)
+        assert exc.value.status_code == status
+
+
+@pytest.mark.parametrize("payload", [
+    gzip.compress(b"hello world" * 100)[:-8],     # 트레일러가 잘린 본문
+    b"not gzip at all",
+])
+def test_gzip_request_body_rejects_broken_stream(payload):
+    with pytest.raises(HTTPException) as exc:
+        _GzipRequestBody().feed(payload, False)
+    assert exc.value.status_code == 400
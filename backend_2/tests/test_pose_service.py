@@ -0,0 +1,51 @@
+# ============================================
+# 🧪 pose_service.score_angles
+# ============================================
+
+import numpy as np
+import pytest
+
+from services.pose_service import ANGLE_NAMES, score_angles
+
+
+def _frame(**joints):
+    """관절 종류(hip, knee ...) → 좌우 같은 각도, 지정하지 않은 관절은 NaN"""
+    row = np.full(len(ANGLE_NAMES), np.nan)
+    for j, name in enumerate(ANGLE_NAMES):
+        joint = name.split("_", 1)[1]
+        if joint in joints:
+            row[j] = joints[joint]
+    return row
+
+
+# 크런치 기준: hip (60, 130), knee (60, 110), TOLERANCE_DEG 30
+@pytest.mark.parametrize("exercise, joints, expected", [
+    ("크런치", {"hip": 90, "knee": 90}, 100.0),                    # 범위 안
+    ("크런치", {"hip": 60, "knee": 110}, 100.0),                   # 경계값은 범위 안
+    ("크런치", {"hip": 145, "knee": 90}, 75.0),                    # hip 15도 초과 → 0.5
+    ("크런치", {"hip": 45, "knee": 90}, 75.0),                     # hip 15도 미만 → 0.5
+    ("크런치", {"hip": 170, "knee": 30}, 0.0),                     # 둘 다 30도 이상 이탈 → 0
+    ("크런치", {"hip": np.nan, "knee": 90}, 100.0),                # 측정 안 된 관절은 제외
+    ("크런치", {"elbow": 10, "shoulder": 10}, None),               # 기준 없는 관절만 있음
+    ("없는 운동", {"hip": 90, "knee": 90}, None),                   # 기준 없는 운동
+])
+def test_score_angles_single_frame(exercise, joints, expected):
+    result = score_angles(exercise, _frame(**joints)[None, :])
+    assert result["score"] == expected
+
+
+def test_score_angles_averages_frames_and_reports_issues():
+    angles = np.stack([
+        _frame(hip=90, knee=90),      # 100
+        _frame(hip=145, knee=90),     # 75
+    ])
+    result = score_angles("크런치", angles)
+
+    assert result["frame_scores"].tolist() == [100.0, 75.0]
+    assert result["score"] == 87.5
+    assert result["issues"][0] == []
+    assert {issue["joint"] for issue in result["issues"][1]} == {"left_hip", "right_hip"}
+    assert all(issue["direction"] == "too_large" for issue in result["issues"][1])
+    assert result["summary"]["left_hip"] == 0.5
+    assert result["summary"]["left_knee"] == 0.0
+    assert "left_elbow" not in result["summary"]
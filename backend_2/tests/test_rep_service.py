@@ -0,0 +1,74 @@
+# ============================================
+# 🧪 rep_service.rep_transitions / count_reps
+# ============================================
+
+import numpy as np
+import pytest
+
+from services.pose_service import ANGLE_NAMES
+from services.rep_service import RepCounter, count_reps, rep_transitions
+
+NAN = np.nan
+
+
+# low 100 / high 160 (스쿼트 기준), 두 임계값 모두 strict 비교
+@pytest.mark.parametrize("signal, state, frames, last_state", [
+    ([170, 90, 170], 0, [2], 1),
+    ([90, 170, 90, 170], 0, [1, 3], 1),
+    ([90, 120, 110, 130, 170], 0, [4], 1),           # 임계값 사이 흔들림은 무시
+    ([170, 100, 170, 100, 170], 0, [], 1),           # 100 은 low 미만이 아님
+    ([90, 160, 90, 160], 0, [], -1),                 # 160 은 high 초과가 아님
+    ([90, NAN, 170], 0, [2], 1),                     # NaN 은 상태를 바꾸지 않음
+    ([170], -1, [0], 1),                             # 이전 구간이 바닥에서 끝남
+    ([120, 130], -1, [], -1),                        # 이벤트 없음 → 이전 상태 유지
+    ([], 1, [], 1),
+])
+def test_rep_transitions(signal, state, frames, last_state):
+    done, end_state = rep_transitions(signal, 100, 160, state)
+    assert done.tolist() == frames
+    assert end_state == last_state
+
+
+def _knees(values):
+    """무릎 각도 시계열 → (F, J) 관절 각도 (나머지 관절 NaN)"""
+    angles = np.full((len(values), len(ANGLE_NAMES)), NAN)
+    for name in ("left_knee", "right_knee"):
+        angles[:, ANGLE_NAMES.index(name)] = values
+    return angles
+
+
+@pytest.mark.parametrize("exercise, knees, reps", [
+    ("스쿼트", [170, 90, 170, 90, 170], 2),
+    ("스쿼트", [170, 100, 170, 100, 170], 0),          # 100 ~ 170 은 바닥에 닿지 않음
+    ("스쿼트", [170, 99, 170, 99, 170], 2),
+    ("스쿼트", [], 0),
+    ("플랭크", [170, 90, 170], 0),                      # rep 기준 없는 운동
+])
+def test_count_reps(exercise, knees, reps):
+    result = count_reps(exercise, _knees(knees))
+    assert result["reps"] == reps
+    assert len(result["rep_frames"]) == reps
+
+
+def test_count_reps_splits_sets_on_rest_gap():
+    # fps 1 → REST_GAP_SECONDS(10) 프레임보다 긴 간격이면 새 세트
+    knees = [90, 170] * 3 + [170] * 15 + [90, 170] * 2
+    result = count_reps("스쿼트", _knees(knees), fps=1.0)
+
+    assert result["reps"] == 5
+    assert [s["reps_done"] for s in result["sets"]] == [3, 2]
+    assert [s["set_number"] for s in result["sets"]] == [1, 2]
+
+
+def test_rep_counter_matches_offline_count():
+    knees = [90, 170] * 3 + [170] * 15 + [90, 170] * 2
+    counter = RepCounter("스쿼트", fps=1.0)
+    finished = []
+    for start in range(0, len(knees), 4):
+        finished += counter.update(_knees(knees[start:start + 4]))["sets_finished"]
+    last = counter.finish()
+
+    assert counter.reps == count_reps("스쿼트", _knees(knees), fps=1.0)["reps"]
+    assert finished == [{"set_number": 1, "reps_done": 3}]
+    assert last == {"set_number": 2, "reps_done": 2}
+    assert counter.sets_completed == 2
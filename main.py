@@ -13,6 +13,9 @@ from web.routes.subscription import router as subscription_router
 # iOS 전용 라우터
 from ios.health import router as health_router
 
+# 업로드 본문 크기 제한 (받는 단계에서 413)
+from web.services.storage import UploadSizeLimitMiddleware
+
 
 # ========================
 # 🔥 FastAPI 기본 정보
@@ -42,6 +45,9 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# 영상 업로드는 본문을 다 받기 전에 크기 제한 (web/services/storage.py)
+app.add_middleware(UploadSizeLimitMiddleware, path_prefixes=("/web/video/upload",))
+
 
 # ========================
 # 🔥 라우터 등록
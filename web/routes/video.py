@@ -1,16 +1,18 @@
 from fastapi import APIRouter, UploadFile, File
 
+from web.services.storage import save_upload
+
 router = APIRouter(
     tags=["Video"]
 )
 
 @router.post("/upload")
 async def upload_video(file: UploadFile = File(...)):
-    # 1) 업로드 받은 파일 읽기
-    video_bytes = await file.read()
+    # 1) 업로드 받은 파일을 청크 단위로 디스크에 저장
+    stored = await save_upload(file)
 
     # 2) (임시) AI 서버 없으므로 분석 없이 업로드 성공만 응답
     return {
-        "filename": file.filename,
+        **stored,
         "status": "업로드 성공! AI 분석은 아직 연결되지 않았습니다."
     }
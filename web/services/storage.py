@@ -0,0 +1,147 @@
+import hashlib
+import json
+import os
+import uuid
+
+from fastapi import HTTPException, UploadFile
+from fastapi.concurrency import run_in_threadpool
+
+UPLOAD_DIR = "storage/videos"        # 업로드 영상 저장 위치
+MAX_UPLOAD_BYTES = 1024 * 1024 * 1024  # 최대 1GB
+CHUNK_SIZE = 1024 * 1024               # 1MB 씩 읽고 쓰기
+MULTIPART_OVERHEAD_BYTES = 1024 * 1024 # multipart 경계 / 폼 필드 등 파일 외 본문 여유분
+
+
+def _too_large():
+    return HTTPException(status_code=413, detail="파일이 너무 큽니다. (최대 1GB)")
+
+
+def _open_part(path):
+    os.makedirs(UPLOAD_DIR, exist_ok=True)
+    return open(path, "wb")
+
+
+def _write_chunk(f, hasher, chunk):
+    f.write(chunk)
+    hasher.update(chunk)
+
+
+def _commit(f, part, final):
+    f.close()
+    os.replace(part, final)
+
+
+def _discard(f, part):
+    f.close()
+    if os.path.exists(part):
+        os.remove(part)
+
+
+# 🔥 업로드 파일을 청크 단위로 디스크에 저장 (file.read() 로 전체를 메모리에 올리지 않음)
+async def save_upload(upload: UploadFile):
+    object_id = uuid.uuid4().hex
+    final = os.path.join(UPLOAD_DIR, object_id)
+    part = final + ".part"
+
+    hasher = hashlib.sha256()
+    size = 0
+
+    f = await run_in_threadpool(_open_part, part)
+    try:
+        while True:
+            chunk = await upload.read(CHUNK_SIZE)
+            if not chunk:
+                break
+
+            size += len(chunk)
+            if size > MAX_UPLOAD_BYTES:
+                raise _too_large()
+
+            # 디스크 쓰기 + 해시 계산은 스레드풀에서
+            await run_in_threadpool(_write_chunk, f, hasher, chunk)
+
+        await run_in_threadpool(_commit, f, part, final)
+    except BaseException:
+        await run_in_threadpool(_discard, f, part)
+        raise
+
+    return {
+        "id": object_id,
+        "filename": upload.filename,
+        "size": size,
+        "sha256": hasher.hexdigest(),
+    }
+
+
+# 🔥 업로드 요청 본문을 받는 단계에서 크기 제한 (main.py 에서 미들웨어로 등록)
+# Starlette 는 multipart 본문 전체를 임시 파일로 받은 뒤에 핸들러를 호출하므로
+# save_upload 의 MAX_UPLOAD_BYTES 검사만으로는 받는 양 자체를 막지 못한다.
+# - Content-Length 가 한도를 넘으면 본문을 읽기 전에 바로 413
+# - Content-Length 가 없으면 (chunked) 받은 바이트를 세다가 한도를 넘는 순간 413
+class UploadSizeLimitMiddleware:
+    def __init__(self, app, path_prefixes=("/web/video/upload",)):
+        self.app = app
+        self.path_prefixes = tuple(path_prefixes)
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or not scope["path"].startswith(self.path_prefixes):
+            await self.app(scope, receive, send)
+            return
+
+        limit = MAX_UPLOAD_BYTES + MULTIPART_OVERHEAD_BYTES
+        headers = dict(scope["headers"])
+        try:
+            content_length = int(headers.get(b"content-length", b"-1"))
+        except ValueError:
+            content_length = -1
+        if content_length > limit:
+            await self._send_too_large(send)
+            return
+
+        received = 0
+        exceeded = False
+        started = False
+
+        async def receive_limited():
+            nonlocal received, exceeded
+            message = await receive()
+            if message["type"] == "http.request":
+                received += len(message.get("body", b""))
+                if received > limit:
+                    exceeded = True
+                    raise _too_large()
+            return message
+
+        async def send_checked(message):
+            nonlocal started
+            # 한도 초과 후 앱이 만든 응답(400 등)은 413 으로 바꿔서 한 번만 보냄
+            if exceeded:
+                if message["type"] == "http.response.start" and not started:
+                    started = True
+                    await self._send_too_large(send)
+                return
+            if message["type"] == "http.response.start":
+                started = True
+            await send(message)
+
+        try:
+            await self.app(scope, receive_limited, send_checked)
+        except Exception:
+            # 초과 예외가 앱 밖까지 올라온 경우 (라우터가 다른 예외로 감쌌을 수도 있음)
+            if not exceeded:
+                raise
+            if not started:
+                await self._send_too_large(send)
+
+    @staticmethod
+    async def _send_too_large(send):
+        error = _too_large()
+        await send({
+            "type": "http.response.start",
+            "status": error.status_code,
+            "headers": [(b"content-type", b"application/json"), (b"connection", b"close")],
+        })
+        await send({
+            "type": "http.response.body",
+            "body": json.dumps({"detail": error.detail}, ensure_ascii=False).encode("utf-8"),
+        })